@@ -3,7 +3,6 @@ import sys
 import os
 import json
 import argparse
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Any, Optional, Tuple, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -13,6 +12,10 @@ from urllib.parse import urlparse
 
 import datetime
 
+# Lector de sitemaps compartido con el auditor SEO (Tools/seo)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "seo"))
+from sitemap_reader import SitemapReader  # noqa: E402
+
 PAGESPEED_ENDPOINT = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
 DEFAULT_TIMEOUT = 60
 
@@ -174,68 +177,26 @@ class PageSpeedAuditor:
             ]
         )
 
-        root = None
-        for url in candidates:
-            try:
-                resp = self.session.get(url, timeout=self.timeout)
-                if resp.status_code != 200:
-                    continue
-                try:
-                    root = ET.fromstring(resp.content)
-                    break
-                except ET.ParseError:
-                    continue
-            except requests.RequestException:
-                continue
-
-        if root is None:
-            # No sitemap → solo la URL base
-            return [self.base_url]
-
-        namespaces = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-        urls: List[str] = []
-
-        # sitemap index
-        sitemap_tags = root.findall(".//ns:sitemap", namespaces) or root.findall(".//sitemap")
-        if sitemap_tags:
-            for sm in sitemap_tags:
-                loc = sm.find("ns:loc", namespaces) or sm.find("loc")
-                if loc is None or not loc.text:
-                    continue
-                sub_url = loc.text.strip()
-                try:
-                    resp = self.session.get(sub_url, timeout=self.timeout)
-                    if resp.status_code != 200:
-                        continue
-                    sub_root = ET.fromstring(resp.content)
-                    url_tags = sub_root.findall(".//ns:url/ns:loc", namespaces) or sub_root.findall(
-                        ".//url/loc"
-                    )
-                    for u in url_tags:
-                        if u.text:
-                            urls.append(u.text.strip())
-                except (requests.RequestException, ET.ParseError):
-                    continue
-        else:
-            # sitemap simple
-            url_tags = root.findall(".//ns:url/ns:loc", namespaces) or root.findall(".//url/loc")
-            for u in url_tags:
-                if u.text:
-                    urls.append(u.text.strip())
-
-        # Filtra dominio y deduplica
+        # Streaming read (gzip included); index children are fetched in parallel.
+        # Stops as soon as max_pages URLs are collected. No sitemap → only the base URL.
+        reader = SitemapReader(self.session, self.timeout, workers=self.workers)
         clean_urls: List[str] = []
         seen: Set[str] = set()
-        for u in urls:
-            parsed = urlparse(u)
-            if parsed.netloc and self.domain and parsed.netloc != self.domain:
-                continue
-            if u not in seen:
-                seen.add(u)
-                clean_urls.append(u)
+        entries = reader.iter_entries(candidates)
+        try:
+            for entry in entries:
+                # Filtra dominio y deduplica
+                parsed = urlparse(entry.loc)
+                if parsed.netloc and self.domain and parsed.netloc != self.domain:
+                    continue
+                if entry.loc not in seen:
+                    seen.add(entry.loc)
+                    clean_urls.append(entry.loc)
+                    if self.max_pages and len(clean_urls) >= self.max_pages:
+                        break
+        finally:
+            entries.close()
 
-        if self.max_pages:
-            clean_urls = clean_urls[: self.max_pages]
         return clean_urls or [self.base_url]
 
     # ---------------------------
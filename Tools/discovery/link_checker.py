@@ -6,6 +6,12 @@ from collections import deque
 import concurrent.futures
 import time
 import sys
+import os
+
+# Shared per-host rate limiter and crawler trap heuristics from the SEO tools
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "seo"))
+from http_pacing import HostLimiter  # noqa: E402
+from crawl_traps import TrapDetector, canonicalize_url  # noqa: E402
 
 # Configuration
 START_URL = "https://pablocirre.es"
@@ -18,6 +24,11 @@ visited_pages = set()
 broken_links = []
 checked_urls = {} # URL -> Status Code
 
+# Adaptive concurrency per host: backs off on 429/503 and honours Retry-After
+limiter = HostLimiter(max_concurrency=MAX_THREADS)
+# Calendars, faceted filters and path loops: skipped URLs are summarised at the end
+traps = TrapDetector()
+
 class LinkParser(HTMLParser):
     def __init__(self, base_url):
         super().__init__()
@@ -30,7 +41,8 @@ class LinkParser(HTMLParser):
         
         # Hyperlinks
         if tag == 'a' and 'href' in attrs:
-            url = urllib.parse.urljoin(self.base_url, attrs['href'])
+            # Canonical form: no fragment, sorted params, no tracking/session params
+            url = canonicalize_url(urllib.parse.urljoin(self.base_url, attrs['href']))
             self.links.add(url)
             
         # Images, Scripts, Styles
@@ -43,6 +55,13 @@ class LinkParser(HTMLParser):
             url = urllib.parse.urljoin(self.base_url, attrs[src_attr])
             self.assets.add(url) # Add to assets checklist
 
+def open_url(req):
+    """urlopen that returns HTTP errors as the response, so the limiter sees 429/503."""
+    try:
+        return urllib.request.urlopen(req, timeout=TIMEOUT)
+    except urllib.error.HTTPError as e:
+        return e
+
 def check_url(url):
     """Checks a single URL and returns status code."""
     if url in checked_urls:
@@ -58,22 +77,17 @@ def check_url(url):
         # Try HEAD first
         try:
             req.method = 'HEAD'
-            with urllib.request.urlopen(req, timeout=TIMEOUT) as response:
+            with limiter.request(lambda: open_url(req), url) as response:
                 status = response.getcode()
+            if status != 405: # Method Not Allowed, try GET
                 checked_urls[url] = status
                 return status
-        except urllib.error.HTTPError as e:
-            if e.code == 405: # Method Not Allowed, try GET
-                pass
-            else:
-                checked_urls[url] = e.code
-                return e.code
         except Exception:
             pass # Fallthrough to GET
 
         # Fallback to GET
         req.method = 'GET'
-        with urllib.request.urlopen(req, timeout=TIMEOUT) as response:
+        with limiter.request(lambda: open_url(req), url) as response:
             status = response.getcode()
             checked_urls[url] = status
             return status
@@ -110,7 +124,10 @@ def main():
                 current_url, 
                 headers={'User-Agent': 'Mozilla/5.0'}
             )
-            with urllib.request.urlopen(req, timeout=TIMEOUT) as response:
+            response = limiter.request(lambda: open_url(req), current_url)
+            if isinstance(response, urllib.error.HTTPError):
+                raise response
+            with response:
                 html = response.read().decode('utf-8', errors='ignore')
                 
                 # Parse
@@ -119,14 +136,12 @@ def main():
                 
                 # Identify new internal pages to crawl
                 for link in parser.links:
-                    # Remove fragment
-                    link = urllib.parse.urldefrag(link)[0]
-                    
                     if is_internal(link) and link not in visited_pages:
                         # Only crawl typical web pages
                         if link.endswith(('.php', '.html', '/')) or '.' not in link.split('/')[-1]:
                            visited_pages.add(link)
-                           queue.append(link)
+                           if traps.allow(link):
+                               queue.append(link)
                 
                 # Collect ALL items to verify on this page (links + assets)
                 items_to_verify = parser.links.union(parser.assets)
@@ -163,6 +178,12 @@ def main():
             print(f"  Link: {item['url']} (Status: {item['status']})")
     else:
         print("\nNo broken links found!")
+    
+    suppressed = traps.suppressed()
+    if suppressed:
+        print(f"\nSkipped {traps.suppressed_urls} URLs that look like crawler traps:")
+        for item in suppressed:
+            print(f"  {item['pattern']} ({item['reason']}, {item['count']} URLs)")
 
 if __name__ == "__main__":
     main()
@@ -2,22 +2,94 @@
 import sys
 import json
 import argparse
+import base64
 import re
-import xml.etree.ElementTree as ET
 from collections import Counter, deque
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Set
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, contextmanager, nullcontext
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Any, Optional, Set, Mapping, Tuple, Iterator, Callable, Iterable, FrozenSet
 from urllib.parse import urljoin, urlparse, urlunparse
+import codecs
 import datetime
+import glob
+import hashlib
+import heapq
 import os
+import threading
+import time
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+import html_backend
+import link_graph
+from checkpoint import CrawlCheckpoint, DEFAULT_INTERVAL as DEFAULT_CHECKPOINT_INTERVAL
+from crawl_frontier import CrawlFrontier, path_depth, priority_score, FRONTIER_BFS, FRONTIER_ORDERS, FRONTIER_PRIORITY
+from crawl_traps import TrapDetector, DEFAULT_MAX_URL_LENGTH, DEFAULT_PATTERN_BUDGET
+from http_cache import HTTPCache, DEFAULT_MAX_BYTES as DEFAULT_CACHE_MAX_BYTES
+from http_pacing import HostLimiter
+from link_graph import LinkGraph
+from local_site import LocalSite, LocalSiteAdapter
+from link_store import LinkStatusStore, DEFAULT_INTERNAL_TTL, DEFAULT_EXTERNAL_TTL
+from near_duplicates import SimHasher, near_duplicate_clusters, DEFAULT_MAX_DISTANCE as DEFAULT_NEAR_DUP_DISTANCE
+from page_templates import SkeletonHasher, TemplateClusters
+from robots_txt import RobotsTxt
+from sampling import StratifiedSampler, estimate_prevalence, stratum_of, DEFAULT_CONFIDENCE as DEFAULT_SAMPLE_CONFIDENCE, Z_SCORES
+from sitemap_reader import SitemapEntry, SitemapReader
+from url_seen import URLSeenSet, ENQUEUED, VISITED
 
 DEFAULT_TIMEOUT = 10
 DEFAULT_MAX_PAGES = 10
+DEFAULT_WORKERS = 4
+# cuerpo máximo que se descarga de una página HTML; más allá se corta la descarga
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+# cuerpos descartados hasta este tamaño se leen igualmente para reutilizar la conexión
+DRAIN_MAX_BYTES = 64 * 1024
+# extensiones que casi nunca son HTML: se pregunta con HEAD antes de descargarlas
+BINARY_EXTENSIONS = frozenset({
+    ".pdf", ".zip", ".gz", ".tgz", ".rar", ".7z", ".exe", ".dmg", ".iso", ".apk",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".svg", ".ico", ".bmp", ".tif", ".tiff",
+    ".mp4", ".webm", ".mov", ".avi", ".mkv", ".mp3", ".wav", ".ogg", ".m4a",
+    ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".woff", ".woff2", ".ttf", ".otf",
+})
 USER_AGENT = "Pablo-Cirre-SEO-Audit/1.0 (+https://pablocirre.es)"
 
+# .../Tools/seo/audit.py -> .../Tools/seo -> .../Tools -> .../Root
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REPORTS_DIR = os.path.join(ROOT_DIR, "Reports")
+DEFAULT_CACHE_DIR = os.path.join(REPORTS_DIR, ".cache", "http")
+DEFAULT_LINK_CACHE = os.path.join(REPORTS_DIR, ".cache", "link_status.sqlite")
+CHECKPOINTS_DIR = os.path.join(REPORTS_DIR, ".cache", "checkpoints")
+# sin --checkpoint-interval solo se guardan checkpoints a partir de tantas páginas (o con --time-budget)
+CHECKPOINT_MIN_PAGES = 1000
+# URL base por defecto con --offline (solo sirve para nombrar las páginas)
+OFFLINE_BASE_URL = "http://localhost"
+
+# cambiar al modificar las comprobaciones: invalida los hashes del modo incremental
+AUDIT_STATE_VERSION = "3"
+# incidencias que dependen de otras páginas: en modo incremental se recalculan siempre
+CROSS_PAGE_ISSUE_CODES = frozenset({
+    "TITLE_DUPLICATED", "META_DESC_DUPLICATED", "POSSIBLE_ORPHAN_PAGE", "BROKEN_INTERNAL_LINK",
+    "CONTENT_NEAR_DUPLICATE", "CLICK_DEPTH_HIGH", "UNREACHABLE_FROM_HOMEPAGE",
+})
+CROSS_PAGE_METRICS = frozenset({
+    "inbound_internal_links", "internal_pagerank", "click_depth", "link_scc_size",
+})
+# clics desde la home a partir de los cuales una página se considera enterrada
+CLICK_DEPTH_LIMIT = 3
+# URLs bloqueadas por robots.txt que se listan en el informe
+ROBOTS_BLOCKED_SAMPLE = 20
+# patrones de URL suprimidos por el detector de trampas que se listan en el informe
+TRAP_PATTERNS_SAMPLE = 20
+# --format jsonl con --check-links: páginas que pueden esperar a que se comprueben sus enlaces
+LINK_CHECK_WINDOW = 200
+# con --sample no tiene sentido comparar páginas entre sí (solo se ve una muestra)
+SAMPLE_SKIPPED_CHECKS = frozenset({
+    "duplicate_titles", "duplicate_meta_descriptions", "orphan_pages", "link_graph", "near_duplicates",
+})
+
 
 @dataclass
 class SEOIssue:
@@ -35,6 +107,589 @@ class SEOPageResult:
     status: int
     metrics: Dict[str, Any]
     issues: List[SEOIssue]
+    # enlaces internos salientes (href, URL absoluta), en orden y con repeticiones
+    outlinks: List[Tuple[str, str]] = field(default_factory=list)
+    # hash del HTML normalizado (modo incremental)
+    content_hash: Optional[str] = None
+    # True si el resultado se arrastró de la ejecución anterior sin volver a auditar
+    reused: bool = False
+
+
+@dataclass
+class FetchedPage:
+    """Respuesta HTTP guardada en el almacén de la ejecución (una descarga por URL)."""
+    url: str
+    status: int
+    headers: Mapping[str, str]
+    content: Optional[bytes]    # None cuando la respuesta ya se liberó tras auditar
+    # True si el cuerpo superaba max_body_bytes y la descarga se cortó
+    truncated: bool = False
+
+
+@dataclass
+class _SiteAggregates:
+    """Lo mínimo de cada página que hace falta para las comprobaciones entre páginas."""
+    urls: List[str] = field(default_factory=list)
+    titles: Dict[str, List[str]] = field(default_factory=dict)
+    descriptions: Dict[str, List[str]] = field(default_factory=dict)
+    # SimHash del texto principal, por URL
+    fingerprints: Dict[str, int] = field(default_factory=dict)
+    # con --sample: (url, códigos de incidencia) y severidad/categoría de cada código
+    sampled_issues: List[Tuple[str, Set[str]]] = field(default_factory=list)
+    issue_kinds: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+
+
+# grupos de señales de PageFacts: solo se extraen los que piden las comprobaciones activas
+# (html[lang] se lee siempre)
+FACTS_META = "meta"                 # <meta>: charset, viewport, description, keywords, robots, OG/Twitter
+FACTS_TITLE = "title"
+FACTS_LINK_TAGS = "link_tags"       # <link>: canonical y hreflang
+FACTS_TEXT = "text"                 # recuento de palabras
+FACTS_FIRST_PARAGRAPH = "first_paragraph"
+FACTS_HEADINGS = "headings"
+FACTS_ANCHORS = "anchors"
+FACTS_IMAGES = "images"
+FACTS_JSONLD = "jsonld"             # JSON-LD y marcado de breadcrumbs
+FACTS_FORMS = "forms"
+FACTS_FINGERPRINT = "fingerprint"   # SimHash del texto principal
+FACTS_SKELETON = "skeleton"         # hash del esqueleto DOM (--templates)
+ALL_FACT_GROUPS = frozenset({
+    FACTS_META, FACTS_TITLE, FACTS_LINK_TAGS, FACTS_TEXT, FACTS_FIRST_PARAGRAPH,
+    FACTS_HEADINGS, FACTS_ANCHORS, FACTS_IMAGES, FACTS_JSONLD, FACTS_FORMS, FACTS_FINGERPRINT,
+    FACTS_SKELETON,
+})
+# si solo se piden estos, basta con recorrer hasta </head>
+HEAD_FACT_GROUPS = frozenset({FACTS_META, FACTS_TITLE, FACTS_LINK_TAGS})
+
+
+@dataclass
+class PageFacts:
+    """Señales SEO de una página, extraídas en un único recorrido del HTML."""
+    html_lang: Optional[str] = None
+    has_meta_charset: bool = False
+    has_meta_viewport: bool = False
+    title_count: int = 0
+    title: str = ""
+    meta_descriptions: List[str] = field(default_factory=list)
+    meta_keywords: Optional[str] = None        # content del primer meta keywords
+    meta_robots: Optional[str] = None          # content del primer meta robots
+    canonical_hrefs: List[Optional[str]] = field(default_factory=list)
+    hreflang_links: List[Tuple[str, str]] = field(default_factory=list)      # (código, href)
+    meta_properties: Dict[str, Optional[str]] = field(default_factory=dict)  # primera aparición de cada property
+    og_tags_count: int = 0
+    twitter_tags_count: int = 0
+    headings: List[Tuple[int, str]] = field(default_factory=list)            # (nivel, texto) en orden
+    first_paragraph: str = ""
+    word_count: int = 0
+    anchors: List[Tuple[str, str, str]] = field(default_factory=list)        # (href, texto, rel)
+    image_alts: List[Optional[str]] = field(default_factory=list)
+    jsonld_blocks: List[str] = field(default_factory=list)
+    has_breadcrumb_markup: bool = False
+    inputs_without_label: int = 0
+    text_simhash: Optional[int] = None                                       # mismo texto que word_count
+    skeleton_hash: Optional[str] = None                                      # plantilla de la página
+
+
+# ---------------------------
+# Extracción de señales (un solo recorrido)
+# ---------------------------
+# mismos elementos vacíos que el tree builder de BeautifulSoup
+_VOID_TAGS = frozenset({
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed", "frame", "hr", "image",
+    "img", "input", "isindex", "keygen", "link", "menuitem", "meta", "nextid", "param", "source",
+    "spacer", "track", "wbr",
+})
+# su texto nunca forma parte del texto visible (como get_text() en BeautifulSoup)
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+# excluidos además del recuento de palabras
+_WORD_COUNT_SKIP_TAGS = _NON_TEXT_TAGS | {"noscript", "nav", "footer"}
+_UNLABELLED_INPUT_TYPES = ("hidden", "submit", "button", "image", "reset")
+_SKIPPED_HREF_PREFIXES = ("#", "javascript:", "mailto:", "tel:")
+_WORD_RE = re.compile(r"\w+", flags=re.UNICODE)
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.I)
+_DOCTYPE_RE = re.compile(r"\s*<!doctype html", re.I)
+# <head> y doctype se miran en el HTML fuente: los parsers HTML5 (lxml, selectolax) los sintetizan
+_HEAD_RE = re.compile(r"<head[\s>]", re.I)
+_HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+# ruido que no cambia el contenido: comentarios, nonces de CSP y espacios
+_HASH_NOISE_RE = re.compile(r"<!--.*?-->|\snonce=(\"[^\"]*\"|'[^']*'|[^\s>]+)", re.S | re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _joined_text(chunks: List[str]) -> str:
+    """Equivalente a get_text(" ", strip=True) sobre los trozos de texto de un elemento."""
+    return " ".join(c for c in (chunk.strip() for chunk in chunks) if c)
+
+
+class PageFactsBuilder:
+    """
+    Construye un PageFacts a partir de eventos start/end/data (ver html_backend).
+
+    Mantiene una pila de elementos abiertos con la misma disciplina que el tree builder
+    de html.parser en BeautifulSoup: un cierre saca todo hasta su apertura más reciente
+    y los cierres sin apertura se ignoran. `groups` limita qué señales se recogen
+    (None = todas); las demás quedan con su valor por defecto.
+
+    Diferencia conocida con el recorrido de BeautifulSoup: las secciones <![CDATA[...]]>
+    no cuentan como texto (BeautifulSoup las incluía en get_text()). Es lo que hacen los
+    navegadores, lxml, selectolax y el html.parser de Python 3.13+: fuera de SVG/MathML
+    son un comentario.
+    """
+
+    def __init__(self, groups: Optional[Iterable[str]] = None) -> None:
+        wanted = ALL_FACT_GROUPS if groups is None else frozenset(groups)
+        self._want_meta = FACTS_META in wanted
+        self._want_title = FACTS_TITLE in wanted
+        self._want_link_tags = FACTS_LINK_TAGS in wanted
+        self._want_text = FACTS_TEXT in wanted
+        self._want_first_p = FACTS_FIRST_PARAGRAPH in wanted
+        self._want_headings = FACTS_HEADINGS in wanted
+        self._want_anchors = FACTS_ANCHORS in wanted
+        self._want_images = FACTS_IMAGES in wanted
+        self._want_jsonld = FACTS_JSONLD in wanted
+        self._want_forms = FACTS_FORMS in wanted
+        self._simhasher: Optional[SimHasher] = SimHasher() if FACTS_FINGERPRINT in wanted else None
+        self._skeleton: Optional[SkeletonHasher] = SkeletonHasher() if FACTS_SKELETON in wanted else None
+
+        self.facts = PageFacts()
+        self._stack: List[Tuple[str, Optional[List[str]]]] = []
+        self._open_buffers: List[List[str]] = []
+        self._non_text_depth = 0
+        self._word_skip_depth = 0
+        self._label_depth = 0
+        self._seen_html = False
+        self._title_buffer: Optional[List[str]] = None
+        self._first_p_buffer: Optional[List[str]] = None
+        self._headings: List[Tuple[int, List[str]]] = []
+        self._anchors: List[Tuple[str, str, List[str]]] = []
+        self._jsonld: List[List[str]] = []
+        self._inputs: List[Tuple[Optional[str], bool]] = []
+        self._label_for: Set[str] = set()
+
+    def start(self, tag: str, attrs: Mapping[str, str]) -> None:
+        tag = tag.lower()
+        facts = self.facts
+        get = attrs.get
+        if self._skeleton:
+            self._skeleton.add_tag(tag, attrs)
+
+        if (
+            self._want_jsonld
+            and not facts.has_breadcrumb_markup
+            and "breadcrumblist" in (get("itemtype") or "").lower()
+        ):
+            facts.has_breadcrumb_markup = True
+
+        if tag in _VOID_TAGS:
+            if tag == "meta":
+                if self._want_meta:
+                    self._meta(attrs)
+            elif tag == "link":
+                if not self._want_link_tags:
+                    return
+                rel = (get("rel") or "").lower()
+                if "canonical" in rel:
+                    facts.canonical_hrefs.append(get("href"))
+                href = get("href")
+                if href is not None and "alternate" in rel.split() and get("hreflang"):
+                    facts.hreflang_links.append(((get("hreflang") or "").strip(), href))
+            elif tag == "img":
+                if self._want_images:
+                    facts.image_alts.append(get("alt"))
+            elif tag == "input":
+                if self._want_forms:
+                    self._form_input(attrs)
+            return
+
+        buffer: Optional[List[str]] = None
+        if tag == "html":
+            if not self._seen_html:
+                self._seen_html = True
+                facts.html_lang = get("lang")
+        elif tag == "title":
+            if self._want_title:
+                facts.title_count += 1
+                if self._title_buffer is None:
+                    buffer = self._title_buffer = []
+        elif tag == "p":
+            if self._want_first_p and self._first_p_buffer is None:
+                buffer = self._first_p_buffer = []
+        elif len(tag) == 2 and tag[0] == "h" and tag[1] in "123456":
+            if self._want_headings:
+                buffer = []
+                self._headings.append((int(tag[1]), buffer))
+        elif tag == "a":
+            href = (get("href") or "").strip()
+            if self._want_anchors and href and not href.startswith(_SKIPPED_HREF_PREFIXES):
+                buffer = []
+                self._anchors.append((href, get("rel") or "", buffer))
+        elif tag == "script":
+            if self._want_jsonld and get("type") == "application/ld+json":
+                buffer = []
+                self._jsonld.append(buffer)
+        elif tag == "label":
+            self._label_depth += 1
+            if get("for"):
+                self._label_for.add(get("for"))
+        elif tag == "textarea":
+            if self._want_forms:
+                self._form_input(attrs)
+
+        if tag in _NON_TEXT_TAGS:
+            self._non_text_depth += 1
+        if tag in _WORD_COUNT_SKIP_TAGS:
+            self._word_skip_depth += 1
+        self._stack.append((tag, buffer))
+        if buffer is not None:
+            self._open_buffers.append(buffer)
+
+    def end(self, tag: str) -> None:
+        tag = tag.lower()
+        stack = self._stack
+        for idx in range(len(stack) - 1, -1, -1):
+            if stack[idx][0] == tag:
+                break
+        else:
+            return
+        while len(stack) > idx:
+            self._pop()
+
+    def data(self, text: str) -> None:
+        if self._non_text_depth:
+            # solo los bloques JSON-LD guardan el contenido de <script>
+            tag, buffer = self._stack[-1]
+            if buffer is not None and tag == "script":
+                buffer.append(text)
+            return
+        if (self._want_text or self._simhasher) and not self._word_skip_depth:
+            words = _WORD_RE.findall(text)
+            self.facts.word_count += len(words)
+            if self._simhasher:
+                self._simhasher.add_words(words)
+        for buffer in self._open_buffers:
+            buffer.append(text)
+
+    def close(self) -> PageFacts:
+        while self._stack:
+            self._pop()
+        facts = self.facts
+        if self._title_buffer is not None:
+            facts.title = "".join(self._title_buffer).strip()
+        if self._first_p_buffer is not None:
+            facts.first_paragraph = _joined_text(self._first_p_buffer)
+        facts.headings = [(level, _joined_text(chunks)) for level, chunks in self._headings]
+        facts.anchors = [(href, _joined_text(chunks), rel) for href, rel, chunks in self._anchors]
+        facts.jsonld_blocks = ["".join(chunks) for chunks in self._jsonld]
+        facts.inputs_without_label = sum(
+            1 for inp_id, labelled in self._inputs
+            if not labelled and not (inp_id and inp_id in self._label_for)
+        )
+        if self._simhasher:
+            facts.text_simhash = self._simhasher.digest()
+        if self._skeleton:
+            facts.skeleton_hash = self._skeleton.digest()
+        return facts
+
+    def _pop(self) -> None:
+        tag, buffer = self._stack.pop()
+        if buffer is not None:
+            self._open_buffers.pop()
+        if tag in _NON_TEXT_TAGS:
+            self._non_text_depth -= 1
+        if tag in _WORD_COUNT_SKIP_TAGS:
+            self._word_skip_depth -= 1
+        if tag == "label":
+            self._label_depth -= 1
+
+    def _meta(self, attrs: Mapping[str, str]) -> None:
+        facts = self.facts
+        get = attrs.get
+        name = get("name") or ""
+        name_lower = name.lower()
+
+        if get("charset") is not None or (get("http-equiv") or "").lower() == "content-type":
+            facts.has_meta_charset = True
+        if name_lower == "viewport":
+            facts.has_meta_viewport = True
+        elif name_lower == "description":
+            facts.meta_descriptions.append(get("content", ""))
+        elif name_lower == "keywords":
+            if facts.meta_keywords is None:
+                facts.meta_keywords = get("content", "") or ""
+        elif name_lower == "robots":
+            if facts.meta_robots is None:
+                facts.meta_robots = get("content")
+        if name.startswith("twitter:"):
+            facts.twitter_tags_count += 1
+
+        prop = get("property")
+        if prop:
+            if prop.startswith("og:"):
+                facts.og_tags_count += 1
+            facts.meta_properties.setdefault(prop, get("content"))
+
+    def _form_input(self, attrs: Mapping[str, str]) -> None:
+        if attrs.get("type") in _UNLABELLED_INPUT_TYPES:
+            return
+        labelled = self._label_depth > 0 or bool(attrs.get("aria-label") or attrs.get("aria-labelledby"))
+        self._inputs.append((attrs.get("id"), labelled))
+
+
+def decode_html(content: bytes, content_type: str = "") -> str:
+    """Decodifica el cuerpo HTML: BOM, charset de la cabecera, <meta charset>, UTF-8 y cp1252."""
+    if content.startswith(codecs.BOM_UTF8):
+        return content[len(codecs.BOM_UTF8):].decode("utf-8", errors="replace")
+    if content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return content.decode("utf-16", errors="replace")
+
+    candidates: List[str] = []
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset" and value.strip():
+            candidates.append(value.strip().strip("\"'"))
+    match = _META_CHARSET_RE.search(content, 0, 2048)
+    if match:
+        candidates.append(match.group(1).decode("ascii", errors="ignore"))
+    candidates.append("utf-8")
+
+    for encoding in candidates:
+        try:
+            return content.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return content.decode("cp1252", errors="replace")
+
+
+def extract_page_facts(
+    html: str, backend: str = html_backend.AUTO, groups: Optional[Iterable[str]] = None
+) -> PageFacts:
+    """Recorre el documento una sola vez y devuelve las señales de `groups` (None = todas)."""
+    if groups is not None and frozenset(groups) <= HEAD_FACT_GROUPS:
+        # solo señales del <head> (p. ej. un barrido de canonical/robots): el <body> sobra
+        match = _HEAD_END_RE.search(html)
+        if match:
+            html = html[: match.end()]
+    return html_backend.feed_events(html, PageFactsBuilder(groups), backend)
+
+
+# ---------------------------
+# Registro de comprobaciones
+# ---------------------------
+@dataclass(frozen=True)
+class AuditCheck:
+    """Comprobación con nombre; las de página tienen `run`, las de sitio se ejecutan en run()."""
+    name: str
+    category: str                           # mismos valores que SEOIssue.category
+    facts: FrozenSet[str] = frozenset()     # grupos de PageFacts que necesita
+    requires: Tuple[str, ...] = ()          # comprobaciones cuyas métricas usa
+    run: Optional[Callable[..., None]] = None
+    # depende de la plantilla, no del contenido: con --templates, una vez por plantilla
+    template: bool = False
+
+
+# por nombre y en orden de ejecución (que es el orden de las incidencias en el informe)
+CHECKS: Dict[str, AuditCheck] = {}
+
+
+def page_check(
+    name: str, category: str, facts: Iterable[str] = (), requires: Iterable[str] = (), template: bool = False
+):
+    """Registra un método de SEOAuditor como comprobación por página."""
+    def decorator(fn):
+        CHECKS[name] = AuditCheck(name, category, frozenset(facts), tuple(requires), fn, template)
+        return fn
+    return decorator
+
+
+def site_check(name: str, category: str, facts: Iterable[str] = (), requires: Iterable[str] = ()) -> None:
+    """Registra una comprobación de sitio (robots.txt o entre páginas)."""
+    CHECKS[name] = AuditCheck(name, category, frozenset(facts), tuple(requires))
+
+
+site_check("robots_txt", "indexing")
+site_check("duplicate_titles", "meta", requires=("title",))
+site_check("duplicate_meta_descriptions", "meta", requires=("meta_description",))
+site_check("orphan_pages", "links", facts=(FACTS_ANCHORS,))
+# PageRank interno, profundidad de clics y componentes (requiere NumPy/SciPy)
+site_check("link_graph", "links", facts=(FACTS_ANCHORS,))
+# solo con --check-links
+site_check("broken_links", "links", facts=(FACTS_ANCHORS,))
+
+
+def resolve_checks(include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Traduce --checks/--skip-checks (nombres de comprobación o categorías) a la lista de
+    comprobaciones a ejecutar, en orden de registro y con sus dependencias.
+    """
+
+    def expand(tokens: Iterable[str]) -> Set[str]:
+        names: Set[str] = set()
+        for token in tokens:
+            token = token.strip()
+            if not token:
+                continue
+            if token in CHECKS:
+                names.add(token)
+                continue
+            in_category = {c.name for c in CHECKS.values() if c.category == token}
+            if not in_category:
+                raise ValueError(f"Unknown check or category: {token}")
+            names |= in_category
+        return names
+
+    selected = expand(include) if include else set(CHECKS)
+    selected -= expand(exclude or ())
+    pending = list(selected)
+    while pending:
+        for dep in CHECKS[pending.pop()].requires:
+            if dep not in selected:
+                selected.add(dep)
+                pending.append(dep)
+    return [name for name in CHECKS if name in selected]
+
+
+@dataclass
+class PageContext:
+    """Lo que ve cada comprobación de página: respuesta, señales y resultados en curso."""
+    url: str
+    resp: FetchedPage
+    html: str
+    facts: PageFacts
+    metrics: Dict[str, Any]
+    issues: List[SEOIssue]
+    # (href, URL absoluta, texto, rel, interno) de cada <a> con href enlazable
+    links: List[Tuple[str, str, str, str, bool]] = field(default_factory=list)
+    # palabras clave del title; las rellena focus_keywords (vacías si no se ejecuta)
+    focus_keywords: List[str] = field(default_factory=list)
+
+    @property
+    def path(self) -> str:
+        return urlparse(self.url).path or "/"
+
+    @property
+    def slug(self) -> str:
+        path = self.path
+        return path.strip("/").split("/")[-1] if path not in ("", "/") else ""
+
+    @property
+    def meta_description(self) -> str:
+        descriptions = self.facts.meta_descriptions
+        return descriptions[0].strip() if descriptions else ""
+
+
+# ---------------------------
+# Perfilado (--profile)
+# ---------------------------
+# URLs más lentas que se guardan con su desglose por fase
+PROFILE_SLOWEST_URLS = 10
+
+
+@contextmanager
+def _lap(timings: Dict[str, float], name: str):
+    """Suma a timings[name] el tiempo de pared del bloque."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Percentil por rango más cercano sobre valores ya ordenados."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(-(-q * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class AuditProfiler:
+    """
+    Tiempos de pared por fase y por URL.
+
+    Las fases por URL (fetch, decode, parse, check:<categoría>) se miden en los
+    workers y se solapan entre sí; las de la ejecución (robots_txt, sitemap,
+    link_checks, aggregation) se miden en el hilo principal. Comparar "fetch" y
+    "link_request" con "parse" y "check:*" dice si la auditoría espera a la red o a la CPU.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._phases: Dict[str, List[float]] = {}
+        self._url_totals: List[float] = []
+        self._slowest: List[Tuple[float, str, Dict[str, float]]] = []
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._phases.setdefault(name, []).append(seconds)
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record_url(self, url: str, timings: Dict[str, float], total: float) -> None:
+        with self._lock:
+            for name, seconds in timings.items():
+                self._phases.setdefault(name, []).append(seconds)
+            self._url_totals.append(total)
+            entry = (total, url, dict(timings))
+            if len(self._slowest) < PROFILE_SLOWEST_URLS:
+                heapq.heappush(self._slowest, entry)
+            elif total > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    @staticmethod
+    def _stats(values: List[float]) -> Dict[str, Any]:
+        ordered = sorted(values)
+        return {
+            "count": len(ordered),
+            "total": round(sum(ordered), 6),
+            "p50": round(_percentile(ordered, 50), 6),
+            "p95": round(_percentile(ordered, 95), 6),
+            "max": round(ordered[-1], 6) if ordered else 0.0,
+        }
+
+    def summary(self, workers: int) -> Dict[str, Any]:
+        """Resumen serializable (segundos) para el informe."""
+        with self._lock:
+            phases = {name: self._stats(values) for name, values in self._phases.items()}
+            urls = self._stats(self._url_totals)
+            slowest = sorted(self._slowest, reverse=True)
+        urls["slowest"] = [
+            {"url": url, "seconds": round(total, 6), "phases": {k: round(v, 6) for k, v in timings.items()}}
+            for total, url, timings in slowest
+        ]
+        return {
+            "wall_seconds": round(time.perf_counter() - self._started, 6),
+            "workers": workers,
+            "phases": dict(sorted(phases.items(), key=lambda item: -item[1]["total"])),
+            "urls": urls,
+        }
+
+
+def format_profile(profile: Dict[str, Any]) -> str:
+    """Tabla de texto del resumen de AuditProfiler.summary()."""
+    lines = [
+        f"Profile: wall {profile['wall_seconds']:.2f} s | workers {profile['workers']}",
+        f"{'phase':<24} {'count':>7} {'total s':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}",
+    ]
+    rows = list(profile["phases"].items()) + [("url (audit_url)", profile["urls"])]
+    for name, st in rows:
+        lines.append(
+            f"{name:<24} {st['count']:>7} {st['total']:>9.3f} "
+            f"{1000 * st['p50']:>9.2f} {1000 * st['p95']:>9.2f} {1000 * st['max']:>9.2f}"
+        )
+    if profile["urls"]["slowest"]:
+        lines.append("Slowest URLs:")
+        for entry in profile["urls"]["slowest"]:
+            top = sorted(entry["phases"].items(), key=lambda item: -item[1])[:3]
+            detail = ", ".join(f"{name} {1000 * sec:.0f}" for name, sec in top)
+            lines.append(f"  {1000 * entry['seconds']:>9.1f} ms  {entry['url']}  ({detail})")
+    return "\n".join(lines)
 
 
 class SEOAuditor:
@@ -51,37 +706,173 @@ class SEOAuditor:
         use_sitemap: bool = False,
         sitemap_url: Optional[str] = None,
         check_links: bool = False,
+        workers: int = DEFAULT_WORKERS,
+        parser: str = html_backend.AUTO,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        previous_report: Optional[Dict[str, Any]] = None,
+        link_cache_path: Optional[str] = None,
+        link_ttl_internal: float = DEFAULT_INTERNAL_TTL,
+        link_ttl_external: float = DEFAULT_EXTERNAL_TTL,
+        checks: Optional[Iterable[str]] = None,
+        skip_checks: Optional[Iterable[str]] = None,
+        profile: bool = False,
+        near_dup_distance: int = DEFAULT_NEAR_DUP_DISTANCE,
+        respect_robots: bool = True,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        local_root: Optional[str] = None,
+        pattern_budget: int = DEFAULT_PATTERN_BUDGET,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        templates: bool = False,
+        sample_size: int = 0,
+        sample_seed: Optional[int] = None,
+        sample_confidence: float = DEFAULT_SAMPLE_CONFIDENCE,
+        frontier: str = FRONTIER_BFS,
+        time_budget: float = 0.0,
     ):
         self.base_url = self._normalize_base_url(base_url)
         self.max_pages = max_pages
         self.timeout = timeout
+        self.max_body_bytes = max_body_bytes
         self.use_sitemap = use_sitemap
         self.sitemap_url = sitemap_url
         self.check_links = check_links
+        self.workers = max(1, workers)
+        self.parser = html_backend.resolve_backend(parser)
+
+        # orden de la cola de rastreo: BFS o por importancia (priority/lastmod del sitemap,
+        # profundidad, enlaces entrantes)
+        if frontier not in FRONTIER_ORDERS:
+            raise ValueError(f"unknown frontier order: {frontier!r}")
+        self.frontier_order = frontier
+        # instante de referencia para la frescura de lastmod: el mismo para todas las URLs
+        self._score_time = time.time()
+        # segundos de rastreo (0 = sin límite): agotados, no se empiezan más páginas
+        self.time_budget = max(0.0, time_budget)
+        self.time_budget_exhausted = False
+        # URLs que quedaron sin auditar en la cola
+        self.frontier_pending = 0
+        self._started: Optional[float] = None
+        # tiempo ya gastado antes de reanudar un checkpoint
+        self._elapsed_before = 0.0
+
+        # muestreo estratificado (0 = auditar todas las URLs hasta max_pages)
+        self.sample_size = max(0, sample_size)
+        self.sample_seed = sample_seed
+        self.sample_confidence = sample_confidence
+        # tamaño de cada estrato de la población muestreada
+        self.sample_strata: Dict[str, int] = {}
+
+        # comprobaciones activas (nombres o categorías, ver resolve_checks) y señales que necesitan
+        self.checks: List[str] = resolve_checks(checks, skip_checks)
+        if self.sample_size:
+            self.checks = [name for name in self.checks if name not in SAMPLE_SKIPPED_CHECKS]
+        self.page_checks: List[AuditCheck] = [CHECKS[n] for n in self.checks if CHECKS[n].run is not None]
+        fact_groups: Set[str] = set()
+        for name in self.checks:
+            fact_groups |= CHECKS[name].facts
+        if not use_sitemap and not local_root and not self.sample_size:
+            # el rastreo BFS descubre las páginas siguiendo los enlaces
+            # (con --sample los sigue un rastreo previo que solo extrae enlaces)
+            fact_groups.add(FACTS_ANCHORS)
+        if templates:
+            fact_groups.add(FACTS_SKELETON)
+        self.fact_groups = frozenset(fact_groups)
+
+        # --templates: las comprobaciones de plantilla solo en el representante de cada una,
+        # las de contenido en todas las páginas
+        self.templates: Optional[TemplateClusters] = TemplateClusters() if templates else None
+        self.content_checks: List[AuditCheck] = [c for c in self.page_checks if not c.template]
+
+        # bits de diferencia máximos entre SimHash para considerar dos páginas casi duplicadas
+        self.near_dup_distance = near_dup_distance
+
+        # tiempos por fase y por URL (None = sin instrumentar)
+        self.profiler: Optional[AuditProfiler] = AuditProfiler() if profile else None
+        # checkpoints periódicos del rastreo (None: sin reanudación posible)
+        self.checkpoint = checkpoint
+        # modo offline: el sitio se lee de una carpeta de HTML; nada de cachés de red
+        if local_root:
+            cache_dir = link_cache_path = None
+        # caché HTTP persistente entre ejecuciones (None = desactivada)
+        self.http_cache: Optional[HTTPCache] = HTTPCache(cache_dir, cache_max_bytes) if cache_dir else None
+
+        # estado de enlaces entre ejecuciones (None = desactivado)
+        self.link_store: Optional[LinkStatusStore] = (
+            LinkStatusStore(link_cache_path, link_ttl_internal, link_ttl_external) if link_cache_path else None
+        )
+
+        # modo incremental: páginas del informe anterior, por URL auditada
+        self.incremental = previous_report is not None
+        self.previous_pages: Dict[str, Dict[str, Any]] = {
+            p["url"]: p for p in (previous_report or {}).get("pages", []) if p.get("content_hash")
+        }
 
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": USER_AGENT})
+        # una conexión por worker para que las peticiones simultáneas no esperen al pool
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=max(10, self.workers))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         parsed = urlparse(self.base_url)
         self.scheme = parsed.scheme
         self.domain = parsed.netloc
 
-        self.visited: Set[str] = set()
+        # las URLs del sitio se sirven desde ficheros locales, sin peticiones HTTP
+        self.local_site: Optional[LocalSite] = LocalSite(local_root, self.base_url) if local_root else None
+        if self.local_site:
+            self.session.mount(f"{self.scheme}://{self.domain}/", LocalSiteAdapter(self.local_site))
+
+        # URLs normalizadas ya encoladas, visitadas o descartadas (hashes de 64 bits, no cadenas)
+        self.seen = URLSeenSet()
+        # calendarios, paginación infinita, bucles de rutas: lo descartado se resume en el informe
+        self.traps = TrapDetector(pattern_budget, max_url_length)
         self.results: List[SEOPageResult] = []
+        # lastmod/priority de cada URL leída del sitemap
+        self.sitemap_entries: Dict[str, SitemapEntry] = {}
 
         # robots.txt cache
         self.robots_status: Optional[int] = None
         self.robots_content: Optional[str] = None
+        # reglas compiladas: el rastreo no descarga URLs prohibidas y respeta su Crawl-delay
+        self.respect_robots = respect_robots
+        self.robots = RobotsTxt.allow_all()
+        self.robots_blocked: Set[str] = set()
+        # concurrencia adaptativa por host (AIMD), Retry-After, reintentos y Crawl-delay
+        self.limiter = HostLimiter(max_concurrency=self.workers)
 
         # cache de estado de enlaces (para enlaces rotos)
         self.link_status_cache: Dict[str, int] = {}
+        self._link_status_lock = threading.Lock()
 
-        # inbound links (enlaces internos entrantes por URL normalizada)
+        # inbound links (enlaces internos entrantes por URL normalizada);
+        # se agrega en run() a partir de SEOPageResult.outlinks
         self.inbound_link_counts: Counter = Counter()
+        # grafo de enlaces internos (URLs normalizadas), también desde outlinks
+        self.link_graph = LinkGraph()
+
+        # almacén de respuestas de la ejecución, por URL normalizada
+        self.response_store: Dict[str, FetchedPage] = {}
 
     # ---------------------------
     # Utilidades
     # ---------------------------
+    def _phase(self, name: str):
+        """Mide una fase de la ejecución si el perfilado está activo."""
+        return self.profiler.phase(name) if self.profiler else nullcontext()
+
+    def _elapsed(self) -> float:
+        started = self._started if self._started is not None else time.monotonic()
+        return self._elapsed_before + time.monotonic() - started
+
+    def _out_of_time(self) -> bool:
+        """True cuando se agota --time-budget (se anota para el informe)."""
+        if self.time_budget and self._elapsed() >= self.time_budget:
+            self.time_budget_exhausted = True
+        return self.time_budget_exhausted
+
     @staticmethod
     def _normalize_base_url(url: str) -> str:
         url = url.strip()
@@ -112,10 +903,13 @@ class SEOAuditor:
     # ---------------------------
     # Descubrimiento de URLs
     # ---------------------------
-    def _get_urls_from_sitemap(self) -> List[str]:
+    def _sitemap_candidates(self) -> List[str]:
         candidates = []
         if self.sitemap_url:
             candidates.append(self.sitemap_url)
+        else:
+            # los Sitemap: declarados en robots.txt van antes que las rutas habituales
+            candidates.extend(self.robots.sitemaps)
         candidates.extend(
             [
                 f"{self.base_url}/sitemap.xml",
@@ -124,103 +918,341 @@ class SEOAuditor:
             ]
         )
 
-        root = None
-        for url in candidates:
-            try:
-                resp = self.session.get(url, timeout=self.timeout)
-                if resp.status_code != 200:
+        return candidates
+
+    def _iter_sitemap_entries(self) -> Iterator[Tuple[str, SitemapEntry]]:
+        """(URL normalizada, entrada) de cada URL interna del sitemap permitida por robots.txt, sin repetir."""
+        # lectura en streaming (gzip incluido) con los hijos de un índice en paralelo
+        reader = SitemapReader(self.session, self.timeout, workers=self.workers, limiter=self.limiter)
+        listed = URLSeenSet()
+        entries = reader.iter_entries(self._sitemap_candidates())
+        try:
+            for entry in entries:
+                parsed_u = urlparse(entry.loc)
+                if parsed_u.netloc and parsed_u.netloc != self.domain:
                     continue
-                try:
-                    root = ET.fromstring(resp.content)
-                    break
-                except ET.ParseError:
+                norm = self._normalize_for_visit(entry.loc)
+                if not listed.enqueue(norm) or not self._robots_allowed(norm):
                     continue
-            except requests.RequestException:
-                continue
+                yield norm, entry
+        finally:
+            entries.close()
 
-        if not root:
-            return [self.base_url]
+    def _get_urls_from_sitemap(self) -> List[str]:
+        clean_urls: List[str] = []
+        with closing(self._iter_sitemap_entries()) as entries:
+            if self.frontier_order == FRONTIER_PRIORITY:
+                # hay que ver el sitemap entero para quedarse con las max_pages más importantes
+                # (en memoria solo las max_pages mejores hasta el momento)
+                def score(item: Tuple[str, SitemapEntry]) -> float:
+                    return self._entry_score(item[1], path_depth(item[0]))
+
+                if self.max_pages:
+                    ranked = heapq.nlargest(self.max_pages, entries, key=score)
+                else:
+                    ranked = sorted(entries, key=score, reverse=True)
+                for norm, entry in ranked:
+                    self.sitemap_entries[norm] = entry
+                    clean_urls.append(norm)
+            else:
+                # se deja de leer en cuanto hay max_pages URLs
+                for norm, entry in entries:
+                    self.sitemap_entries[norm] = entry
+                    clean_urls.append(norm)
+                    if self.max_pages and len(clean_urls) >= self.max_pages:
+                        break
 
-        namespaces = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-        urls: List[str] = []
+        return clean_urls or [self.base_url]
 
-        sitemap_tags = root.findall(".//ns:sitemap", namespaces) or root.findall(".//sitemap")
-        if sitemap_tags:
-            # sitemap index
-            for sm in sitemap_tags:
-                loc = sm.find("ns:loc", namespaces) or sm.find("loc")
-                if loc is None or not (loc.text or "").strip():
-                    continue
-                sub_url = loc.text.strip()
-                try:
-                    sub_resp = self.session.get(sub_url, timeout=self.timeout)
-                    if sub_resp.status_code != 200:
+    def _url_score(self, url: str, depth: int, inbound: int = 0) -> float:
+        """Importancia de `url` para la cola por prioridad (ver crawl_frontier.priority_score)."""
+        return self._entry_score(self.sitemap_entries.get(self._normalize_for_visit(url)), depth, inbound)
+
+    def _entry_score(self, entry: Optional[SitemapEntry], depth: int, inbound: int = 0) -> float:
+        if entry is None:
+            return priority_score(depth, inbound)
+        return priority_score(depth, inbound, entry.priority, entry.lastmod, now=self._score_time)
+
+    def _seed_from_sitemap(self, queue: CrawlFrontier) -> None:
+        """Cola por prioridad: las URLs del sitemap entran desde el principio con su priority/lastmod."""
+        with self._phase("sitemap"):
+            with closing(self._iter_sitemap_entries()) as entries:
+                for norm, entry in entries:
+                    self.sitemap_entries[norm] = entry
+                    if norm in self.seen:
                         continue
-                    sub_root = ET.fromstring(sub_resp.content)
-                    url_tags = sub_root.findall(".//ns:url/ns:loc", namespaces) or sub_root.findall(".//url/loc")
-                    for u in url_tags:
-                        if u.text:
-                            urls.append(u.text.strip())
-                except (requests.RequestException, ET.ParseError):
-                    continue
+                    self.seen.enqueue(norm)
+                    # profundidad de clics aún desconocida: la de la ruta como aproximación
+                    queue.push(norm, norm, path_depth(norm))
+
+    def _draw_sample(self) -> List[str]:
+        """
+        Muestra estratificada de --sample URLs. La población es el sitemap completo, la
+        carpeta offline o, si no, la frontera de un rastreo BFS que solo sigue enlaces
+        (max_pages páginas visitadas más las que quedan en la cola).
+        """
+        sampler = StratifiedSampler(self.sample_size, self.sample_seed)
+        if self.use_sitemap:
+            with closing(self._iter_sitemap_entries()) as entries:
+                for norm, entry in entries:
+                    sampler.add(norm, entry)
+        elif self.local_site:
+            for url in self.local_site.urls():
+                if self._robots_allowed(url):
+                    sampler.add(url)
         else:
-            # sitemap simple
-            url_tags = root.findall(".//ns:url/ns:loc", namespaces) or root.findall(".//url/loc")
-            for u in url_tags:
-                if u.text:
-                    urls.append(u.text.strip())
+            for url in self._discover_frontier():
+                sampler.add(url)
+        if not sampler.populations:
+            sampler.add(self.base_url)
 
-        clean_urls: List[str] = []
-        seen: Set[str] = set()
-        for u in urls:
-            parsed_u = urlparse(u)
-            if parsed_u.netloc and parsed_u.netloc != self.domain:
-                continue
-            norm = self._normalize_for_visit(u)
-            if norm not in seen:
-                seen.add(norm)
-                clean_urls.append(norm)
+        self.sample_strata = dict(sampler.populations)
+        urls: List[str] = []
+        for url, entry in sampler.sample():
+            if entry is not None:
+                self.sitemap_entries[url] = entry
+            urls.append(url)
+        return urls
 
-        if self.max_pages:
-            clean_urls = clean_urls[: self.max_pages]
-        return clean_urls or [self.base_url]
+    def _discover_frontier(self) -> Iterator[str]:
+        """URLs descubiertas por el rastreo de enlaces, cada una una vez: las visitadas y las encoladas."""
+        listed = URLSeenSet()
+        previous: Optional[SEOPageResult] = None
+        for result in self._crawl_site_bfs(visit=self._discover_links):
+            if listed.enqueue(self._normalize_for_visit(result.url)):
+                yield result.url
+            # los enlaces de una página se encolan después de entregarla: se miran con la siguiente
+            if previous is not None:
+                yield from self._queued_outlinks(previous, listed)
+            previous = result
+        if previous is not None:
+            yield from self._queued_outlinks(previous, listed)
+
+    def _queued_outlinks(self, result: SEOPageResult, listed: URLSeenSet) -> Iterator[str]:
+        for _href, full in result.outlinks:
+            norm = self._normalize_for_visit(full)
+            if self.seen.state(norm) in (ENQUEUED, VISITED) and listed.enqueue(norm):
+                yield full
+
+    def _discover_links(self, url: str) -> SEOPageResult:
+        """Descarga `url` y extrae solo sus enlaces internos, sin comprobaciones."""
+        outlinks: List[Tuple[str, str]] = []
+        status = 0
+        try:
+            resp = self._fetch_page(url)
+            status = resp.status
+            content_type = resp.headers.get("Content-Type", "")
+            if status == 200 and "text/html" in content_type and not resp.truncated:
+                html = decode_html(resp.content, content_type)
+                facts = extract_page_facts(html, self.parser, (FACTS_ANCHORS,))
+                for href, _text, _rel in facts.anchors:
+                    full_url = urljoin(url, href)
+                    if self._is_internal(full_url):
+                        outlinks.append((href, full_url))
+        except Exception:
+            # la página entra igualmente en la población; la auditoría dirá qué le pasa
+            pass
+        finally:
+            self._release_body(url)
+        return SEOPageResult(url=url, status=status, metrics={}, issues=[], outlinks=outlinks)
 
-    def _crawl_site_bfs(self) -> List[str]:
-        urls: List[str] = []
-        queue = deque([self.base_url])
+    def _crawl_site_bfs(
+        self,
+        frontier: Optional[List[str]] = None,
+        scheduled: int = 0,
+        visit: Optional[Callable[[str], SEOPageResult]] = None,
+        frontier_links: Optional[List[List[int]]] = None,
+    ) -> Iterator[SEOPageResult]:
+        """
+        Rastreo BFS que audita cada página en la misma pasada en que descubre sus enlaces
+        (generador: cada resultado sale en cuanto se procesa).
+
+        Hay hasta `self.workers` páginas en vuelo, pero los resultados se consumen en
+        el mismo orden en que salieron de la cola, así que el orden de las URLs, la
+        profundidad BFS y el corte por `max_pages` son idénticos a los de un rastreo
+        secuencial. Con --frontier priority la cola saca primero la URL más importante y
+        el orden deja de ser BFS. Al reanudar, `frontier`, `frontier_links` (profundidad,
+        enlaces entrantes y si estaba en vuelo) y `scheduled` vienen del checkpoint.
+        `visit` sustituye a audit_url (el rastreo de descubrimiento de --sample, sin checkpoints).
+        """
+        discovering = visit is not None
+        visit = visit or self.audit_url
+        # cada URL entra en la cola una sola vez, por muchas páginas que enlacen a ella
+        queue = CrawlFrontier(self._url_score if self.frontier_order == FRONTIER_PRIORITY else None)
+        if frontier is None:
+            if self._robots_allowed(self.base_url):
+                norm = self._normalize_for_visit(self.base_url)
+                self.seen.enqueue(norm)
+                queue.push(self.base_url, norm, depth=0)
+            if self.frontier_order == FRONTIER_PRIORITY:
+                self._seed_from_sitemap(queue)
+        else:
+            links = frontier_links or [[0, 0, 0]] * len(frontier)
+            for url, (depth, inbound, head) in zip(frontier, links):
+                queue.push(url, self._normalize_for_visit(url), depth, inbound, head=bool(head))
+        # (FrontierItem, future) en orden de cola
+        in_flight: deque = deque()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                while queue and len(in_flight) < self.workers and scheduled < self.max_pages:
+                    if self._out_of_time():
+                        break
+                    item = queue.pop()
+                    if not self.seen.visit(self._normalize_for_visit(item.url)):
+                        continue
+                    scheduled += 1
+                    in_flight.append((item, pool.submit(visit, item.url)))
 
-        while queue and len(urls) < self.max_pages:
-            current = queue.popleft()
-            norm = self._normalize_for_visit(current)
-            if norm in self.visited:
-                continue
-            self.visited.add(norm)
-            urls.append(current)
+                if not in_flight:
+                    break
 
-            try:
-                resp = self.session.get(current, timeout=self.timeout)
-            except requests.RequestException:
-                continue
+                item, future = in_flight.popleft()
+                result = future.result()
+                yield result
+                if scheduled < self.max_pages:
+                    for _href, full in result.outlinks:
+                        norm = self._normalize_for_visit(full)
+                        if norm in self.seen:
+                            # ya en cola: un enlace entrante más (cuenta en la cola por prioridad)
+                            queue.link(norm, item.depth + 1)
+                            continue
+                        # robots.txt se consulta antes de encolar: lo prohibido nunca se descarga
+                        if not self._robots_allowed(full):
+                            continue
+                        # las trampas se evalúan una vez por URL (la consulta sin query)
+                        if self.traps.allow(norm):
+                            self.seen.enqueue(norm)
+                            queue.push(full, norm, item.depth + 1, inbound=1)
+                        else:
+                            self.seen.skip(norm)
+
+                if self.checkpoint and not discovering and self.checkpoint.due():
+                    # lo que está en vuelo se repetirá al reanudar: vuelve a la cabeza de la cola
+                    pending = [item for item, _future in in_flight]
+                    in_flight_norms = [self._normalize_for_visit(item.url) for item in pending]
+                    self.seen.requeue(in_flight_norms)
+                    queued = list(queue.items())
+                    self._save_checkpoint(
+                        [i.url for i in pending + queued],
+                        self.seen,
+                        [[i.depth, i.inbound, 1] for i in pending] + [[i.depth, i.inbound, int(i.head)] for i in queued],
+                    )
+                    for norm in in_flight_norms:
+                        self.seen.visit(norm)
+        self.frontier_pending = len(queue)
 
-            if resp.status_code != 200 or "text/html" not in resp.headers.get("Content-Type", ""):
-                continue
+    # ---------------------------
+    # Descarga de páginas
+    # ---------------------------
+    def _fetch_page(self, url: str) -> FetchedPage:
+        """Devuelve la respuesta de `url`, reutilizando el almacén si ya se descargó."""
+        norm = self._normalize_for_visit(url)
+        page = self.response_store.get(norm)
+        if page is not None and page.url == url and page.content is not None:
+            return page
+
+        page = self._head_binary(url)
+        if page is None:
+            page = self._get_page(url)
+        self.response_store[norm] = page
+        return page
+
+    def _head_binary(self, url: str) -> Optional[FetchedPage]:
+        """
+        HEAD previo para URLs con extensión binaria (.pdf, .mp4...): si no es HTML se
+        conoce su estado sin descargarla. None si hay que hacer GET (es HTML o el
+        servidor no responde bien a HEAD).
+        """
+        if os.path.splitext(urlparse(url).path)[1].lower() not in BINARY_EXTENSIONS:
+            return None
+        try:
+            resp = self.limiter.request(
+                lambda: self.session.head(url, allow_redirects=True, timeout=self.timeout), url
+            )
+        except requests.RequestException:
+            return None
+        if resp.status_code != 200 or "text/html" in resp.headers.get("Content-Type", ""):
+            return None
+        return FetchedPage(url=url, status=resp.status_code, headers=resp.headers, content=b"")
+
+    def _get_page(self, url: str) -> FetchedPage:
+        """
+        GET en streaming: el cuerpo solo se lee si es HTML con estado 200, y como mucho
+        max_body_bytes. Lo demás se descarta en cuanto llegan las cabeceras.
+        """
+        cached = self.http_cache.lookup(url) if self.http_cache else None
+        resp = self.limiter.request(
+            lambda: self.session.get(
+                url, timeout=self.timeout, headers=HTTPCache.conditional_headers(cached), stream=True
+            ),
+            url,
+        )
+        with closing(resp):
+            if resp.status_code == 304 and cached is not None:
+                # sin cambios desde la última ejecución: se reutiliza el cuerpo guardado
+                self._drain(resp)
+                cached = self.http_cache.refresh(cached, resp.headers)
+                return FetchedPage(
+                    url=url,
+                    status=cached.status,
+                    headers=CaseInsensitiveDict(cached.headers),
+                    content=cached.body,
+                )
 
-            soup = BeautifulSoup(resp.content, "html.parser")
+            content, truncated = b"", False
+            if resp.status_code == 200 and "text/html" in resp.headers.get("Content-Type", ""):
+                content, truncated = self._read_body(resp)
+            else:
+                self._drain(resp)
+            page = FetchedPage(
+                url=url,
+                status=resp.status_code,
+                headers=resp.headers,
+                content=content,
+                truncated=truncated,
+            )
+        # un cuerpo cortado no se guarda: la próxima vez se vuelve a pedir entero
+        if self.http_cache and not truncated:
+            self.http_cache.store(url, resp.status_code, resp.headers, content)
+        return page
 
-            for a in soup.find_all("a", href=True):
-                href = a.get("href", "").strip()
-                if not href:
-                    continue
-                if href.startswith(("#", "javascript:", "mailto:", "tel:")):
-                    continue
-                full = urljoin(current, href)
-                if not self._is_internal(full):
-                    continue
-                norm_full = self._normalize_for_visit(full)
-                if norm_full not in self.visited:
-                    queue.append(full)
+    @staticmethod
+    def _drain(resp: requests.Response) -> None:
+        """Lee un cuerpo que no interesa si es pequeño (la conexión vuelve al pool); si no, se cierra."""
+        try:
+            declared = int(resp.headers.get("Content-Length", ""))
+        except ValueError:
+            return
+        if declared <= DRAIN_MAX_BYTES:
+            _ = resp.content
 
-        return urls
+    def _read_body(self, resp: requests.Response) -> Tuple[bytes, bool]:
+        """Cuerpo de la respuesta hasta max_body_bytes; True si se cortó."""
+        limit = self.max_body_bytes
+        try:
+            declared = int(resp.headers.get("Content-Length", ""))
+        except ValueError:
+            declared = 0
+        # Content-Length cuenta bytes comprimidos: si ya supera el límite, descomprimido también
+        if limit and declared > limit:
+            return b"", True
+        chunks: List[bytes] = []
+        received = 0
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            received += len(chunk)
+            if limit and received > limit:
+                return b"", True
+        return b"".join(chunks), False
+
+    def _release_body(self, url: str) -> None:
+        """Libera cuerpo y cabeceras ya auditados; el estado sigue disponible para --check-links."""
+        norm = self._normalize_for_visit(url)
+        page = self.response_store.get(norm)
+        if page is not None and page.url == url:
+            page.content = None
+            page.headers = {}
 
     # ---------------------------
     # Robots.txt
@@ -230,28 +1262,70 @@ class SEOAuditor:
             return
         robots_url = f"{self.scheme}://{self.domain}/robots.txt"
         try:
-            resp = self.session.get(robots_url, timeout=self.timeout)
+            resp = self.limiter.request(lambda: self.session.get(robots_url, timeout=self.timeout), robots_url)
             self.robots_status = resp.status_code
             self.robots_content = resp.text if resp.status_code == 200 else None
         except requests.RequestException:
             self.robots_status = 0
             self.robots_content = None
 
+        # sin robots.txt (404, error) se rastrea todo, como hasta ahora
+        if self.robots_content:
+            self.robots = RobotsTxt.parse(self.robots_content)
+        delay = self.robots.crawl_delay(USER_AGENT)
+        if self.respect_robots and delay and not self.local_site:
+            self.limiter.set_interval(self.domain, delay)
+
     def _check_robots_all_disallowed(self) -> bool:
         if not self.robots_content:
             return False
-        lines = [l.strip() for l in self.robots_content.splitlines() if l.strip()]
-        ua_star = False
-        for line in lines:
-            if line.lower().startswith("user-agent:"):
-                ua = line.split(":", 1)[1].strip()
-                ua_star = ua == "*"
-            elif ua_star and line.lower().startswith("disallow:"):
-                rule = line.split(":", 1)[1].strip()
-                if rule in ("/", "/*"):
-                    return True
+        return not self.robots.is_allowed(self.base_url + "/", "*")
+
+    def _robots_allowed(self, url: str) -> bool:
+        """True si robots.txt permite rastrear `url`; las bloqueadas se anotan para el informe."""
+        if not self.respect_robots or self.robots.is_allowed(url, USER_AGENT):
+            return True
+        self.robots_blocked.add(url)
         return False
 
+    def _robots_blocked_issue(self) -> SEOIssue:
+        return SEOIssue(
+            code="URLS_BLOCKED_BY_ROBOTS",
+            severity="info",
+            category="indexing",
+            value=len(self.robots_blocked),
+            extra={
+                "urls": sorted(self.robots_blocked)[:ROBOTS_BLOCKED_SAMPLE],
+                "message": "Internal URLs not crawled because robots.txt disallows them for this crawler.",
+            },
+        )
+
+    def _crawl_traps_issue(self) -> SEOIssue:
+        return SEOIssue(
+            code="CRAWL_TRAP_URLS_SUPPRESSED",
+            severity="warning",
+            category="indexing",
+            value=self.traps.suppressed_urls,
+            extra={
+                "patterns": self.traps.suppressed(TRAP_PATTERNS_SAMPLE),
+                "message": "Internal URLs not crawled because they look like a crawler trap "
+                           "(endless calendar/pagination/filter URLs, repeated path segments or very long URLs).",
+            },
+        )
+
+    def _time_budget_issue(self) -> SEOIssue:
+        return SEOIssue(
+            code="CRAWL_TIME_BUDGET_EXHAUSTED",
+            severity="warning",
+            category="technical",
+            value=self.frontier_pending,
+            limit=self.time_budget,
+            extra={
+                "message": "The crawl stopped when the time budget ran out; URLs still queued were not audited "
+                           "and site-wide checks (orphans, duplicates, link graph) only cover the audited pages.",
+            },
+        )
+
     # ---------------------------
     # Helpers para SEO
     # ---------------------------
@@ -280,20 +1354,101 @@ class SEOAuditor:
         return focus
 
     def _check_link_status(self, url: str) -> Optional[int]:
-        if url in self.link_status_cache:
-            return self.link_status_cache[url]
-        try:
-            resp = self.session.head(url, allow_redirects=True, timeout=self.timeout)
-            if resp.status_code >= 400 or resp.status_code < 200:
-                resp_get = self.session.get(url, allow_redirects=True, timeout=self.timeout)
-                status = resp_get.status_code
-            else:
+        with self._link_status_lock:
+            if url in self.link_status_cache:
+                return self.link_status_cache[url]
+        external = not self._is_internal(url)
+        final_url: Optional[str] = None
+
+        # si la URL ya se descargó en esta ejecución, su estado es conocido
+        stored = self.response_store.get(self._normalize_for_visit(url))
+        record = self.link_store.get(url, external) if self.link_store else None
+        if stored is not None and stored.url == url:
+            status = stored.status
+        elif record is not None:
+            # verificada hace poco en otra ejecución (dentro del TTL)
+            with self._link_status_lock:
+                self.link_status_cache[url] = record.status
+            return record.status
+        else:
+            try:
+                with self._phase("link_request"):
+                    resp = self.limiter.request(
+                        lambda: self.session.head(url, allow_redirects=True, timeout=self.timeout), url
+                    )
+                    if resp.status_code >= 400 or resp.status_code < 200:
+                        # solo interesa el estado: el cuerpo no se descarga
+                        resp = self.limiter.request(
+                            lambda: self.session.get(url, allow_redirects=True, timeout=self.timeout, stream=True),
+                            url,
+                        )
+                        resp.close()
                 status = resp.status_code
-        except requests.RequestException:
-            status = 0
-        self.link_status_cache[url] = status
+                final_url = resp.url
+            except requests.RequestException:
+                status = 0
+
+        if self.link_store:
+            self.link_store.put(url, status, final_url, external)
+        with self._link_status_lock:
+            self.link_status_cache[url] = status
         return status
 
+    def _verify_links(self, pages_results: List[SEOPageResult]) -> None:
+        """
+        Comprueba los enlaces internos de todo el rastreo de una vez.
+
+        Cada URL destino se verifica una sola vez (deduplicado global), las que ya se
+        descargaron durante el rastreo salen del almacén sin petición, y el resto pasa
+        por un pool acotado a `self.workers`. Después se reparte el resultado a cada página.
+        """
+        unique_urls: List[str] = []
+        seen: Set[str] = set()
+        for r in pages_results:
+            for _href, full in r.outlinks:
+                if full not in seen:
+                    seen.add(full)
+                    unique_urls.append(full)
+
+        # las prohibidas por robots.txt tampoco se piden aquí (y no cuentan como rotas)
+        unique_urls = [u for u in unique_urls if self._robots_allowed(u)]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            statuses = dict(zip(unique_urls, pool.map(self._check_link_status, unique_urls)))
+
+        for r in pages_results:
+            self._apply_link_statuses(r, statuses)
+
+    def _submit_link_checks(self, pool: ThreadPoolExecutor, r: SEOPageResult, futures: Dict[str, Future]) -> None:
+        """En streaming: pone en `pool` los enlaces de `r` que ninguna página anterior había pedido."""
+        for _href, full in r.outlinks:
+            if full not in futures and self._robots_allowed(full):
+                futures[full] = pool.submit(self._check_link_status, full)
+
+    @staticmethod
+    def _links_checked(r: SEOPageResult, futures: Dict[str, Future]) -> bool:
+        return all(futures[full].done() for _href, full in r.outlinks if full in futures)
+
+    def _apply_link_statuses(self, r: SEOPageResult, statuses: Mapping[str, int]) -> None:
+        """Añade a la página un BROKEN_INTERNAL_LINK por cada enlace con estado de error."""
+        broken = 0
+        for href, full in r.outlinks:
+            if full not in statuses:
+                continue
+            status_link = statuses[full]
+            if not status_link or status_link >= 400:
+                broken += 1
+                r.issues.append(
+                    SEOIssue(
+                        code="BROKEN_INTERNAL_LINK",
+                        severity="warning",
+                        category="links",
+                        value={"href": href, "status": status_link},
+                        extra={"message": f"Internal link appears broken: {href} (status {status_link})."},
+                    )
+                )
+        if "broken_internal_links" in r.metrics:
+            r.metrics["broken_internal_links"] = broken
+
     @staticmethod
     def _parse_robots_directives(value: Optional[str]) -> Set[str]:
         directives: Set[str] = set()
@@ -311,11 +1466,20 @@ class SEOAuditor:
     def audit_url(self, url: str) -> SEOPageResult:
         issues: List[SEOIssue] = []
         metrics: Dict[str, Any] = {}
+        outlinks: List[Tuple[str, str]] = []
+        content_hash: Optional[str] = None
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
 
         try:
-            resp = self.session.get(url, timeout=self.timeout)
-            status = resp.status_code
+            with _lap(timings, "fetch"):
+                resp = self._fetch_page(url)
+            status = resp.status
             metrics["status"] = status
+            entry = self.sitemap_entries.get(url)
+            if entry:
+                metrics["sitemap_lastmod"] = entry.lastmod
+                metrics["sitemap_priority"] = entry.priority
 
             if status != 200:
                 issues.append(
@@ -342,963 +1506,1066 @@ class SEOAuditor:
                 )
                 return SEOPageResult(url=url, status=status, metrics=metrics, issues=issues)
 
-            soup = BeautifulSoup(resp.content, "html.parser")
-
-            # HTML básico
-            html_tag = soup.find("html")
-            html_lang = html_tag.get("lang") if html_tag else None
-            metrics["html_lang"] = html_lang
-            if not html_lang:
+            if resp.truncated:
                 issues.append(
                     SEOIssue(
-                        code="HTML_LANG_MISSING",
+                        code="HTML_TOO_LARGE",
                         severity="warning",
-                        category="accessibility",
-                        extra={"message": "<html lang=\"...\"> is missing; affects accessibility and SEO."},
+                        category="technical",
+                        limit=self.max_body_bytes,
+                        extra={"message": "HTML body exceeds the download size limit; on-page checks skipped."},
                     )
                 )
+                return SEOPageResult(url=url, status=status, metrics=metrics, issues=issues)
+
+            with _lap(timings, "decode"):
+                html = decode_html(resp.content, content_type)
+                content_hash = self._content_hash(resp, html)
+            previous = self.previous_pages.get(url)
+            if previous is not None and previous.get("content_hash") == content_hash:
+                return self._carry_forward(previous)
+
+            with _lap(timings, "parse"):
+                facts = extract_page_facts(html, self.parser, self.fact_groups)
+                ctx = PageContext(url=url, resp=resp, html=html, facts=facts, metrics=metrics, issues=issues)
+                for href, text, rel in facts.anchors:
+                    full_url = urljoin(url, href)
+                    internal = self._is_internal(full_url)
+                    ctx.links.append((href, full_url, text, rel, internal))
+                    if internal:
+                        # registrar inbound link (y enlace a verificar con --check-links)
+                        outlinks.append((href, full_url))
+
+            checks = self.page_checks
+            template_issues: Optional[List[str]] = None
+            if self.templates is not None:
+                template_id, representative = self.templates.assign(url, facts.skeleton_hash)
+                metrics["template_id"] = template_id
+                if representative == url:
+                    template_issues = []
+                else:
+                    metrics["template_representative"] = representative
+                    checks = self.content_checks
+
+            for check in checks:
+                first_issue = len(issues)
+                with _lap(timings, "check:" + check.category):
+                    check.run(self, ctx)
+                if template_issues is not None and check.template:
+                    template_issues.extend(i.code for i in issues[first_issue:])
+            if template_issues is not None:
+                # lo que encuentra el representante vale para toda la plantilla
+                self.templates.record_issues(metrics["template_id"], template_issues)
 
-            head_tag = soup.find("head")
-            metrics["has_head"] = head_tag is not None
+        except Exception as e:
+            issues.append(
+                SEOIssue(
+                    code="EXCEPTION",
+                    severity="error",
+                    category="technical",
+                    value=str(e),
+                    extra={"message": "Unexpected exception while auditing URL."},
+                )
+            )
+            status = 0
+            metrics["status"] = status
 
-            raw_text = resp.text.lstrip()
-            metrics["has_doctype"] = raw_text.lower().startswith("<!doctype html")
+        finally:
+            self._release_body(url)
+            if self.profiler:
+                self.profiler.record_url(url, timings, time.perf_counter() - started)
+
+        return SEOPageResult(
+            url=url,
+            status=status,
+            metrics=metrics,
+            issues=issues,
+            outlinks=outlinks,
+            content_hash=content_hash,
+        )
 
-            charset_tag = soup.find("meta", charset=True) or soup.find(
-                "meta", attrs={"http-equiv": lambda v: v and v.lower() == "content-type"}
+    # ---------------------------
+    # Comprobaciones por página (en orden de registro)
+    # ---------------------------
+    @page_check("html_lang", "accessibility", template=True)
+    def _check_html_lang(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+
+        # HTML básico
+        html_lang = facts.html_lang
+        metrics["html_lang"] = html_lang
+        if not html_lang:
+            issues.append(
+                SEOIssue(
+                    code="HTML_LANG_MISSING",
+                    severity="warning",
+                    category="accessibility",
+                    extra={"message": "<html lang=\"...\"> is missing; affects accessibility and SEO."},
+                )
             )
-            metrics["has_meta_charset"] = charset_tag is not None
 
-            viewport_tag = soup.find("meta", attrs={"name": lambda v: v and v.lower() == "viewport"})
-            metrics["has_meta_viewport"] = viewport_tag is not None
-            if not viewport_tag:
-                issues.append(
-                    SEOIssue(
-                        code="VIEWPORT_MISSING",
-                        severity="warning",
-                        category="technical",
-                        extra={"message": "Missing <meta name=\"viewport\">; page may not be mobile-friendly."},
-                    )
+    @page_check("document", "technical", facts=(FACTS_META,), template=True)
+    def _check_document(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+        html = ctx.html
+
+        metrics["has_head"] = _HEAD_RE.search(html) is not None
+        metrics["has_doctype"] = _DOCTYPE_RE.match(html) is not None
+        metrics["has_meta_charset"] = facts.has_meta_charset
+
+        metrics["has_meta_viewport"] = facts.has_meta_viewport
+        if not facts.has_meta_viewport:
+            issues.append(
+                SEOIssue(
+                    code="VIEWPORT_MISSING",
+                    severity="warning",
+                    category="technical",
+                    extra={"message": "Missing <meta name=\"viewport\">; page may not be mobile-friendly."},
                 )
+            )
 
-            # URL, slug y profundidad
-            parsed_url = urlparse(url)
-            path = parsed_url.path or "/"
-            metrics["url_path"] = path
-            slug = path.strip("/").split("/")[-1] if path not in ("", "/") else ""
-            metrics["url_slug"] = slug
-            depth = len([s for s in path.split("/") if s])
-            metrics["url_path_depth"] = depth
-            if slug and len(slug) > 80:
-                issues.append(
-                    SEOIssue(
-                        code="SLUG_TOO_LONG",
-                        severity="info",
-                        category="technical",
-                        value=len(slug),
-                        limit=80,
-                        extra={"message": "URL slug is very long; short, descriptive slugs are preferred."},
-                    )
+    @page_check("url_structure", "technical")
+    def _check_url_structure(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+
+        # URL, slug y profundidad
+        path = ctx.path
+        metrics["url_path"] = path
+        slug = ctx.slug
+        metrics["url_slug"] = slug
+        depth = len([s for s in path.split("/") if s])
+        metrics["url_path_depth"] = depth
+        if slug and len(slug) > 80:
+            issues.append(
+                SEOIssue(
+                    code="SLUG_TOO_LONG",
+                    severity="info",
+                    category="technical",
+                    value=len(slug),
+                    limit=80,
+                    extra={"message": "URL slug is very long; short, descriptive slugs are preferred."},
                 )
-            if depth > 5:
-                issues.append(
-                    SEOIssue(
-                        code="URL_DEPTH_HIGH",
-                        severity="info",
-                        category="technical",
-                        value=depth,
-                        limit=5,
-                        extra={"message": "URL path depth is high; flatter structures are usually better for SEO."},
-                    )
+            )
+        if depth > 5:
+            issues.append(
+                SEOIssue(
+                    code="URL_DEPTH_HIGH",
+                    severity="info",
+                    category="technical",
+                    value=depth,
+                    limit=5,
+                    extra={"message": "URL path depth is high; flatter structures are usually better for SEO."},
                 )
+            )
 
-            # TEXT & WORD COUNT (quitando ruido básico)
-            soup_for_text = soup.__copy__()
-            for tag_name in ["script", "style", "noscript"]:
-                for t in soup_for_text.find_all(tag_name):
-                    t.extract()
-            for t in soup_for_text.find_all(["nav", "footer"]):
-                t.extract()
-
-            visible_text = soup_for_text.get_text(separator=" ", strip=True)
-            tokens = re.findall(r"\w+", visible_text, flags=re.UNICODE)
-            word_count = len(tokens)
-            metrics["word_count"] = word_count
-            if word_count < 300:
-                issues.append(
-                    SEOIssue(
-                        code="CONTENT_THIN",
-                        severity="warning",
-                        category="content",
-                        value=word_count,
-                        limit=300,
-                        extra={"message": "Very low word count; aim for 300+ words for most pages."},
-                    )
+    @page_check("content", "content", facts=(FACTS_TEXT, FACTS_FIRST_PARAGRAPH))
+    def _check_content(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+
+        # TEXT & WORD COUNT (sin script/style/noscript/nav/footer)
+        word_count = facts.word_count
+        metrics["word_count"] = word_count
+        if word_count < 300:
+            issues.append(
+                SEOIssue(
+                    code="CONTENT_THIN",
+                    severity="warning",
+                    category="content",
+                    value=word_count,
+                    limit=300,
+                    extra={"message": "Very low word count; aim for 300+ words for most pages."},
                 )
-            elif word_count < 500:
-                issues.append(
-                    SEOIssue(
-                        code="CONTENT_LOW",
-                        severity="info",
-                        category="content",
-                        value=word_count,
-                        limit=500,
-                        extra={"message": "Content could be more in-depth; many competitive pages use 500+ words."},
-                    )
+            )
+        elif word_count < 500:
+            issues.append(
+                SEOIssue(
+                    code="CONTENT_LOW",
+                    severity="info",
+                    category="content",
+                    value=word_count,
+                    limit=500,
+                    extra={"message": "Content could be more in-depth; many competitive pages use 500+ words."},
+                )
+            )
+
+        # Primer párrafo (focus keyword en primeras líneas)
+        first_paragraph_text = facts.first_paragraph
+        metrics["first_paragraph_length"] = len(first_paragraph_text)
+
+    @page_check("title", "meta", facts=(FACTS_TITLE,))
+    def _check_title(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+
+        # TITLE
+        if facts.title_count > 1:
+            issues.append(
+                SEOIssue(
+                    code="TITLE_MULTIPLE",
+                    severity="warning",
+                    category="meta",
+                    value=facts.title_count,
+                    extra={"message": "Multiple <title> tags found; only one should exist."},
                 )
+            )
 
-            # Primer párrafo (focus keyword en primeras líneas)
-            first_paragraph_tag = soup.find("p")
-            first_paragraph_text = first_paragraph_tag.get_text(" ", strip=True) if first_paragraph_tag else ""
-            metrics["first_paragraph_length"] = len(first_paragraph_text)
+        title_text = facts.title
+        metrics["title"] = title_text
+        metrics["title_length"] = len(title_text)
 
-            # TITLE
-            title_tags = soup.find_all("title")
-            if len(title_tags) > 1:
+        if not title_text:
+            issues.append(
+                SEOIssue(
+                    code="TITLE_MISSING",
+                    severity="error",
+                    category="meta",
+                    extra={"message": "<title> is missing or empty."},
+                )
+            )
+        else:
+            if len(title_text) < 30:
                 issues.append(
                     SEOIssue(
-                        code="TITLE_MULTIPLE",
+                        code="TITLE_TOO_SHORT",
                         severity="warning",
                         category="meta",
-                        value=len(title_tags),
-                        extra={"message": "Multiple <title> tags found; only one should exist."},
+                        value=len(title_text),
+                        limit=30,
+                        extra={"message": "Title is very short; consider ~50–60 characters when possible."},
                     )
                 )
-
-            title_text = ""
-            if soup.title and soup.title.string:
-                title_text = soup.title.string.strip()
-            metrics["title"] = title_text
-            metrics["title_length"] = len(title_text)
-
-            if not title_text:
+            if len(title_text) > 60:
                 issues.append(
                     SEOIssue(
-                        code="TITLE_MISSING",
-                        severity="error",
+                        code="TITLE_TOO_LONG",
+                        severity="warning",
                         category="meta",
-                        extra={"message": "<title> is missing or empty."},
+                        value=len(title_text),
+                        limit=60,
+                        extra={"message": "Title is long; >60 chars may be truncated or rewritten in SERPs."},
                     )
                 )
-            else:
-                if len(title_text) < 30:
-                    issues.append(
-                        SEOIssue(
-                            code="TITLE_TOO_SHORT",
-                            severity="warning",
-                            category="meta",
-                            value=len(title_text),
-                            limit=30,
-                            extra={"message": "Title is very short; consider ~50–60 characters when possible."},
-                        )
-                    )
-                if len(title_text) > 60:
-                    issues.append(
-                        SEOIssue(
-                            code="TITLE_TOO_LONG",
-                            severity="warning",
-                            category="meta",
-                            value=len(title_text),
-                            limit=60,
-                            extra={"message": "Title is long; >60 chars may be truncated or rewritten in SERPs."},
-                        )
-                    )
 
-            # META DESCRIPTION (múltiples + longitud)
-            desc_tags = soup.find_all("meta", attrs={"name": lambda v: v and v.lower() == "description"})
-            if len(desc_tags) > 1:
+    @page_check("meta_description", "meta", facts=(FACTS_META,))
+    def _check_meta_description(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+
+        # META DESCRIPTION (múltiples + longitud)
+        desc_tags = facts.meta_descriptions
+        if len(desc_tags) > 1:
+            issues.append(
+                SEOIssue(
+                    code="META_DESC_MULTIPLE",
+                    severity="warning",
+                    category="meta",
+                    value=len(desc_tags),
+                    extra={"message": "Multiple meta description tags found; only one is recommended."},
+                )
+            )
+
+        meta_desc = ""
+        if desc_tags:
+            meta_desc = desc_tags[0].strip()
+        metrics["meta_description"] = meta_desc
+        metrics["meta_description_length"] = len(meta_desc)
+
+        if not meta_desc:
+            issues.append(
+                SEOIssue(
+                    code="META_DESC_MISSING",
+                    severity="warning",
+                    category="meta",
+                    extra={"message": "Meta description is missing or empty."},
+                )
+            )
+        else:
+            if len(meta_desc) < 80:
                 issues.append(
                     SEOIssue(
-                        code="META_DESC_MULTIPLE",
-                        severity="warning",
+                        code="META_DESC_TOO_SHORT",
+                        severity="info",
                         category="meta",
-                        value=len(desc_tags),
-                        extra={"message": "Multiple meta description tags found; only one is recommended."},
+                        value=len(meta_desc),
+                        limit=80,
+                        extra={"message": "Meta description is quite short; usually 120–160 characters works well."},
                     )
                 )
-
-            meta_desc = ""
-            if desc_tags:
-                meta_desc = desc_tags[0].get("content", "").strip()
-            metrics["meta_description"] = meta_desc
-            metrics["meta_description_length"] = len(meta_desc)
-
-            if not meta_desc:
+            if len(meta_desc) > 180:
                 issues.append(
                     SEOIssue(
-                        code="META_DESC_MISSING",
-                        severity="warning",
+                        code="META_DESC_TOO_LONG",
+                        severity="info",
                         category="meta",
-                        extra={"message": "Meta description is missing or empty."},
+                        value=len(meta_desc),
+                        limit=180,
+                        extra={"message": "Meta description is long; snippets are commonly truncated around 150–160 chars."},
                     )
                 )
-            else:
-                if len(meta_desc) < 80:
-                    issues.append(
-                        SEOIssue(
-                            code="META_DESC_TOO_SHORT",
-                            severity="info",
-                            category="meta",
-                            value=len(meta_desc),
-                            limit=80,
-                            extra={"message": "Meta description is quite short; usually 120–160 characters works well."},
-                        )
-                    )
-                if len(meta_desc) > 180:
-                    issues.append(
-                        SEOIssue(
-                            code="META_DESC_TOO_LONG",
-                            severity="info",
-                            category="meta",
-                            value=len(meta_desc),
-                            limit=180,
-                            extra={"message": "Meta description is long; snippets are commonly truncated around 150–160 chars."},
-                        )
-                    )
 
-            # META KEYWORDS
-            meta_kw_tag = soup.find("meta", attrs={"name": lambda v: v and v.lower() == "keywords"})
-            meta_keywords_list: List[str] = []
-            if meta_kw_tag:
-                meta_keywords_content = meta_kw_tag.get("content", "") or ""
-                parts = [p.strip() for p in meta_keywords_content.split(",") if p.strip()]
-                meta_keywords_list = parts
-                metrics["meta_keywords_present"] = True
-                metrics["meta_keywords_count"] = len(parts)
-                metrics["meta_keywords_length"] = len(meta_keywords_content)
+    @page_check("meta_keywords", "meta", facts=(FACTS_META,))
+    def _check_meta_keywords(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
 
+        # META KEYWORDS
+        if facts.meta_keywords is not None:
+            meta_keywords_content = facts.meta_keywords
+            parts = [p.strip() for p in meta_keywords_content.split(",") if p.strip()]
+            metrics["meta_keywords_present"] = True
+            metrics["meta_keywords_count"] = len(parts)
+            metrics["meta_keywords_length"] = len(meta_keywords_content)
+
+            issues.append(
+                SEOIssue(
+                    code="META_KEYWORDS_IGNORED",
+                    severity="info",
+                    category="meta",
+                    value=len(parts),
+                    extra={"message": "Meta keywords are largely ignored by modern search engines; avoid over-optimizing here."},
+                )
+            )
+            if len(parts) > 10:
                 issues.append(
                     SEOIssue(
-                        code="META_KEYWORDS_IGNORED",
-                        severity="info",
+                        code="META_KEYWORDS_TOO_MANY",
+                        severity="warning",
                         category="meta",
                         value=len(parts),
-                        extra={"message": "Meta keywords are largely ignored by modern search engines; avoid over-optimizing here."},
+                        limit=10,
+                        extra={"message": "Too many meta keywords; can be seen as keyword stuffing."},
                     )
                 )
-                if len(parts) > 10:
-                    issues.append(
-                        SEOIssue(
-                            code="META_KEYWORDS_TOO_MANY",
-                            severity="warning",
-                            category="meta",
-                            value=len(parts),
-                            limit=10,
-                            extra={"message": "Too many meta keywords; can be seen as keyword stuffing."},
-                        )
-                    )
-                if len(meta_keywords_content) > 255:
-                    issues.append(
-                        SEOIssue(
-                            code="META_KEYWORDS_TOO_LONG",
-                            severity="warning",
-                            category="meta",
-                            value=len(meta_keywords_content),
-                            limit=255,
-                            extra={"message": "Meta keywords string is very long; usually unnecessary."},
-                        )
+            if len(meta_keywords_content) > 255:
+                issues.append(
+                    SEOIssue(
+                        code="META_KEYWORDS_TOO_LONG",
+                        severity="warning",
+                        category="meta",
+                        value=len(meta_keywords_content),
+                        limit=255,
+                        extra={"message": "Meta keywords string is very long; usually unnecessary."},
                     )
-            else:
-                metrics["meta_keywords_present"] = False
-
-            # FOCUS KEYWORDS
-            focus_keywords = self._extract_focus_keywords(title_text)
-            metrics["focus_keywords_from_title"] = focus_keywords
-
-            # keyword en meta description
-            meta_desc_lower = meta_desc.lower()
-            if focus_keywords and meta_desc:
-                missing_in_desc = [kw for kw in focus_keywords if kw not in meta_desc_lower]
-                if missing_in_desc:
-                    issues.append(
-                        SEOIssue(
-                            code="META_DESC_MISSING_FOCUS_KEYWORDS",
-                            severity="info",
-                            category="meta",
-                            value=missing_in_desc,
-                            extra={"message": "Some focus keywords from title do not appear in meta description."},
-                        )
+                )
+        else:
+            metrics["meta_keywords_present"] = False
+
+    @page_check("focus_keywords", "content", facts=(FACTS_TITLE, FACTS_META, FACTS_FIRST_PARAGRAPH))
+    def _check_focus_keywords(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        meta_desc = ctx.meta_description
+        slug = ctx.slug
+        first_paragraph_text = ctx.facts.first_paragraph
+
+        # FOCUS KEYWORDS (las usan también headings e images)
+        focus_keywords = ctx.focus_keywords = self._extract_focus_keywords(ctx.facts.title)
+        metrics["focus_keywords_from_title"] = focus_keywords
+
+        # keyword en meta description
+        meta_desc_lower = meta_desc.lower()
+        if focus_keywords and meta_desc:
+            missing_in_desc = [kw for kw in focus_keywords if kw not in meta_desc_lower]
+            if missing_in_desc:
+                issues.append(
+                    SEOIssue(
+                        code="META_DESC_MISSING_FOCUS_KEYWORDS",
+                        severity="info",
+                        category="meta",
+                        value=missing_in_desc,
+                        extra={"message": "Some focus keywords from title do not appear in meta description."},
                     )
+                )
 
-            # keyword en slug
-            if slug and focus_keywords:
-                slug_lower = slug.lower()
-                has_kw_in_slug = any(kw in slug_lower for kw in focus_keywords)
-                metrics["slug_has_focus_keyword"] = has_kw_in_slug
-                if not has_kw_in_slug:
-                    issues.append(
-                        SEOIssue(
-                            code="SLUG_MISSING_FOCUS_KEYWORD",
-                            severity="info",
-                            category="technical",
-                            value={"slug": slug, "focus_keywords": focus_keywords},
-                            extra={"message": "URL slug does not contain any focus keyword from title."},
-                        )
+        # keyword en slug
+        if slug and focus_keywords:
+            slug_lower = slug.lower()
+            has_kw_in_slug = any(kw in slug_lower for kw in focus_keywords)
+            metrics["slug_has_focus_keyword"] = has_kw_in_slug
+            if not has_kw_in_slug:
+                issues.append(
+                    SEOIssue(
+                        code="SLUG_MISSING_FOCUS_KEYWORD",
+                        severity="info",
+                        category="technical",
+                        value={"slug": slug, "focus_keywords": focus_keywords},
+                        extra={"message": "URL slug does not contain any focus keyword from title."},
                     )
-            else:
-                metrics["slug_has_focus_keyword"] = False
-
-            # keyword en primer párrafo
-            fp_lower = first_paragraph_text.lower()
-            if focus_keywords and first_paragraph_text:
-                has_kw_first_p = any(kw in fp_lower for kw in focus_keywords)
-                metrics["first_paragraph_has_focus_keyword"] = has_kw_first_p
-                if not has_kw_first_p:
-                    issues.append(
-                        SEOIssue(
-                            code="FIRST_PARAGRAPH_MISSING_FOCUS_KEYWORDS",
-                            severity="info",
-                            category="content",
-                            value=focus_keywords,
-                            extra={"message": "First paragraph does not contain any focus keyword from title."},
-                        )
+                )
+        else:
+            metrics["slug_has_focus_keyword"] = False
+
+        # keyword en primer párrafo
+        fp_lower = first_paragraph_text.lower()
+        if focus_keywords and first_paragraph_text:
+            has_kw_first_p = any(kw in fp_lower for kw in focus_keywords)
+            metrics["first_paragraph_has_focus_keyword"] = has_kw_first_p
+            if not has_kw_first_p:
+                issues.append(
+                    SEOIssue(
+                        code="FIRST_PARAGRAPH_MISSING_FOCUS_KEYWORDS",
+                        severity="info",
+                        category="content",
+                        value=focus_keywords,
+                        extra={"message": "First paragraph does not contain any focus keyword from title."},
                     )
-            else:
-                metrics["first_paragraph_has_focus_keyword"] = False
+                )
+        else:
+            metrics["first_paragraph_has_focus_keyword"] = False
+
+    @page_check("headings", "headings", facts=(FACTS_HEADINGS,), requires=("focus_keywords",))
+    def _check_headings(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+        focus_keywords = ctx.focus_keywords
+
+        # HEADINGS
+        h1_texts = [text for level, text in facts.headings if level == 1]
+        h2_texts = [text for level, text in facts.headings if level == 2]
+        metrics["h1_count"] = len(h1_texts)
+        metrics["h2_count"] = len(h2_texts)
+
+        if len(h1_texts) == 0:
+            issues.append(
+                SEOIssue(
+                    code="H1_MISSING",
+                    severity="error",
+                    category="headings",
+                    extra={"message": "Page has no <h1>; important for structure and relevance."},
+                )
+            )
+        elif len(h1_texts) > 1:
+            issues.append(
+                SEOIssue(
+                    code="H1_MULTIPLE",
+                    severity="warning",
+                    category="headings",
+                    value=len(h1_texts),
+                    extra={"message": "Page has multiple <h1> tags; consider using a single primary heading."},
+                )
+            )
 
-            # HEADINGS
-            h1_tags = soup.find_all("h1")
-            h2_tags = soup.find_all("h2")
-            metrics["h1_count"] = len(h1_tags)
-            metrics["h2_count"] = len(h2_tags)
+        metrics["h1_texts"] = h1_texts
+        metrics["h2_texts"] = h2_texts
 
-            if len(h1_tags) == 0:
+        for idx, text in enumerate(h1_texts):
+            if not text:
                 issues.append(
                     SEOIssue(
-                        code="H1_MISSING",
+                        code="H1_EMPTY",
                         severity="error",
                         category="headings",
-                        extra={"message": "Page has no <h1>; important for structure and relevance."},
+                        extra={"message": f"H1 #{idx+1} is empty."},
                     )
                 )
-            elif len(h1_tags) > 1:
+            elif len(text) > 120:
                 issues.append(
                     SEOIssue(
-                        code="H1_MULTIPLE",
-                        severity="warning",
+                        code="H1_TOO_LONG",
+                        severity="info",
                         category="headings",
-                        value=len(h1_tags),
-                        extra={"message": "Page has multiple <h1> tags; consider using a single primary heading."},
+                        value=len(text),
+                        limit=120,
+                        extra={"message": "H1 is very long; shorter, focused headings are usually better."},
                     )
                 )
 
-            h1_texts = [h.get_text(" ", strip=True) for h in h1_tags]
-            h2_texts = [h.get_text(" ", strip=True) for h in h2_tags]
-            metrics["h1_texts"] = h1_texts
-            metrics["h2_texts"] = h2_texts
-
-            for idx, text in enumerate(h1_texts):
-                if not text:
+        # jerarquía de headings
+        last_level = None
+        for level, _text in facts.headings:
+            if last_level is None:
+                if level != 1:
                     issues.append(
                         SEOIssue(
-                            code="H1_EMPTY",
-                            severity="error",
-                            category="headings",
-                            extra={"message": f"H1 #{idx+1} is empty."},
-                        )
-                    )
-                elif len(text) > 120:
-                    issues.append(
-                        SEOIssue(
-                            code="H1_TOO_LONG",
+                            code="FIRST_HEADING_NOT_H1",
                             severity="info",
                             category="headings",
-                            value=len(text),
-                            limit=120,
-                            extra={"message": "H1 is very long; shorter, focused headings are usually better."},
+                            value=level,
+                            extra={"message": "First heading is not <h1>; consider starting hierarchy with H1."},
                         )
                     )
-
-            # jerarquía de headings
-            headings_sequence = soup.find_all(re.compile(r"^h[1-6]$", re.I))
-            last_level = None
-            for h in headings_sequence:
-                try:
-                    level = int(h.name[1])
-                except Exception:
-                    continue
-                if last_level is None:
-                    if level != 1:
-                        issues.append(
-                            SEOIssue(
-                                code="FIRST_HEADING_NOT_H1",
-                                severity="info",
-                                category="headings",
-                                value=level,
-                                extra={"message": "First heading is not <h1>; consider starting hierarchy with H1."},
-                            )
-                        )
-                else:
-                    if level > last_level + 1:
-                        issues.append(
-                            SEOIssue(
-                                code="HEADING_LEVEL_SKIP",
-                                severity="info",
-                                category="headings",
-                                value={"from": last_level, "to": level},
-                                extra={"message": "Heading levels jump (e.g., H2 -> H4); might hurt structure."},
-                            )
-                        )
-                last_level = level
-
-            # concordancia title / H1 / H2
-            title_lower = title_text.lower()
-            h1_join = " ".join(h1_texts).lower()
-            h2_join = " ".join(h2_texts).lower()
-
-            if focus_keywords:
-                missing_in_h1 = [kw for kw in focus_keywords if kw not in h1_join]
-                if missing_in_h1:
-                    issues.append(
-                        SEOIssue(
-                            code="H1_MISSING_FOCUS_KEYWORDS",
-                            severity="info",
-                            category="headings",
-                            value=missing_in_h1,
-                            extra={"message": "Some focus keywords from title do not appear in any H1."},
-                        )
-                    )
-                missing_in_h2 = [kw for kw in focus_keywords if kw not in h2_join]
-                if missing_in_h2:
+            else:
+                if level > last_level + 1:
                     issues.append(
                         SEOIssue(
-                            code="H2_MISSING_FOCUS_KEYWORDS",
+                            code="HEADING_LEVEL_SKIP",
                             severity="info",
                             category="headings",
-                            value=missing_in_h2,
-                            extra={"message": "Some focus keywords from title do not appear in any H2."},
+                            value={"from": last_level, "to": level},
+                            extra={"message": "Heading levels jump (e.g., H2 -> H4); might hurt structure."},
                         )
                     )
+            last_level = level
 
-            # CANONICAL
-            canonical_tags = soup.find_all("link", rel=lambda v: v and "canonical" in str(v).lower())
-            canonical_href = None
-            if len(canonical_tags) > 1:
+        # concordancia title / H1 / H2
+        h1_join = " ".join(h1_texts).lower()
+        h2_join = " ".join(h2_texts).lower()
+
+        if focus_keywords:
+            missing_in_h1 = [kw for kw in focus_keywords if kw not in h1_join]
+            if missing_in_h1:
                 issues.append(
                     SEOIssue(
-                        code="CANONICAL_MULTIPLE",
-                        severity="warning",
-                        category="indexing",
-                        value=len(canonical_tags),
-                        extra={"message": "Multiple canonical tags found; only one should exist."},
+                        code="H1_MISSING_FOCUS_KEYWORDS",
+                        severity="info",
+                        category="headings",
+                        value=missing_in_h1,
+                        extra={"message": "Some focus keywords from title do not appear in any H1."},
                     )
                 )
-            if canonical_tags:
-                canonical_href = canonical_tags[0].get("href")
-            metrics["canonical_url"] = canonical_href
-
-            requested_norm = self._normalize_for_visit(url)
-            if canonical_href:
-                canon_abs = urljoin(url, canonical_href)
-                canon_norm = self._normalize_for_visit(canon_abs)
-                if canon_norm != requested_norm:
-                    issues.append(
-                        SEOIssue(
-                            code="CANONICAL_DIFFERENT_URL",
-                            severity="info",
-                            category="indexing",
-                            value={"requested": requested_norm, "canonical": canon_norm},
-                            extra={"message": "Canonical URL differs from requested URL; ensure no unwanted duplication."},
-                        )
-                    )
-                parsed_canon = urlparse(canon_abs)
-                if parsed_canon.netloc and parsed_canon.netloc != self.domain:
-                    issues.append(
-                        SEOIssue(
-                            code="CANONICAL_EXTERNAL",
-                            severity="warning",
-                            category="indexing",
-                            value=canonical_href,
-                            extra={"message": "Canonical points to external domain; ensure this is intentional."},
-                        )
-                    )
-            else:
+            missing_in_h2 = [kw for kw in focus_keywords if kw not in h2_join]
+            if missing_in_h2:
                 issues.append(
                     SEOIssue(
-                        code="CANONICAL_MISSING",
+                        code="H2_MISSING_FOCUS_KEYWORDS",
                         severity="info",
-                        category="indexing",
-                        extra={"message": "Canonical link is missing; not always critical but recommended."},
+                        category="headings",
+                        value=missing_in_h2,
+                        extra={"message": "Some focus keywords from title do not appear in any H2."},
                     )
                 )
 
-            # META ROBOTS / X-ROBOTS-TAG
-            robots_tag = soup.find("meta", attrs={"name": lambda v: v and v.lower() == "robots"})
-            meta_robots = robots_tag.get("content") if robots_tag else None
-            metrics["meta_robots"] = meta_robots
-
-            x_robots = resp.headers.get("X-Robots-Tag")
-            metrics["x_robots_tag"] = x_robots
-
-            meta_directives = self._parse_robots_directives(meta_robots)
-            header_directives = self._parse_robots_directives(x_robots)
-            all_directives = meta_directives.union(header_directives)
-            metrics["robots_directives"] = sorted(all_directives)
-
-            if "noindex" in all_directives:
-                sev = "error" if url == self.base_url else "warning"
-                issues.append(
-                    SEOIssue(
-                        code="PAGE_NOINDEX",
-                        severity=sev,
-                        category="indexing",
-                        extra={"message": "Page is set to noindex; verify this is intentional."},
-                    )
+    @page_check("canonical", "indexing", facts=(FACTS_LINK_TAGS,))
+    def _check_canonical(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+        url = ctx.url
+
+        # CANONICAL
+        canonical_tags = facts.canonical_hrefs
+        canonical_href = None
+        if len(canonical_tags) > 1:
+            issues.append(
+                SEOIssue(
+                    code="CANONICAL_MULTIPLE",
+                    severity="warning",
+                    category="indexing",
+                    value=len(canonical_tags),
+                    extra={"message": "Multiple canonical tags found; only one should exist."},
                 )
-            if "nosnippet" in all_directives or any(d.startswith("max-snippet") for d in all_directives):
+            )
+        if canonical_tags:
+            canonical_href = canonical_tags[0]
+        metrics["canonical_url"] = canonical_href
+
+        requested_norm = self._normalize_for_visit(url)
+        if canonical_href:
+            canon_abs = urljoin(url, canonical_href)
+            canon_norm = self._normalize_for_visit(canon_abs)
+            if canon_norm != requested_norm:
                 issues.append(
                     SEOIssue(
-                        code="PAGE_NOSNIPPET",
+                        code="CANONICAL_DIFFERENT_URL",
                         severity="info",
                         category="indexing",
-                        extra={"message": "nosnippet/max-snippet directive limits visible snippet; check if desired."},
+                        value={"requested": requested_norm, "canonical": canon_norm},
+                        extra={"message": "Canonical URL differs from requested URL; ensure no unwanted duplication."},
                     )
                 )
-            if "noarchive" in all_directives:
+            parsed_canon = urlparse(canon_abs)
+            if parsed_canon.netloc and parsed_canon.netloc != self.domain:
                 issues.append(
                     SEOIssue(
-                        code="PAGE_NOARCHIVE",
-                        severity="info",
+                        code="CANONICAL_EXTERNAL",
+                        severity="warning",
                         category="indexing",
-                        extra={"message": "noarchive directive prevents cached copy from appearing in SERPs."},
+                        value=canonical_href,
+                        extra={"message": "Canonical points to external domain; ensure this is intentional."},
                     )
                 )
+        else:
+            issues.append(
+                SEOIssue(
+                    code="CANONICAL_MISSING",
+                    severity="info",
+                    category="indexing",
+                    extra={"message": "Canonical link is missing; not always critical but recommended."},
+                )
+            )
 
-            # HREFLANG
-            hreflang_links = []
-            for link in soup.find_all("link", href=True):
-                rel_val = link.get("rel")
-                rels = []
-                if isinstance(rel_val, (list, tuple)):
-                    rels = [str(r).lower() for r in rel_val]
-                elif rel_val:
-                    rels = [str(rel_val).lower()]
-                if "alternate" in rels and link.get("hreflang"):
-                    hreflang_links.append(link)
-
-            hreflang_codes: List[str] = []
-            hreflang_relative_count = 0
-            href_by_code: Dict[str, List[str]] = {}
-
-            for link in hreflang_links:
-                code = (link.get("hreflang") or "").strip()
-                href = link.get("href") or ""
-                hreflang_codes.append(code)
-                href_by_code.setdefault(code, []).append(href)
-                if not href.startswith("http"):
-                    hreflang_relative_count += 1
-
-            metrics["hreflang_count"] = len(hreflang_links)
-            metrics["hreflang_codes"] = hreflang_codes
-            metrics["hreflang_relative_urls"] = hreflang_relative_count
-            metrics["hreflang_has_x_default"] = "x-default" in [c.lower() for c in hreflang_codes]
-
-            if hreflang_links:
-                # duplicados por código
-                for code, hrefs in href_by_code.items():
-                    if len(hrefs) > 1:
-                        issues.append(
-                            SEOIssue(
-                                code="HREFLANG_DUPLICATE_CODE",
-                                severity="info",
-                                category="hreflang",
-                                value={"code": code, "urls": hrefs},
-                                extra={"message": "Multiple hreflang entries for same code."},
-                            )
-                        )
-                if hreflang_relative_count:
+    @page_check("meta_robots", "indexing", facts=(FACTS_META,))
+    def _check_meta_robots(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+        url = ctx.url
+
+        # META ROBOTS / X-ROBOTS-TAG
+        meta_robots = facts.meta_robots
+        metrics["meta_robots"] = meta_robots
+
+        x_robots = ctx.resp.headers.get("X-Robots-Tag")
+        metrics["x_robots_tag"] = x_robots
+
+        meta_directives = self._parse_robots_directives(meta_robots)
+        header_directives = self._parse_robots_directives(x_robots)
+        all_directives = meta_directives.union(header_directives)
+        metrics["robots_directives"] = sorted(all_directives)
+
+        if "noindex" in all_directives:
+            sev = "error" if url == self.base_url else "warning"
+            issues.append(
+                SEOIssue(
+                    code="PAGE_NOINDEX",
+                    severity=sev,
+                    category="indexing",
+                    extra={"message": "Page is set to noindex; verify this is intentional."},
+                )
+            )
+        if "nosnippet" in all_directives or any(d.startswith("max-snippet") for d in all_directives):
+            issues.append(
+                SEOIssue(
+                    code="PAGE_NOSNIPPET",
+                    severity="info",
+                    category="indexing",
+                    extra={"message": "nosnippet/max-snippet directive limits visible snippet; check if desired."},
+                )
+            )
+        if "noarchive" in all_directives:
+            issues.append(
+                SEOIssue(
+                    code="PAGE_NOARCHIVE",
+                    severity="info",
+                    category="indexing",
+                    extra={"message": "noarchive directive prevents cached copy from appearing in SERPs."},
+                )
+            )
+
+    @page_check("hreflang", "hreflang", facts=(FACTS_LINK_TAGS,), template=True)
+    def _check_hreflang(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+        html_lang = facts.html_lang
+
+        # HREFLANG
+        hreflang_links = facts.hreflang_links
+        hreflang_codes: List[str] = []
+        hreflang_relative_count = 0
+        href_by_code: Dict[str, List[str]] = {}
+
+        for code, href in hreflang_links:
+            hreflang_codes.append(code)
+            href_by_code.setdefault(code, []).append(href)
+            if not href.startswith("http"):
+                hreflang_relative_count += 1
+
+        metrics["hreflang_count"] = len(hreflang_links)
+        metrics["hreflang_codes"] = hreflang_codes
+        metrics["hreflang_relative_urls"] = hreflang_relative_count
+        metrics["hreflang_has_x_default"] = "x-default" in [c.lower() for c in hreflang_codes]
+
+        if hreflang_links:
+            # duplicados por código
+            for code, hrefs in href_by_code.items():
+                if len(hrefs) > 1:
                     issues.append(
                         SEOIssue(
-                            code="HREFLANG_RELATIVE_URL",
+                            code="HREFLANG_DUPLICATE_CODE",
                             severity="info",
                             category="hreflang",
-                            value=hreflang_relative_count,
-                            extra={"message": "Some hreflang links use relative URLs; absolute URLs are recommended."},
+                            value={"code": code, "urls": hrefs},
+                            extra={"message": "Multiple hreflang entries for same code."},
                         )
                     )
-                # self reference con lang HTML
-                if html_lang:
-                    lang_lower = html_lang.lower()
-                    codes_lower = [c.lower() for c in hreflang_codes]
-                    # aceptar coincidencia exacta o prefijo (es vs es-es)
-                    has_self = any(
-                        c == lang_lower or c.split("-")[0] == lang_lower.split("-")[0]
-                        for c in codes_lower
-                    )
-                    metrics["hreflang_has_self_reference"] = has_self
-                    if not has_self:
-                        issues.append(
-                            SEOIssue(
-                                code="HREFLANG_MISSING_SELF_REFERENCE",
-                                severity="info",
-                                category="hreflang",
-                                value={"html_lang": html_lang, "codes": hreflang_codes},
-                                extra={"message": "No hreflang entry matches the page's html[lang]."},
-                            )
-                        )
-                else:
-                    metrics["hreflang_has_self_reference"] = False
-            else:
-                metrics["hreflang_has_self_reference"] = False
-
-            # SOCIAL / OG / Twitter
-            og_tags = soup.find_all("meta", property=lambda v: v and v.startswith("og:"))
-            twitter_tags = soup.find_all("meta", attrs={"name": lambda v: v and v.startswith("twitter:")})
-            metrics["og_tags_count"] = len(og_tags)
-            metrics["twitter_tags_count"] = len(twitter_tags)
-
-            if len(og_tags) == 0:
+            if hreflang_relative_count:
                 issues.append(
                     SEOIssue(
-                        code="OG_TAGS_MISSING",
+                        code="HREFLANG_RELATIVE_URL",
                         severity="info",
-                        category="social",
-                        extra={"message": "No Open Graph tags found; social previews may be suboptimal."},
+                        category="hreflang",
+                        value=hreflang_relative_count,
+                        extra={"message": "Some hreflang links use relative URLs; absolute URLs are recommended."},
                     )
                 )
-
-            og_required = ["og:title", "og:description", "og:image", "og:url"]
-            for prop in og_required:
-                if not soup.find("meta", property=prop):
+            # self reference con lang HTML
+            if html_lang:
+                lang_lower = html_lang.lower()
+                codes_lower = [c.lower() for c in hreflang_codes]
+                # aceptar coincidencia exacta o prefijo (es vs es-es)
+                has_self = any(
+                    c == lang_lower or c.split("-")[0] == lang_lower.split("-")[0]
+                    for c in codes_lower
+                )
+                metrics["hreflang_has_self_reference"] = has_self
+                if not has_self:
                     issues.append(
                         SEOIssue(
-                            code=f"OG_{prop.split(':')[1].upper()}_MISSING",
+                            code="HREFLANG_MISSING_SELF_REFERENCE",
                             severity="info",
-                            category="social",
-                            extra={"message": f"Missing {prop} for optimal social sharing."},
+                            category="hreflang",
+                            value={"html_lang": html_lang, "codes": hreflang_codes},
+                            extra={"message": "No hreflang entry matches the page's html[lang]."},
                         )
                     )
+            else:
+                metrics["hreflang_has_self_reference"] = False
+        else:
+            metrics["hreflang_has_self_reference"] = False
 
-            og_type = None
-            og_type_tag = soup.find("meta", property="og:type")
-            if og_type_tag:
-                og_type = og_type_tag.get("content")
-            metrics["og_type"] = og_type
+    @page_check("social", "social", facts=(FACTS_META,), template=True)
+    def _check_social(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
 
-            fb_app_id = None
-            fb_app_tag = soup.find("meta", property="fb:app_id")
-            if fb_app_tag:
-                fb_app_id = fb_app_id_tag.get("content")
-            metrics["fb_app_id"] = fb_app_id
+        # SOCIAL / OG / Twitter
+        meta_properties = facts.meta_properties
+        metrics["og_tags_count"] = facts.og_tags_count
+        metrics["twitter_tags_count"] = facts.twitter_tags_count
+
+        if facts.og_tags_count == 0:
+            issues.append(
+                SEOIssue(
+                    code="OG_TAGS_MISSING",
+                    severity="info",
+                    category="social",
+                    extra={"message": "No Open Graph tags found; social previews may be suboptimal."},
+                )
+            )
 
-            if len(twitter_tags) == 0:
+        og_required = ["og:title", "og:description", "og:image", "og:url"]
+        for prop in og_required:
+            if prop not in meta_properties:
                 issues.append(
                     SEOIssue(
-                        code="TWITTER_TAGS_MISSING",
+                        code=f"OG_{prop.split(':')[1].upper()}_MISSING",
                         severity="info",
                         category="social",
-                        extra={"message": "No Twitter Card tags found; previews on X/Twitter will be generic."},
+                        extra={"message": f"Missing {prop} for optimal social sharing."},
                     )
                 )
 
-            # ENLACES
-            a_tags = soup.find_all("a")
-            internal_links = 0
-            external_links = 0
-            nofollow_links = 0
-            empty_anchor_text = 0
-            generic_anchor_text = 0
-            broken_internal_links = 0
+        metrics["og_type"] = meta_properties.get("og:type")
+        metrics["fb_app_id"] = meta_properties.get("fb:app_id")
 
-            generic_phrases = {"click here", "here", "más info", "leer más", "read more"}
+        if facts.twitter_tags_count == 0:
+            issues.append(
+                SEOIssue(
+                    code="TWITTER_TAGS_MISSING",
+                    severity="info",
+                    category="social",
+                    extra={"message": "No Twitter Card tags found; previews on X/Twitter will be generic."},
+                )
+            )
 
-            for a in a_tags:
-                href = (a.get("href") or "").strip()
-                if not href:
-                    continue
-                if href.startswith(("#", "javascript:", "mailto:", "tel:")):
-                    continue
-                full_url = urljoin(url, href)
-                text = a.get_text(" ", strip=True)
-                text_lower = text.lower()
-
-                rel_val = a.get("rel") or []
-                rel_str = " ".join(rel_val).lower() if isinstance(rel_val, (list, tuple)) else str(rel_val).lower()
-                is_nofollow = "nofollow" in rel_str
-                if is_nofollow:
-                    nofollow_links += 1
-
-                norm_link = self._normalize_for_visit(full_url)
-
-                if self._is_internal(full_url):
-                    internal_links += 1
-                    # registrar inbound link
-                    self.inbound_link_counts[norm_link] += 1
-
-                    if self.check_links:
-                        status_link = self._check_link_status(full_url)
-                        if not status_link or status_link >= 400:
-                            broken_internal_links += 1
-                            issues.append(
-                                SEOIssue(
-                                    code="BROKEN_INTERNAL_LINK",
-                                    severity="warning",
-                                    category="links",
-                                    value={"href": href, "status": status_link},
-                                    extra={"message": f"Internal link appears broken: {href} (status {status_link})."},
-                                )
-                            )
-                else:
-                    external_links += 1
+    @page_check("links", "links", facts=(FACTS_ANCHORS,))
+    def _check_links(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        url = ctx.url
 
-                if not text:
-                    empty_anchor_text += 1
-                elif text_lower in generic_phrases:
-                    generic_anchor_text += 1
+        # ENLACES
+        internal_links = 0
+        external_links = 0
+        nofollow_links = 0
+        empty_anchor_text = 0
+        generic_anchor_text = 0
 
-            metrics["internal_links"] = internal_links
-            metrics["external_links"] = external_links
-            metrics["nofollow_links"] = nofollow_links
-            metrics["empty_anchor_text_count"] = empty_anchor_text
-            metrics["generic_anchor_text_count"] = generic_anchor_text
-            metrics["broken_internal_links"] = broken_internal_links
+        generic_phrases = {"click here", "here", "más info", "leer más", "read more"}
 
-            if empty_anchor_text:
-                issues.append(
-                    SEOIssue(
-                        code="EMPTY_ANCHOR_TEXT",
-                        severity="warning",
-                        category="links",
-                        value=empty_anchor_text,
-                        extra={"message": "Some links have empty anchor text; hurts accessibility and SEO context."},
-                    )
+        for _href, _full_url, text, rel, internal in ctx.links:
+            text_lower = text.lower()
+
+            is_nofollow = "nofollow" in rel.lower()
+            if is_nofollow:
+                nofollow_links += 1
+
+            if internal:
+                internal_links += 1
+            else:
+                external_links += 1
+
+            if not text:
+                empty_anchor_text += 1
+            elif text_lower in generic_phrases:
+                generic_anchor_text += 1
+
+        metrics["internal_links"] = internal_links
+        metrics["external_links"] = external_links
+        metrics["nofollow_links"] = nofollow_links
+        metrics["empty_anchor_text_count"] = empty_anchor_text
+        metrics["generic_anchor_text_count"] = generic_anchor_text
+        # se rellena en _verify_links() tras auditar todas las páginas
+        metrics["broken_internal_links"] = 0
+
+        if empty_anchor_text:
+            issues.append(
+                SEOIssue(
+                    code="EMPTY_ANCHOR_TEXT",
+                    severity="warning",
+                    category="links",
+                    value=empty_anchor_text,
+                    extra={"message": "Some links have empty anchor text; hurts accessibility and SEO context."},
                 )
-            if generic_anchor_text:
-                issues.append(
-                    SEOIssue(
-                        code="GENERIC_ANCHOR_TEXT",
-                        severity="info",
-                        category="links",
-                        value=generic_anchor_text,
-                        extra={"message": "Some links use generic anchor text like 'click here'; use more descriptive anchors."},
-                    )
+            )
+        if generic_anchor_text:
+            issues.append(
+                SEOIssue(
+                    code="GENERIC_ANCHOR_TEXT",
+                    severity="info",
+                    category="links",
+                    value=generic_anchor_text,
+                    extra={"message": "Some links use generic anchor text like 'click here'; use more descriptive anchors."},
                 )
+            )
 
-            if internal_links == 0 and url != self.base_url:
-                issues.append(
-                    SEOIssue(
-                        code="NO_INTERNAL_OUTLINKS",
-                        severity="info",
-                        category="links",
-                        extra={"message": "Page has no internal outgoing links; consider linking to relevant pages."},
-                    )
+        if internal_links == 0 and url != self.base_url:
+            issues.append(
+                SEOIssue(
+                    code="NO_INTERNAL_OUTLINKS",
+                    severity="info",
+                    category="links",
+                    extra={"message": "Page has no internal outgoing links; consider linking to relevant pages."},
                 )
+            )
 
-            # IMÁGENES
-            img_tags = soup.find_all("img")
-            img_total = len(img_tags)
-            img_missing_alt = 0
-            img_empty_alt = 0
-            img_alt_with_focus = 0
-
-            for img in img_tags:
-                alt_val = img.get("alt")
-                if alt_val is None:
-                    img_missing_alt += 1
-                else:
-                    alt_str = alt_val.strip()
-                    if not alt_str:
-                        img_empty_alt += 1
-                    if focus_keywords:
-                        alt_low = alt_str.lower()
-                        if any(kw in alt_low for kw in focus_keywords):
-                            img_alt_with_focus += 1
-
-            metrics["images_total"] = img_total
-            metrics["images_missing_alt"] = img_missing_alt
-            metrics["images_empty_alt"] = img_empty_alt
-            metrics["images_alt_with_focus_keyword"] = img_alt_with_focus
-
-            if img_missing_alt:
-                issues.append(
-                    SEOIssue(
-                        code="IMAGES_MISSING_ALT",
-                        severity="warning",
-                        category="images",
-                        value=img_missing_alt,
-                        extra={"message": "Images without alt attribute; affects accessibility and image SEO."},
-                    )
+    @page_check("images", "images", facts=(FACTS_IMAGES,), requires=("focus_keywords",))
+    def _check_images(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+        focus_keywords = ctx.focus_keywords
+
+        # IMÁGENES
+        img_total = len(facts.image_alts)
+        img_missing_alt = 0
+        img_empty_alt = 0
+        img_alt_with_focus = 0
+
+        for alt_val in facts.image_alts:
+            if alt_val is None:
+                img_missing_alt += 1
+            else:
+                alt_str = alt_val.strip()
+                if not alt_str:
+                    img_empty_alt += 1
+                if focus_keywords:
+                    alt_low = alt_str.lower()
+                    if any(kw in alt_low for kw in focus_keywords):
+                        img_alt_with_focus += 1
+
+        metrics["images_total"] = img_total
+        metrics["images_missing_alt"] = img_missing_alt
+        metrics["images_empty_alt"] = img_empty_alt
+        metrics["images_alt_with_focus_keyword"] = img_alt_with_focus
+
+        if img_missing_alt:
+            issues.append(
+                SEOIssue(
+                    code="IMAGES_MISSING_ALT",
+                    severity="warning",
+                    category="images",
+                    value=img_missing_alt,
+                    extra={"message": "Images without alt attribute; affects accessibility and image SEO."},
                 )
-            if img_empty_alt:
-                issues.append(
-                    SEOIssue(
-                        code="IMAGES_EMPTY_ALT",
-                        severity="info",
-                        category="images",
-                        value=img_empty_alt,
-                        extra={"message": "Images with empty alt text; check if they should describe content."},
-                    )
+            )
+        if img_empty_alt:
+            issues.append(
+                SEOIssue(
+                    code="IMAGES_EMPTY_ALT",
+                    severity="info",
+                    category="images",
+                    value=img_empty_alt,
+                    extra={"message": "Images with empty alt text; check if they should describe content."},
                 )
-            if focus_keywords and img_total > 0 and img_alt_with_focus == 0:
-                issues.append(
-                    SEOIssue(
-                        code="IMAGES_ALT_MISSING_FOCUS_KEYWORDS",
-                        severity="info",
-                        category="images",
-                        value=focus_keywords,
-                        extra={"message": "No image alt text contains focus keywords; consider optimizing main visuals."},
-                    )
+            )
+        if focus_keywords and img_total > 0 and img_alt_with_focus == 0:
+            issues.append(
+                SEOIssue(
+                    code="IMAGES_ALT_MISSING_FOCUS_KEYWORDS",
+                    severity="info",
+                    category="images",
+                    value=focus_keywords,
+                    extra={"message": "No image alt text contains focus keywords; consider optimizing main visuals."},
                 )
+            )
 
-            # STRUCTURED DATA / SCHEMA.ORG
-            structured_blocks = 0
-            structured_types: Counter = Counter()
-            rating_values: List[float] = []
-            rating_counts: List[int] = []
-            schema_errors = 0
-            social_profiles: Set[str] = set()
-            has_website_schema = False
-            has_org_schema = False
-
-            for script in soup.find_all("script", type="application/ld+json"):
-                if not script.string:
-                    continue
-                structured_blocks += 1
-                try:
-                    data = json.loads(script.string)
-                except Exception:
-                    schema_errors += 1
-                    issues.append(
-                        SEOIssue(
-                            code="STRUCTURED_DATA_INVALID_JSON",
-                            severity="error",
-                            category="structured_data",
-                            extra={"message": "Invalid JSON-LD block; fix syntax errors."},
-                        )
-                    )
-                    continue
-
-                if isinstance(data, list):
-                    items = data
-                else:
-                    items = [data]
-
-                for item in items:
-                    if not isinstance(item, dict):
-                        continue
-                    t = item.get("@type")
-                    types_here: List[str] = []
-                    if isinstance(t, list):
-                        for tt in t:
-                            structured_types[str(tt)] += 1
-                            types_here.append(str(tt))
-                    elif isinstance(t, str):
-                        structured_types[t] += 1
-                        types_here.append(t)
-
-                    if "WebSite" in types_here:
-                        has_website_schema = True
-                    if any(tt in ("Organization", "LocalBusiness") for tt in types_here):
-                        has_org_schema = True
-
-                    same_as = item.get("sameAs")
-                    if isinstance(same_as, list):
-                        for url_sa in same_as:
-                            if isinstance(url_sa, str):
-                                social_profiles.add(url_sa)
-                    elif isinstance(same_as, str):
-                        social_profiles.add(same_as)
-
-                    agg = item.get("aggregateRating")
-                    if isinstance(agg, dict):
-                        rv = agg.get("ratingValue")
-                        rc = agg.get("reviewCount") or agg.get("ratingCount")
-                        try:
-                            if rv is not None:
-                                rating_values.append(float(rv))
-                        except (TypeError, ValueError):
-                            pass
-                        try:
-                            if rc is not None:
-                                rating_counts.append(int(rc))
-                        except (TypeError, ValueError):
-                            pass
-
-            metrics["structured_data_blocks"] = structured_blocks
-            metrics["structured_data_types"] = dict(structured_types)
-            metrics["structured_data_errors"] = schema_errors
-            metrics["rating_values"] = rating_values
-            metrics["rating_counts"] = rating_counts
-            metrics["rating_value_avg"] = sum(rating_values) / len(rating_values) if rating_values else None
-            metrics["rating_count_sum"] = sum(rating_counts) if rating_counts else 0
-            metrics["social_profiles_sameAs"] = sorted(social_profiles)
-            metrics["has_website_schema"] = has_website_schema
-            metrics["has_organization_schema"] = has_org_schema
-
-            if structured_blocks == 0:
+    @page_check("structured_data", "structured_data", facts=(FACTS_JSONLD,))
+    def _check_structured_data(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+
+        # STRUCTURED DATA / SCHEMA.ORG
+        structured_blocks = 0
+        structured_types: Counter = Counter()
+        rating_values: List[float] = []
+        rating_counts: List[int] = []
+        schema_errors = 0
+        social_profiles: Set[str] = set()
+        has_website_schema = False
+        has_org_schema = False
+
+        for block in facts.jsonld_blocks:
+            if not block:
+                continue
+            structured_blocks += 1
+            try:
+                data = json.loads(block)
+            except Exception:
+                schema_errors += 1
                 issues.append(
                     SEOIssue(
-                        code="STRUCTURED_DATA_MISSING",
-                        severity="info",
+                        code="STRUCTURED_DATA_INVALID_JSON",
+                        severity="error",
                         category="structured_data",
-                        extra={"message": "No JSON-LD structured data found; consider schema.org for key entities."},
+                        extra={"message": "Invalid JSON-LD block; fix syntax errors."},
                     )
                 )
+                continue
 
-            # Breadcrumbs
-            has_breadcrumb_schema = "BreadcrumbList" in structured_types
-            has_breadcrumb_markup = bool(soup.find(attrs={"itemtype": re.compile("BreadcrumbList", re.I)}))
-            metrics["has_breadcrumbs"] = has_breadcrumb_schema or has_breadcrumb_markup
+            if isinstance(data, list):
+                items = data
+            else:
+                items = [data]
 
-            # Formularios / labels
-            form_inputs = soup.find_all(["input", "textarea"])
-            inputs_without_label = 0
-            for inp in form_inputs:
-                if inp.get("type") in ("hidden", "submit", "button", "image", "reset"):
+            for item in items:
+                if not isinstance(item, dict):
                     continue
-                has_label = False
-                inp_id = inp.get("id")
-                if inp_id:
-                    label = soup.find("label", attrs={"for": inp_id})
-                    if label:
-                        has_label = True
-                if not has_label:
-                    parent = inp.parent
-                    while parent is not None and parent != soup:
-                        if parent.name == "label":
-                            has_label = True
-                            break
-                        parent = parent.parent
-                if not has_label:
-                    if inp.get("aria-label") or inp.get("aria-labelledby"):
-                        has_label = True
-                if not has_label:
-                    inputs_without_label += 1
-
-            metrics["form_inputs_without_label"] = inputs_without_label
-            if inputs_without_label:
-                issues.append(
-                    SEOIssue(
-                        code="FORM_INPUTS_WITHOUT_LABEL",
-                        severity="info",
-                        category="accessibility",
-                        value=inputs_without_label,
-                        extra={"message": "Form fields without label or aria-label; hurts accessibility."},
-                    )
+                t = item.get("@type")
+                types_here: List[str] = []
+                if isinstance(t, list):
+                    for tt in t:
+                        structured_types[str(tt)] += 1
+                        types_here.append(str(tt))
+                elif isinstance(t, str):
+                    structured_types[t] += 1
+                    types_here.append(t)
+
+                if "WebSite" in types_here:
+                    has_website_schema = True
+                if any(tt in ("Organization", "LocalBusiness") for tt in types_here):
+                    has_org_schema = True
+
+                same_as = item.get("sameAs")
+                if isinstance(same_as, list):
+                    for url_sa in same_as:
+                        if isinstance(url_sa, str):
+                            social_profiles.add(url_sa)
+                elif isinstance(same_as, str):
+                    social_profiles.add(same_as)
+
+                agg = item.get("aggregateRating")
+                if isinstance(agg, dict):
+                    rv = agg.get("ratingValue")
+                    rc = agg.get("reviewCount") or agg.get("ratingCount")
+                    try:
+                        if rv is not None:
+                            rating_values.append(float(rv))
+                    except (TypeError, ValueError):
+                        pass
+                    try:
+                        if rc is not None:
+                            rating_counts.append(int(rc))
+                    except (TypeError, ValueError):
+                        pass
+
+        metrics["structured_data_blocks"] = structured_blocks
+        metrics["structured_data_types"] = dict(structured_types)
+        metrics["structured_data_errors"] = schema_errors
+        metrics["rating_values"] = rating_values
+        metrics["rating_counts"] = rating_counts
+        metrics["rating_value_avg"] = sum(rating_values) / len(rating_values) if rating_values else None
+        metrics["rating_count_sum"] = sum(rating_counts) if rating_counts else 0
+        metrics["social_profiles_sameAs"] = sorted(social_profiles)
+        metrics["has_website_schema"] = has_website_schema
+        metrics["has_organization_schema"] = has_org_schema
+
+        if structured_blocks == 0:
+            issues.append(
+                SEOIssue(
+                    code="STRUCTURED_DATA_MISSING",
+                    severity="info",
+                    category="structured_data",
+                    extra={"message": "No JSON-LD structured data found; consider schema.org for key entities."},
                 )
+            )
 
-        except Exception as e:
+        # Breadcrumbs
+        has_breadcrumb_schema = "BreadcrumbList" in structured_types
+        metrics["has_breadcrumbs"] = has_breadcrumb_schema or facts.has_breadcrumb_markup
+
+    @page_check("form_labels", "accessibility", facts=(FACTS_FORMS,), template=True)
+    def _check_form_labels(self, ctx: PageContext) -> None:
+        issues = ctx.issues
+        metrics = ctx.metrics
+        facts = ctx.facts
+
+        # Formularios / labels
+        inputs_without_label = facts.inputs_without_label
+        metrics["form_inputs_without_label"] = inputs_without_label
+        if inputs_without_label:
             issues.append(
                 SEOIssue(
-                    code="EXCEPTION",
-                    severity="error",
-                    category="technical",
-                    value=str(e),
-                    extra={"message": "Unexpected exception while auditing URL."},
+                    code="FORM_INPUTS_WITHOUT_LABEL",
+                    severity="info",
+                    category="accessibility",
+                    value=inputs_without_label,
+                    extra={"message": "Form fields without label or aria-label; hurts accessibility."},
                 )
             )
-            status = 0
-            metrics["status"] = status
 
-        return SEOPageResult(url=url, status=status, metrics=metrics, issues=issues)
+    @page_check("near_duplicates", "content", facts=(FACTS_FINGERPRINT,))
+    def _check_near_duplicates(self, ctx: PageContext) -> None:
+        # solo el fingerprint; los grupos se forman en run() con todas las páginas
+        simhash = ctx.facts.text_simhash
+        ctx.metrics["content_simhash"] = f"{simhash:016x}" if simhash is not None else None
+
+    # ---------------------------
+    # Modo incremental
+    # ---------------------------
+    def _content_hash(self, resp: FetchedPage, html: str) -> str:
+        """Hash de todo lo que determina el resultado de una página: comprobaciones activas, HTML normalizado y cabeceras."""
+        normalized = _WHITESPACE_RE.sub(" ", _HASH_NOISE_RE.sub("", html)).strip()
+        digest = hashlib.sha256()
+        for part in (
+            AUDIT_STATE_VERSION,
+            ",".join(self.checks),
+            str(resp.status),
+            resp.headers.get("X-Robots-Tag") or "",
+            normalized,
+        ):
+            digest.update(part.encode("utf-8", errors="replace"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _carry_forward(previous: Dict[str, Any]) -> SEOPageResult:
+        """Reutiliza métricas e incidencias de una página sin cambios (salvo las que dependen de otras)."""
+        metrics = {k: v for k, v in previous["metrics"].items() if k not in CROSS_PAGE_METRICS}
+        if "broken_internal_links" in metrics:
+            metrics["broken_internal_links"] = 0
+        issues = [
+            SEOIssue(**i) for i in previous.get("issues", []) if i.get("code") not in CROSS_PAGE_ISSUE_CODES
+        ]
+        return SEOPageResult(
+            url=previous["url"],
+            status=previous["status"],
+            metrics=metrics,
+            issues=issues,
+            outlinks=[(href, full) for href, full in previous.get("outlinks") or []],
+            content_hash=previous["content_hash"],
+            reused=True,
+        )
 
     # ---------------------------
     # Ejecución
     # ---------------------------
-    def run(self) -> Dict[str, Any]:
-        self._fetch_robots()
+    def _robots_global_issues(self) -> List[SEOIssue]:
         global_issues: List[SEOIssue] = []
-
         if self.robots_status is None or self.robots_status == 0:
             global_issues.append(
                 SEOIssue(
@@ -1326,32 +2593,139 @@ class SEOAuditor:
                     extra={"message": "robots.txt disallows all crawling for User-agent: *."},
                 )
             )
-
-        if self.use_sitemap:
-            urls = self._get_urls_from_sitemap()
+        return global_issues
+
+    def _iter_page_results(self) -> Iterator[SEOPageResult]:
+        """Resultados por página, en orden de informe, a medida que terminan."""
+        frontier: Optional[List[str]] = None
+        frontier_links: Optional[List[List[int]]] = None
+        done = 0
+        if self.checkpoint:
+            state, pages = self.checkpoint.load()
+            if state is not None:
+                frontier, frontier_links = self._restore_checkpoint(state)
+                done = len(pages)
+                for page in pages:
+                    yield self._result_from_checkpoint(page)
+
+        if self.use_sitemap or self.local_site or self.sample_size:
+            results = self._audit_url_list(frontier)
         else:
-            urls = self._crawl_site_bfs()
+            results = self._crawl_site_bfs(frontier, scheduled=done, frontier_links=frontier_links)
+        for r in results:
+            # se anota antes de entregarlo: run() lo completa después (enlaces, entre páginas)
+            if self.checkpoint:
+                self.checkpoint.append_page(self._checkpoint_page(r))
+            yield r
+
+    def _audit_url_list(self, urls: Optional[List[str]] = None) -> Iterator[SEOPageResult]:
+        """Audita una lista fija de URLs: la del sitemap, la muestra de --sample o, offline, todos los HTML de la carpeta."""
+        if urls is None:
+            if self.sample_size:
+                with self._phase("sampling"):
+                    urls = self._draw_sample()
+            elif self.use_sitemap:
+                with self._phase("sitemap"):
+                    urls = self._get_urls_from_sitemap()
+            else:
+                urls = [u for u in self.local_site.urls() if self._robots_allowed(u)]
+                if self.frontier_order == FRONTIER_PRIORITY:
+                    urls.sort(key=lambda u: -self._url_score(u, path_depth(u)))
+                urls = urls[: self.max_pages]
+        # audit_url no comparte estado mutable salvo link_status_cache (con lock);
+        # los resultados salen en el orden de `urls`. Se envían por tandas (no pool.map)
+        # para dejar de empezar páginas en cuanto se agota --time-budget.
+        done = 0
+        in_flight: deque = deque()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                while done + len(in_flight) < len(urls) and len(in_flight) < 2 * self.workers:
+                    if self._out_of_time():
+                        break
+                    in_flight.append(pool.submit(self.audit_url, urls[done + len(in_flight)]))
+                if not in_flight:
+                    break
+                result = in_flight.popleft().result()
+                done += 1
+                yield result
+                if self.checkpoint and self.checkpoint.due():
+                    self._save_checkpoint(urls[done:])
+        self.frontier_pending = len(urls) - done
 
-        pages_results: List[SEOPageResult] = []
-        for url in urls:
-            result = self.audit_url(url)
-            pages_results.append(result)
+    # ---------------------------
+    # Checkpoints
+    # ---------------------------
+    def _save_checkpoint(
+        self, frontier: List[str], seen: Optional[URLSeenSet] = None, frontier_links: Optional[List[List[int]]] = None
+    ) -> None:
+        if self.link_store:
+            self.link_store.flush()
+        with self._link_status_lock:
+            link_statuses = dict(self.link_status_cache)
+        self.checkpoint.save_state(
+            {
+                "frontier": frontier,
+                "frontier_links": frontier_links,
+                "elapsed": self._elapsed(),
+                "seen": base64.b64encode(seen.to_bytes()).decode("ascii") if seen else None,
+                "robots_blocked": sorted(self.robots_blocked),
+                "traps": self.traps.to_dict(),
+                "templates": self.templates.to_list() if self.templates else None,
+                "sample_strata": self.sample_strata,
+                "link_status_cache": link_statuses,
+                "sitemap_entries": {
+                    url: [entry.lastmod, entry.priority]
+                    for url in frontier
+                    for entry in [self.sitemap_entries.get(url)]
+                    if entry
+                },
+            }
+        )
 
-        # Duplicados de title y meta description entre páginas
-        title_map: Dict[str, List[SEOPageResult]] = {}
-        desc_map: Dict[str, List[SEOPageResult]] = {}
+    def _restore_checkpoint(self, state: Dict[str, Any]) -> Tuple[List[str], Optional[List[List[int]]]]:
+        """Recupera el estado guardado y devuelve la cola pendiente (con profundidad y enlaces entrantes)."""
+        if state["seen"]:
+            self.seen = URLSeenSet.from_bytes(base64.b64decode(state["seen"]))
+        self.robots_blocked.update(state["robots_blocked"])
+        self.traps.restore(state["traps"])
+        if self.templates:
+            self.templates.restore(state["templates"])
+        self.sample_strata = state["sample_strata"]
+        self.link_status_cache.update(state["link_status_cache"])
+        for url, (lastmod, priority) in state["sitemap_entries"].items():
+            self.sitemap_entries[url] = SitemapEntry(url, lastmod, priority)
+        self._elapsed_before = state["elapsed"]
+        return state["frontier"], state["frontier_links"]
 
-        for r in pages_results:
-            title = (r.metrics.get("title") or "").strip()
-            if title:
-                title_map.setdefault(title, []).append(r)
-            desc = (r.metrics.get("meta_description") or "").strip()
-            if desc:
-                desc_map.setdefault(desc, []).append(r)
-
-        for title, plist in title_map.items():
-            if len(plist) > 1:
-                urls_dup = [p.url for p in plist]
+    @staticmethod
+    def _checkpoint_page(r: SEOPageResult) -> Dict[str, Any]:
+        return dict(SEOAuditor._page_to_dict(r, incremental_state=True), reused=r.reused)
+
+    @staticmethod
+    def _result_from_checkpoint(page: Dict[str, Any]) -> SEOPageResult:
+        return SEOPageResult(
+            url=page["url"],
+            status=page["status"],
+            metrics=page["metrics"],
+            issues=[SEOIssue(**i) for i in page["issues"]],
+            outlinks=[(href, full) for href, full in page["outlinks"]],
+            content_hash=page["content_hash"],
+            reused=page["reused"],
+        )
+
+    def _cross_page_issues(
+        self, aggregates: "_SiteAggregates", graph: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[SEOIssue], Dict[str, List[SEOIssue]], Dict[str, Dict[str, Any]]]:
+        """Incidencias entre páginas: globales, por URL y métricas por URL."""
+        global_issues: List[SEOIssue] = []
+        page_issues: Dict[str, List[SEOIssue]] = {}
+        page_metrics: Dict[str, Dict[str, Any]] = {}
+
+        # Duplicados de title y meta description entre páginas
+        titles = aggregates.titles if "duplicate_titles" in self.checks else {}
+        descriptions = aggregates.descriptions if "duplicate_meta_descriptions" in self.checks else {}
+        for title, urls_dup in titles.items():
+            if len(urls_dup) > 1:
                 global_issues.append(
                     SEOIssue(
                         code="DUPLICATE_TITLE_GROUP",
@@ -1361,8 +2735,8 @@ class SEOAuditor:
                         extra={"urls": urls_dup},
                     )
                 )
-                for p in plist:
-                    p.issues.append(
+                for u in urls_dup:
+                    page_issues.setdefault(u, []).append(
                         SEOIssue(
                             code="TITLE_DUPLICATED",
                             severity="warning",
@@ -1372,9 +2746,8 @@ class SEOAuditor:
                         )
                     )
 
-        for desc, plist in desc_map.items():
-            if len(plist) > 1:
-                urls_dup = [p.url for p in plist]
+        for desc, urls_dup in descriptions.items():
+            if len(urls_dup) > 1:
                 global_issues.append(
                     SEOIssue(
                         code="DUPLICATE_META_DESC_GROUP",
@@ -1384,8 +2757,8 @@ class SEOAuditor:
                         extra={"urls": urls_dup},
                     )
                 )
-                for p in plist:
-                    p.issues.append(
+                for u in urls_dup:
+                    page_issues.setdefault(u, []).append(
                         SEOIssue(
                             code="META_DESC_DUPLICATED",
                             severity="warning",
@@ -1395,13 +2768,38 @@ class SEOAuditor:
                         )
                     )
 
+        # Contenido casi duplicado (SimHash del texto principal)
+        if "near_duplicates" in self.checks:
+            for cluster in near_duplicate_clusters(aggregates.fingerprints, self.near_dup_distance):
+                global_issues.append(
+                    SEOIssue(
+                        code="NEAR_DUPLICATE_CONTENT_GROUP",
+                        severity="warning",
+                        category="content",
+                        value=len(cluster),
+                        limit=self.near_dup_distance,
+                        extra={"urls": cluster},
+                    )
+                )
+                for u in cluster:
+                    page_issues.setdefault(u, []).append(
+                        SEOIssue(
+                            code="CONTENT_NEAR_DUPLICATE",
+                            severity="warning",
+                            category="content",
+                            extra={
+                                "urls_near_duplicate": cluster,
+                                "message": "Main text is nearly identical to other pages; consolidate or differentiate it.",
+                            },
+                        )
+                    )
+
         # Enlaces entrantes (orphan pages aproximadas)
-        for r in pages_results:
-            norm = self._normalize_for_visit(r.url)
-            inbound = self.inbound_link_counts.get(norm, 0)
-            r.metrics["inbound_internal_links"] = int(inbound)
-            if inbound == 0 and r.url != self.base_url:
-                r.issues.append(
+        for u in aggregates.urls if "orphan_pages" in self.checks else ():
+            inbound = self.inbound_link_counts.get(self._normalize_for_visit(u), 0)
+            page_metrics.setdefault(u, {})["inbound_internal_links"] = int(inbound)
+            if inbound == 0 and u != self.base_url:
+                page_issues.setdefault(u, []).append(
                     SEOIssue(
                         code="POSSIBLE_ORPHAN_PAGE",
                         severity="info",
@@ -1410,43 +2808,345 @@ class SEOAuditor:
                     )
                 )
 
+        # Grafo de enlaces: PageRank interno, profundidad de clics y componentes
+        graph_nodes = graph["nodes"] if graph else {}
+        for u in aggregates.urls if graph_nodes else ():
+            node = graph_nodes.get(self._normalize_for_visit(u))
+            if node is None:
+                continue
+            depth = node["click_depth"]
+            page_metrics.setdefault(u, {}).update({
+                "internal_pagerank": node["internal_pagerank"],
+                "click_depth": depth,
+                "link_scc_size": node["scc_size"],
+            })
+            if depth is None:
+                page_issues.setdefault(u, []).append(
+                    SEOIssue(
+                        code="UNREACHABLE_FROM_HOMEPAGE",
+                        severity="info",
+                        category="links",
+                        extra={"message": "No chain of internal links from the homepage reaches this URL within crawled pages."},
+                    )
+                )
+            elif depth > CLICK_DEPTH_LIMIT:
+                page_issues.setdefault(u, []).append(
+                    SEOIssue(
+                        code="CLICK_DEPTH_HIGH",
+                        severity="info",
+                        category="links",
+                        value=depth,
+                        limit=CLICK_DEPTH_LIMIT,
+                        extra={"message": "Page is many clicks away from the homepage; link it from higher-level pages."},
+                    )
+                )
+
+        return global_issues, page_issues, page_metrics
+
+    def run(self, page_sink: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Audita el sitio y devuelve el informe.
+
+        Con `page_sink`, cada página se entrega serializada en cuanto termina y no se
+        guarda en memoria; el informe devuelto es entonces solo el resumen, con las
+        incidencias entre páginas en `page_issues`/`page_metrics`.
+        """
+        global_issues: List[SEOIssue] = []
+        self._started = time.monotonic()
+        if self.respect_robots or "robots_txt" in self.checks:
+            with self._phase("robots_txt"):
+                self._fetch_robots()
+        if "robots_txt" in self.checks:
+            global_issues.extend(self._robots_global_issues())
+
+        streaming = page_sink is not None
+        verify_links = self.check_links and "broken_links" in self.checks
+        pages_results: List[SEOPageResult] = []
+        aggregates = _SiteAggregates()
+        severity_counts: Counter = Counter()
+        total_pages = 0
+        reused_pages = 0
+        # streaming con --check-links: pool de comprobación compartido y futures por URL destino
+        link_pool = ThreadPoolExecutor(max_workers=self.workers) if streaming and verify_links else None
+        link_futures: Dict[str, Future] = {}
+        waiting: deque = deque()
+
+        for r in self._iter_page_results():
+            total_pages += 1
+            reused_pages += int(r.reused)
+            if not streaming:
+                pages_results.append(r)
+                continue
+            if not verify_links:
+                self._emit(r, aggregates, severity_counts, page_sink)
+                continue
+            # enlaces comprobados en segundo plano, cada destino una sola vez en todo el
+            # rastreo; las páginas salen en orden en cuanto tienen sus enlaces resueltos
+            self._submit_link_checks(link_pool, r, link_futures)
+            waiting.append(r)
+            while waiting and (len(waiting) > LINK_CHECK_WINDOW or self._links_checked(waiting[0], link_futures)):
+                self._emit_checked(waiting.popleft(), link_futures, aggregates, severity_counts, page_sink)
+        while waiting:
+            self._emit_checked(waiting.popleft(), link_futures, aggregates, severity_counts, page_sink)
+        if link_pool:
+            link_pool.shutdown()
+
+        if not streaming:
+            if verify_links:
+                with self._phase("link_checks"):
+                    self._verify_links(pages_results)
+            with self._phase("aggregation"):
+                for r in pages_results:
+                    self._collect(r, aggregates)
+        if self.link_store:
+            self.link_store.flush()
+
+        if self.robots_blocked and "robots_txt" in self.checks:
+            global_issues.append(self._robots_blocked_issue())
+        if self.traps.suppressed_urls:
+            global_issues.append(self._crawl_traps_issue())
+        if self.time_budget_exhausted:
+            global_issues.append(self._time_budget_issue())
+
+        with self._phase("link_graph"):
+            graph = self._compute_link_graph()
+        with self._phase("aggregation"):
+            cross_issues, page_issues, page_metrics = self._cross_page_issues(aggregates, graph)
+        global_issues.extend(cross_issues)
+
         # Conteo global de errores/avisos
-        total_errors = 0
-        total_warnings = 0
-        for i in global_issues:
-            if i.severity == "error":
-                total_errors += 1
-            elif i.severity == "warning":
-                total_warnings += 1
+        severity_counts.update(i.severity for i in global_issues)
+        if streaming:
+            for issues in page_issues.values():
+                severity_counts.update(i.severity for i in issues)
         for r in pages_results:
-            for i in r.issues:
-                if i.severity == "error":
-                    total_errors += 1
-                elif i.severity == "warning":
-                    total_warnings += 1
+            r.metrics.update(page_metrics.get(r.url, {}))
+            r.issues.extend(page_issues.get(r.url, []))
+            severity_counts.update(i.severity for i in r.issues)
 
-        report = {
+        report: Dict[str, Any] = {
             "base_url": self.base_url,
-            "total_pages": len(pages_results),
-            "total_errors": total_errors,
-            "total_warnings": total_warnings,
+            "total_pages": total_pages,
+            "total_errors": severity_counts["error"],
+            "total_warnings": severity_counts["warning"],
             "global_issues": [asdict(i) for i in global_issues],
-            "pages": [
-                {
-                    "url": r.url,
-                    "status": r.status,
-                    "metrics": r.metrics,
-                    "issues": [asdict(i) for i in r.issues],
-                }
-                for r in pages_results
-            ],
         }
+        if streaming:
+            report["page_issues"] = {u: [asdict(i) for i in issues] for u, issues in page_issues.items()}
+            report["page_metrics"] = page_metrics
+        else:
+            report["pages"] = [self._page_to_dict(r, self.incremental) for r in pages_results]
+        if self.incremental:
+            report["incremental"] = {"reused_pages": reused_pages, "audited_pages": total_pages - reused_pages}
+        if graph:
+            report["link_graph"] = graph["summary"]
+        if self.templates:
+            report["templates"] = self.templates.summary()
+        if self.sample_size:
+            report["sample"] = self._sample_summary(aggregates)
+        if self.frontier_order == FRONTIER_PRIORITY or self.time_budget:
+            report["frontier"] = {
+                "order": self.frontier_order,
+                "time_budget_seconds": self.time_budget or None,
+                "elapsed_seconds": round(self._elapsed(), 1),
+                "time_budget_exhausted": self.time_budget_exhausted,
+                "pending_urls": self.frontier_pending,
+            }
+        if self.profiler:
+            report["profile"] = self.profiler.summary(self.workers)
         return report
 
+    def _emit(
+        self,
+        r: SEOPageResult,
+        aggregates: "_SiteAggregates",
+        severity_counts: Counter,
+        page_sink: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """Streaming: agrega la página y la entrega serializada."""
+        with self._phase("aggregation"):
+            self._collect(r, aggregates)
+        severity_counts.update(i.severity for i in r.issues)
+        page_sink(self._page_to_dict(r, self.incremental))
+
+    def _emit_checked(
+        self,
+        r: SEOPageResult,
+        futures: Dict[str, Future],
+        aggregates: "_SiteAggregates",
+        severity_counts: Counter,
+        page_sink: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """Streaming con --check-links: espera a los enlaces de la página, anota los rotos y la entrega."""
+        with self._phase("link_checks"):
+            statuses = {full: futures[full].result() for _href, full in r.outlinks if full in futures}
+        self._apply_link_statuses(r, statuses)
+        self._emit(r, aggregates, severity_counts, page_sink)
+
+    def _collect(self, r: SEOPageResult, aggregates: "_SiteAggregates") -> None:
+        """Guarda de una página solo lo que necesitan las comprobaciones entre páginas."""
+        aggregates.urls.append(r.url)
+        title = (r.metrics.get("title") or "").strip()
+        if title:
+            aggregates.titles.setdefault(title, []).append(r.url)
+        desc = (r.metrics.get("meta_description") or "").strip()
+        if desc:
+            aggregates.descriptions.setdefault(desc, []).append(r.url)
+        simhash = r.metrics.get("content_simhash")
+        if simhash:
+            aggregates.fingerprints[r.url] = int(simhash, 16)
+        if self.templates and r.metrics.get("template_id"):
+            self.templates.add_page(r.metrics["template_id"], r.url)
+        if self.sample_size:
+            aggregates.sampled_issues.append((r.url, {i.code for i in r.issues}))
+            for i in r.issues:
+                aggregates.issue_kinds.setdefault(i.code, (i.severity, i.category))
+        targets = [self._normalize_for_visit(full) for _href, full in r.outlinks]
+        self.inbound_link_counts.update(targets)
+        if "link_graph" in self.checks:
+            self.link_graph.add_page(self._normalize_for_visit(r.url), targets)
+
+    def _sample_summary(self, aggregates: "_SiteAggregates") -> Dict[str, Any]:
+        """Prevalencia estimada de cada incidencia en el sitio, con su intervalo de confianza."""
+        estimates = estimate_prevalence(aggregates.sampled_issues, self.sample_strata, self.sample_confidence)
+        issues = []
+        for code, estimate in estimates["issues"].items():
+            severity, category = aggregates.issue_kinds[code]
+            issues.append(dict(code=code, severity=severity, category=category, **estimate))
+        issues.sort(key=lambda i: (-i["prevalence"], i["code"]))
+        sampled = Counter(stratum_of(url) for url, _codes in aggregates.sampled_issues)
+        strata = sorted(self.sample_strata.items(), key=lambda kv: (-kv[1], kv[0]))
+        return {
+            "population": sum(self.sample_strata.values()),
+            "population_covered": estimates["population_covered"],
+            "sample_size": estimates["sample_size"],
+            "confidence": estimates["confidence"],
+            "seed": self.sample_seed,
+            "strata": [{"stratum": s, "population": n, "sampled": sampled[s]} for s, n in strata],
+            "issues": issues,
+        }
+
+    def _compute_link_graph(self) -> Optional[Dict[str, Any]]:
+        """Métricas del grafo de enlaces, o None si no se pidieron o falta NumPy/SciPy."""
+        if "link_graph" not in self.checks:
+            return None
+        if not link_graph.available():
+            print("[WARNING] link_graph needs numpy and scipy; skipping PageRank/click depth.", file=sys.stderr)
+            return None
+        return self.link_graph.compute(self._normalize_for_visit(self.base_url))
+
+    @staticmethod
+    def _page_to_dict(r: SEOPageResult, incremental_state: bool = False) -> Dict[str, Any]:
+        """Página serializada; con `incremental_state`, también el hash y los enlaces que necesita --incremental."""
+        page = {
+            "url": r.url,
+            "status": r.status,
+            "metrics": r.metrics,
+            "issues": [asdict(i) for i in r.issues],
+        }
+        if incremental_state:
+            page["content_hash"] = r.content_hash
+            page["outlinks"] = r.outlinks
+        return page
+
+
+# ---------------------------
+# Informe en streaming (JSON Lines)
+# ---------------------------
+class JSONLReportWriter:
+    """
+    Escribe el informe como JSON Lines: una cabecera, una línea por página en cuanto
+    se audita y el resumen al final. Cada línea se vuelca a disco al escribirla, así
+    que un informe a medias (proceso cortado) conserva las páginas ya auditadas.
+    """
+
+    def __init__(self, path: str, base_url: str):
+        self.path = path
+        self._f = open(path, "w", encoding="utf-8")
+        self._write({"type": "header", "base_url": base_url, "started_at": datetime.datetime.now().isoformat()})
+
+    def write_page(self, page: Dict[str, Any]) -> None:
+        self._write({"type": "page", **page})
+
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        self._write({"type": "summary", **summary})
+
+    def close(self) -> None:
+        self._f.close()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._f.flush()
+
+
+def read_jsonl_report(path: str) -> Dict[str, Any]:
+    """Reconstruye un informe .jsonl con la forma del .json (base_url + pages); tolera informes a medias."""
+    report: Dict[str, Any] = {"pages": []}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # última línea truncada si el proceso se cortó
+                break
+            kind = record.pop("type", None)
+            if kind == "page":
+                report["pages"].append(record)
+            elif kind in ("header", "summary"):
+                record.pop("started_at", None)
+                report.update(record)
+    return report
+
+
+def _read_report(path: str) -> Dict[str, Any]:
+    if path.endswith(".jsonl"):
+        return read_jsonl_report(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_previous_report(base_url: str, path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Carga el informe indicado o, si no se indica, el más reciente de Reports/ para el mismo sitio."""
+    if path:
+        return _read_report(path)
+
+    base_url = SEOAuditor._normalize_base_url(base_url)
+    candidates = glob.glob(os.path.join(REPORTS_DIR, "seo_report_*.json")) + glob.glob(
+        os.path.join(REPORTS_DIR, "seo_report_*.jsonl")
+    )
+    # el nombre lleva la fecha: orden alfabético = cronológico
+    for candidate in sorted(candidates, key=lambda c: os.path.splitext(os.path.basename(c))[0], reverse=True):
+        try:
+            report = _read_report(candidate)
+        except (OSError, ValueError):
+            continue
+        if report.get("base_url") == base_url:
+            return report
+    return None
+
+
+def _checks_epilog() -> str:
+    by_category: Dict[str, List[str]] = {}
+    for check in CHECKS.values():
+        by_category.setdefault(check.category, []).append(check.name + ("*" if check.template else ""))
+    lines = ["Comprobaciones por categoría (para --checks / --skip-checks):"]
+    for category in sorted(by_category):
+        lines.append(f"  {category}: {', '.join(by_category[category])}")
+    lines.append("  (* de plantilla: con --templates se ejecutan una vez por plantilla)")
+    return "\n".join(lines)
+
+
+def _csv_list(value: str) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Maximized HTML/SEO on-page auditor (sin PageSpeed).")
-    parser.add_argument("url", help="Base URL (e.g. https://pablocirre.es)")
+    parser = argparse.ArgumentParser(
+        description="Maximized HTML/SEO on-page auditor (sin PageSpeed).",
+        epilog=_checks_epilog(),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("url", nargs="?", help="Base URL (e.g. https://pablocirre.es)")
     parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Máximo de páginas a auditar.")
     parser.add_argument(
         "--timeout",
@@ -1468,12 +3168,231 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         action="store_true",
         help="Comprobar si los enlaces internos están rotos (requiere peticiones extra).",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Peticiones HTTP simultáneas al rastrear y auditar páginas (por defecto {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=html_backend.CHOICES,
+        default=html_backend.AUTO,
+        help="Parser HTML (por defecto el más rápido instalado: lxml > selectolax > html.parser).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="No usar la caché HTTP en disco (descarga todo de nuevo, sin revalidar).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Directorio de la caché HTTP (por defecto Reports/.cache/http).",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+        help="Tamaño máximo de la caché HTTP en MB; se expulsan las entradas menos usadas.",
+    )
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="REPORT",
+        help="Reauditar solo las páginas cuyo HTML cambió respecto a un informe anterior "
+             "(por defecto el último de Reports/ para el mismo sitio). Solo los informes generados con "
+             "--incremental guardan el hash y los enlaces de cada página; sin ellos se audita todo.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "jsonl"),
+        default="json",
+        help="Formato del informe. jsonl escribe cada página en cuanto se audita, sin acumular "
+             "el informe en memoria (recomendado para sitios grandes).",
+    )
+    parser.add_argument(
+        "--max-body-mb",
+        type=float,
+        default=DEFAULT_MAX_BODY_BYTES / (1024 * 1024),
+        help="Tamaño máximo en MB de una página HTML; las mayores se cortan y se marcan como "
+             "HTML_TOO_LARGE (por defecto 10; 0 sin límite). Lo que no es HTML nunca se descarga.",
+    )
+    parser.add_argument(
+        "--no-link-cache",
+        action="store_true",
+        help="No reutilizar estados de enlaces de ejecuciones anteriores (Reports/.cache/link_status.sqlite).",
+    )
+    parser.add_argument(
+        "--link-ttl-internal",
+        type=float,
+        default=DEFAULT_INTERNAL_TTL / 3600,
+        help="Horas que se da por bueno el estado guardado de un enlace interno (por defecto 24).",
+    )
+    parser.add_argument(
+        "--link-ttl-external",
+        type=float,
+        default=DEFAULT_EXTERNAL_TTL / 3600,
+        help="Horas que se da por bueno el estado guardado de un enlace externo (por defecto 168).",
+    )
+    parser.add_argument(
+        "--checks",
+        type=_csv_list,
+        help="Ejecutar solo estas comprobaciones o categorías, separadas por comas "
+             "(p. ej. indexing o canonical,meta_robots). Solo se extraen las señales que necesitan.",
+    )
+    parser.add_argument(
+        "--skip-checks",
+        type=_csv_list,
+        help="Comprobaciones o categorías a omitir, separadas por comas (p. ej. structured_data,form_labels). "
+             "Se mantienen las que necesitan otras (headings e images usan focus_keywords).",
+    )
+    parser.add_argument(
+        "--near-dup-distance",
+        type=int,
+        default=DEFAULT_NEAR_DUP_DISTANCE,
+        help="Bits de diferencia (de 64) entre SimHash para agrupar páginas como casi duplicadas (por defecto 3).",
+    )
+    parser.add_argument(
+        "--ignore-robots",
+        action="store_true",
+        help="Rastrear también las URLs prohibidas por robots.txt y no aplicar su Crawl-delay "
+             "(p. ej. para un entorno de staging propio).",
+    )
+    parser.add_argument(
+        "--pattern-budget",
+        type=int,
+        default=DEFAULT_PATTERN_BUDGET,
+        help="URLs distintas que se rastrean como mucho por patrón de URL (números, fechas e ids "
+             f"sustituidos, p. ej. /agenda/{{n}}/{{n}}); evita calendarios y paginaciones infinitas "
+             "en sitios propensos a trampas (por defecto 0, sin límite: un catálogo normal tiene miles "
+             "de URLs con el mismo patrón).",
+    )
+    parser.add_argument(
+        "--max-url-length",
+        type=int,
+        default=DEFAULT_MAX_URL_LENGTH,
+        help=f"No rastrear URLs más largas que esto (por defecto {DEFAULT_MAX_URL_LENGTH}; 0 sin límite).",
+    )
+    parser.add_argument(
+        "--templates",
+        action="store_true",
+        help="Agrupar las páginas por plantilla (profundidad y extensión de la ruta + esqueleto DOM) y ejecutar las "
+             "comprobaciones de plantilla (html lang, doctype/viewport, Open Graph, hreflang, "
+             "formularios) solo en una página de cada grupo; las de contenido, en todas.",
+    )
+    parser.add_argument(
+        "--frontier",
+        choices=FRONTIER_ORDERS,
+        help="Orden de la cola de rastreo: bfs (por niveles) o priority (primero lo más importante según "
+             "priority/lastmod del sitemap, profundidad de clics y enlaces entrantes; las URLs del sitemap "
+             "entran en la cola desde el principio). Por defecto bfs, o priority si hay --time-budget.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=0.0,
+        metavar="MINUTES",
+        help="Minutos de rastreo (p. ej. la ventana de CI): agotados, no se empiezan más páginas; se terminan "
+             "las que están en curso, la verificación de enlaces y el informe (por defecto sin límite).",
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Auditar solo una muestra aleatoria de N URLs, estratificada por directorio y tipo de URL, "
+             "y estimar el porcentaje de páginas del sitio con cada incidencia (con intervalo de confianza). "
+             "La población es el sitemap (--use-sitemap), la carpeta offline o, si no, las URLs que "
+             "descubre un rastreo previo de solo enlaces de hasta --max-pages páginas. Se omiten las "
+             "comprobaciones entre páginas (duplicados, huérfanas, grafo de enlaces).",
+    )
+    parser.add_argument(
+        "--sample-seed",
+        type=int,
+        help="Semilla de la muestra, para repetir exactamente la misma selección.",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        choices=sorted(Z_SCORES),
+        default=DEFAULT_SAMPLE_CONFIDENCE,
+        help=f"Nivel de confianza de los intervalos de --sample (por defecto {DEFAULT_SAMPLE_CONFIDENCE}).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Medir el tiempo por fase (descarga, parseo, cada categoría de comprobaciones, enlaces, "
+             "agregación) y por URL; se guarda en el informe y se imprime una tabla por stderr.",
+    )
+    parser.add_argument(
+        "--offline",
+        metavar="DIR",
+        help="Auditar una carpeta de HTML ya renderizado (p. ej. un export estático) sin hacer "
+             "peticiones: cada fichero se sirve como la URL equivalente bajo la URL base "
+             f"(por defecto {OFFLINE_BASE_URL}). Se auditan todos los .html, hasta --max-pages.",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        metavar="SECONDS",
+        help="Cada cuántos segundos se guarda el estado del rastreo en Reports/.cache/checkpoints "
+             "para poder reanudarlo (0 lo desactiva). Por defecto, cada 60 s solo en rastreos largos: "
+             f"--max-pages {CHECKPOINT_MIN_PAGES} o más, o con --time-budget.",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Continuar un rastreo interrumpido desde su último checkpoint, con las mismas opciones "
+             "(el run id se muestra al empezar).",
+    )
+    args = parser.parse_args(argv)
+    if args.resume:
+        options = CrawlCheckpoint(CHECKPOINTS_DIR, args.resume).load_options()
+        if options is None:
+            parser.error(f"no checkpoint found for run id {args.resume!r}")
+        # opciones añadidas después de guardar el checkpoint: valor por defecto
+        defaults = vars(parser.parse_args([]))
+        args = argparse.Namespace(**{**defaults, **options, "resume": args.resume})
+    elif not args.url:
+        if not args.offline:
+            parser.error("the following arguments are required: url")
+        args.url = OFFLINE_BASE_URL
+    try:
+        resolve_checks(args.checks, args.skip_checks)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
 
 
 def main() -> None:
     args = parse_args(sys.argv[1:])
 
+    checkpoint = None
+    interval = args.checkpoint_interval
+    if interval is None:
+        # un audit corto no deja rastro en disco; uno largo (o uno que se reanuda) sí
+        long_crawl = args.resume or args.max_pages >= CHECKPOINT_MIN_PAGES or args.time_budget
+        interval = DEFAULT_CHECKPOINT_INTERVAL if long_crawl else 0
+    if interval > 0:
+        run_id = args.resume or CrawlCheckpoint.new_run_id()
+        checkpoint = CrawlCheckpoint(CHECKPOINTS_DIR, run_id, interval=interval)
+        if not args.resume:
+            checkpoint.save_options(vars(args))
+        print(f"[INFO] Run id: {run_id} (if interrupted, continue with --resume {run_id})", file=sys.stderr)
+
+    previous_report = None
+    if args.incremental is not None:
+        previous_report = load_previous_report(args.url, args.incremental or None)
+        if previous_report is None:
+            print("[WARNING] No previous report found; running a full audit.", file=sys.stderr)
+            previous_report = {}
+        elif not any(p.get("content_hash") for p in previous_report.get("pages", [])):
+            print("[WARNING] Previous report was not generated with --incremental; running a full audit.",
+                  file=sys.stderr)
+
     auditor = SEOAuditor(
         base_url=args.url,
         max_pages=args.max_pages,
@@ -1481,23 +3400,57 @@ def main() -> None:
         use_sitemap=args.use_sitemap,
         sitemap_url=args.sitemap_url,
         check_links=args.check_links,
+        workers=args.workers,
+        parser=args.parser,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+        previous_report=previous_report,
+        link_cache_path=None if args.no_link_cache else DEFAULT_LINK_CACHE,
+        link_ttl_internal=args.link_ttl_internal * 3600,
+        link_ttl_external=args.link_ttl_external * 3600,
+        checks=args.checks,
+        skip_checks=args.skip_checks,
+        profile=args.profile,
+        near_dup_distance=args.near_dup_distance,
+        respect_robots=not args.ignore_robots,
+        checkpoint=checkpoint,
+        max_body_bytes=int(args.max_body_mb * 1024 * 1024),
+        local_root=args.offline,
+        pattern_budget=args.pattern_budget,
+        max_url_length=args.max_url_length,
+        templates=args.templates,
+        sample_size=args.sample,
+        sample_seed=args.sample_seed,
+        sample_confidence=args.confidence,
+        frontier=args.frontier or (FRONTIER_PRIORITY if args.time_budget else FRONTIER_BFS),
+        time_budget=args.time_budget * 60,
     )
-    report = auditor.run()
-    
+
     # Save to Reports directory
-    # .../Tools/seo/audit.py -> .../Tools/seo -> .../Tools -> .../Root
-    root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    reports_dir = os.path.join(root_dir, "Reports")
+    reports_dir = REPORTS_DIR
     if not os.path.exists(reports_dir):
         os.makedirs(reports_dir)
 
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = f"seo_report_{timestamp}.json"
+    filename = f"seo_report_{timestamp}.{args.format}"
     filepath = os.path.join(reports_dir, filename)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
-    
+    if args.format == "jsonl":
+        writer = JSONLReportWriter(filepath, auditor.base_url)
+        try:
+            report = auditor.run(page_sink=writer.write_page)
+            writer.write_summary(report)
+        finally:
+            writer.close()
+    else:
+        report = auditor.run()
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if checkpoint:
+        checkpoint.remove()
+    if args.profile:
+        print(format_profile(report["profile"]), file=sys.stderr)
     print(f"Report saved to: {filepath}")
 
 
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Crawl checkpoints for the SEO audit, so an interrupted run can be resumed.
+
+Each run owns a directory <checkpoints>/<run-id>/ with three files:
+- options.json: the command-line options of the run (--resume needs nothing else).
+- pages.jsonl: every finished page result, appended as soon as it completes.
+- state.json: frontier (with the click depth and inbound links of each URL),
+  seen-URL set, trap-detector counters, template clusters, sample strata, link
+  statuses, elapsed crawl time and the size of pages.jsonl at that moment,
+  rewritten atomically every `interval` seconds.
+
+On resume, pages.jsonl is cut back to the size recorded in state.json: pages
+finished after the last checkpoint are still in the saved frontier, so they are
+audited again and the crawl continues exactly from that point. The directory is
+removed once the run completes.
+"""
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_INTERVAL = 60.0
+CHECKPOINT_VERSION = 6
+
+
+class CrawlCheckpoint:
+    def __init__(self, directory: str, run_id: str, interval: float = DEFAULT_INTERVAL):
+        self.run_id = run_id
+        self.directory = os.path.join(directory, run_id)
+        self.interval = interval
+        self._pages_file = None
+        self._last_save = time.monotonic()
+
+    @staticmethod
+    def new_run_id() -> str:
+        """Mismo formato que la fecha de los informes: 2024-05-01_22-10-00."""
+        return datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    # ---------------------------
+    # Rutas
+    # ---------------------------
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def exists(self) -> bool:
+        return os.path.exists(self._path("options.json"))
+
+    # ---------------------------
+    # Opciones de la ejecución
+    # ---------------------------
+    def save_options(self, options: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._atomic_write("options.json", options)
+
+    def load_options(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path("options.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    # ---------------------------
+    # Estado del rastreo
+    # ---------------------------
+    def load(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Estado guardado y páginas ya terminadas, o (None, []) si no hay checkpoint.
+
+        Deja pages.jsonl abierto para seguir añadiendo tras la última página válida.
+        """
+        state: Optional[Dict[str, Any]] = None
+        try:
+            with open(self._path("state.json"), "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = None
+        if state is not None and state.get("version") != CHECKPOINT_VERSION:
+            state = None
+
+        pages: List[Dict[str, Any]] = []
+        pages_bytes = state["pages_bytes"] if state else 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._pages_file = open(self._path("pages.jsonl"), "a+b")
+        # lo escrito después del último checkpoint se vuelve a auditar
+        self._pages_file.truncate(pages_bytes)
+        self._pages_file.seek(0)
+        for line in self._pages_file:
+            pages.append(json.loads(line))
+        self._pages_file.seek(0, os.SEEK_END)
+        return state, pages
+
+    def append_page(self, page: Dict[str, Any]) -> None:
+        if self._pages_file is None:
+            self.load()
+        self._pages_file.write(json.dumps(page, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def due(self) -> bool:
+        return time.monotonic() - self._last_save >= self.interval
+
+    def save_state(self, state: Dict[str, Any]) -> None:
+        """Guarda el estado junto con el tamaño de pages.jsonl que le corresponde."""
+        if self._pages_file is None:
+            self.load()
+        self._pages_file.flush()
+        os.fsync(self._pages_file.fileno())
+        state = dict(state, version=CHECKPOINT_VERSION, pages_bytes=self._pages_file.tell())
+        self._atomic_write("state.json", state)
+        self._last_save = time.monotonic()
+
+    def close(self) -> None:
+        if self._pages_file is not None:
+            self._pages_file.close()
+            self._pages_file = None
+
+    def remove(self) -> None:
+        """Ejecución terminada: el checkpoint ya no hace falta."""
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    # ---------------------------
+    # Internos
+    # ---------------------------
+    def _atomic_write(self, name: str, data: Dict[str, Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(name))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
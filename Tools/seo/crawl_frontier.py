@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Crawl frontier for the SEO audit: FIFO (plain BFS) or ordered by importance.
+
+CrawlFrontier is a heap keyed by (score, insertion order). Without a scorer
+every URL has the same score, so it pops in insertion order: exactly the BFS
+queue. With priority_score() the most important URLs come out first, so a
+crawl that is cut short (by --max-pages or --time-budget) has already covered
+them. The score mixes:
+- the sitemap <priority> (0.5 when absent) and how recent <lastmod> is;
+- click depth from the start page (shallower is better);
+- internal links pointing to the URL found so far (more is better).
+
+Inbound counts keep growing while the URL waits in the queue. link() re-scores
+it by pushing a new heap entry; outdated entries are dropped when they reach
+the top (lazy deletion), so every operation stays O(log n).
+"""
+
+import datetime
+import heapq
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+FRONTIER_BFS = "bfs"
+FRONTIER_PRIORITY = "priority"
+FRONTIER_ORDERS = (FRONTIER_BFS, FRONTIER_PRIORITY)
+
+# peso de cada señal en la puntuación (suman 1)
+WEIGHT_SITEMAP_PRIORITY = 0.35
+WEIGHT_FRESHNESS = 0.15
+WEIGHT_DEPTH = 0.30
+WEIGHT_INBOUND = 0.20
+DEFAULT_SITEMAP_PRIORITY = 0.5
+# un lastmod de hace FRESHNESS_HALF_LIFE_DAYS días vale la mitad que uno de hoy
+FRESHNESS_HALF_LIFE_DAYS = 30.0
+# a partir de tantos enlaces entrantes la señal ya no sube
+INBOUND_SATURATION = 50
+
+# scorer(url, profundidad, enlaces entrantes) -> puntuación (mayor = antes)
+Scorer = Callable[[str, int, int], float]
+
+
+def path_depth(url: str) -> int:
+    """Segmentos de la ruta: aproximación a la profundidad de clics de una URL aún no enlazada."""
+    return len([s for s in urlparse(url).path.split("/") if s])
+
+
+def _lastmod_age_days(lastmod: str, now: float) -> Optional[float]:
+    """Días desde un lastmod W3C ('2024-05-01', '2024-05-01T10:00:00+02:00'), o None si no se entiende."""
+    value = lastmod.strip().replace("Z", "+00:00")
+    try:
+        when = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (now - when.timestamp()) / 86400)
+
+
+def priority_score(
+    depth: int,
+    inbound: int,
+    sitemap_priority: Optional[float] = None,
+    lastmod: Optional[str] = None,
+    now: Optional[float] = None,
+) -> float:
+    """Importancia de una URL entre 0 y 1."""
+    priority = DEFAULT_SITEMAP_PRIORITY if sitemap_priority is None else min(1.0, max(0.0, sitemap_priority))
+    freshness = 0.0
+    if lastmod:
+        age = _lastmod_age_days(lastmod, time.time() if now is None else now)
+        if age is not None:
+            freshness = 0.5 ** (age / FRESHNESS_HALF_LIFE_DAYS)
+    depth_score = 1.0 / (1 + max(0, depth))
+    inbound_score = min(1.0, math.log1p(inbound) / math.log1p(INBOUND_SATURATION))
+    return (
+        WEIGHT_SITEMAP_PRIORITY * priority
+        + WEIGHT_FRESHNESS * freshness
+        + WEIGHT_DEPTH * depth_score
+        + WEIGHT_INBOUND * inbound_score
+    )
+
+
+@dataclass
+class FrontierItem:
+    url: str
+    depth: int
+    inbound: int
+    score: float
+    order: int
+    # en vuelo al guardar el checkpoint: sale antes que el resto de la cola
+    head: bool = False
+
+
+class CrawlFrontier:
+    """Cola de rastreo; sin `scorer` es FIFO (BFS), con él sale primero la URL de mayor puntuación."""
+
+    def __init__(self, scorer: Optional[Scorer] = None):
+        self.scorer = scorer
+        # (-puntuación, orden de llegada, clave)
+        self._heap: List[Tuple[float, int, str]] = []
+        self._items: Dict[str, FrontierItem] = {}
+        self._head: deque = deque()
+        self._order = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def _score(self, item: FrontierItem) -> float:
+        return self.scorer(item.url, item.depth, item.inbound) if self.scorer else 0.0
+
+    def push(self, url: str, key: str, depth: int, inbound: int = 0, head: bool = False) -> None:
+        """
+        Encola `url` (`key` es su forma normalizada); el llamador garantiza que no estaba ya.
+        Con `head` sale antes que todo lo demás, en orden de llegada (páginas en vuelo de un checkpoint).
+        """
+        self._order += 1
+        item = FrontierItem(url, depth, inbound, 0.0, self._order, head)
+        item.score = self._score(item)
+        self._items[key] = item
+        if head:
+            self._head.append(key)
+        else:
+            heapq.heappush(self._heap, (-item.score, item.order, key))
+
+    def link(self, key: str, depth: int) -> None:
+        """Otra página enlaza a `key`, todavía en cola: sube su recuento (y, si procede, su profundidad)."""
+        item = self._items.get(key)
+        if item is None or self.scorer is None:
+            return
+        item.inbound += 1
+        item.depth = min(item.depth, depth)
+        item.score = self._score(item)
+        if not item.head:
+            heapq.heappush(self._heap, (-item.score, item.order, key))
+
+    def pop(self) -> FrontierItem:
+        """Saca la URL siguiente (IndexError si la cola está vacía)."""
+        if self._head:
+            return self._items.pop(self._head.popleft())
+        while True:
+            neg_score, _order, key = heapq.heappop(self._heap)
+            item = self._items.get(key)
+            # entrada desfasada: la URL se volvió a puntuar después
+            if item is not None and item.score == -neg_score:
+                del self._items[key]
+                return item
+
+    def items(self) -> Iterator[FrontierItem]:
+        """
+        URLs en cola por orden de llegada (las de cabeza primero): volviéndolas a encolar
+        en este orden, los empates de puntuación se deshacen igual que antes.
+        """
+        return iter(sorted(self._items.values(), key=lambda i: (not i.head, i.order)))
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Crawler trap detection for the crawl frontier.
+
+Calendars ("next month" forever), pagination, faceted filters (?color=red&size=m
+in every order) and relative-link loops (/blog/blog/blog/...) generate endless
+near-identical URLs. Before a new URL enters the frontier, TrapDetector rejects it
+when:
+- it is longer than max_url_length;
+- a path segment repeats too often, or a block of segments repeats back to back
+  (/a/b/a/b);
+- its URL pattern has already used up its budget (off by default, for crawls
+  prone to traps). The pattern is the path with numbers, dates and hex ids
+  replaced by placeholders plus the sorted parameter names, e.g.
+  /events/{n}/{n}?view.
+
+canonicalize_url() removes the permutation part of the problem: it sorts query
+parameters and drops tracking/session parameters, empty values and the fragment,
+so ?b=2&a=1&utm_source=x and ?a=1&b=2 are the same URL. Suppressed URLs are
+grouped by pattern and reason for the report.
+"""
+
+import re
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# URLs distintas que se rastrean como mucho por patrón (0 = sin límite). Desactivado por
+# defecto: un catálogo normal (/producto/{n}) tiene miles de URLs con el mismo patrón
+DEFAULT_PATTERN_BUDGET = 0
+# más larga que esto, casi seguro una trampa (0 = sin límite)
+DEFAULT_MAX_URL_LENGTH = 1024
+# veces que puede aparecer un mismo segmento en la ruta
+DEFAULT_MAX_SEGMENT_REPEATS = 2
+# URLs de ejemplo que se guardan por patrón suprimido
+SAMPLES_PER_PATTERN = 3
+# los patrones de URLs larguísimas se recortan en el informe
+PATTERN_MAX_CHARS = 200
+
+REASON_TOO_LONG = "url_too_long"
+REASON_REPEATED_SEGMENTS = "repeated_segments"
+REASON_PATTERN_BUDGET = "pattern_budget"
+
+# parámetros que no cambian el contenido: seguimiento de campañas y sesiones
+TRACKING_PARAMS = frozenset({
+    "gclid", "dclid", "gbraid", "wbraid", "fbclid", "msclkid", "yclid", "twclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "phpsessid", "jsessionid", "sid", "sessionid",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+_NUMBER_RE = re.compile(r"^\d+$")
+_DATE_RE = re.compile(r"^\d{4}-\d{1,2}(-\d{1,2})?$")
+# ids hexadecimales y UUIDs (con al menos un dígito, para no confundirlos con palabras)
+_HEX_ID_RE = re.compile(r"^(?=[^/]*\d)[0-9a-f]{8,}(-[0-9a-f]{4,})*$", re.I)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Forma canónica de `url` para deduplicar: esquema y host en minúsculas, sin
+    fragmento, sin parámetros de seguimiento/sesión ni vacíos y con los demás
+    ordenados (el orden de los parámetros no cambia la página).
+    """
+    parsed = urlparse(url)
+    params = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if value and not _is_tracking_param(key)
+    ]
+    return urlunparse(parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        path=parsed.path or "/",
+        query=urlencode(sorted(params)),
+        fragment="",
+    ))
+
+
+def _segment_pattern(segment: str) -> str:
+    if _NUMBER_RE.match(segment):
+        return "{n}"
+    if _DATE_RE.match(segment):
+        return "{date}"
+    if _HEX_ID_RE.match(segment):
+        return "{id}"
+    return segment
+
+
+def url_pattern(url: str) -> str:
+    """'/events/2024/05?view=list&page=2' -> '/events/{n}/{n}?page&view'."""
+    parsed = urlparse(url)
+    segments = [s for s in parsed.path.split("/") if s]
+    pattern = "/" + "/".join(_segment_pattern(s.lower()) for s in segments)
+    keys = sorted({key for key, _value in parse_qsl(parsed.query, keep_blank_values=True)})
+    if keys:
+        pattern += "?" + "&".join(keys)
+    return pattern[:PATTERN_MAX_CHARS]
+
+
+def has_repeated_segments(path: str, max_repeats: int = DEFAULT_MAX_SEGMENT_REPEATS) -> bool:
+    """True si algún segmento aparece más de `max_repeats` veces o un bloque se repite seguido (/a/b/a/b)."""
+    segments = [s.lower() for s in path.split("/") if s]
+    if max_repeats and any(count > max_repeats for count in Counter(segments).values()):
+        return True
+    n = len(segments)
+    for size in range(2, n // 2 + 1):
+        for start in range(n - 2 * size + 1):
+            if segments[start:start + size] == segments[start + size:start + 2 * size]:
+                return True
+    return False
+
+
+@dataclass
+class SuppressedPattern:
+    pattern: str
+    reason: str
+    count: int = 0
+    samples: List[str] = field(default_factory=list)
+
+
+class TrapDetector:
+    """Filtro de la frontera de rastreo: cada URL nueva se pasa una vez por allow()."""
+
+    def __init__(
+        self,
+        pattern_budget: int = DEFAULT_PATTERN_BUDGET,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        max_segment_repeats: int = DEFAULT_MAX_SEGMENT_REPEATS,
+    ):
+        self.pattern_budget = max(0, pattern_budget)
+        self.max_url_length = max(0, max_url_length)
+        self.max_segment_repeats = max(0, max_segment_repeats)
+        # URLs aceptadas por patrón
+        self._accepted: Counter = Counter()
+        self._suppressed: Dict[tuple, SuppressedPattern] = {}
+        self._lock = threading.Lock()
+
+    def _reason(self, url: str, pattern: str) -> Optional[str]:
+        if self.max_url_length and len(url) > self.max_url_length:
+            return REASON_TOO_LONG
+        if self.max_segment_repeats and has_repeated_segments(urlparse(url).path, self.max_segment_repeats):
+            return REASON_REPEATED_SEGMENTS
+        if self.pattern_budget and self._accepted[pattern] >= self.pattern_budget:
+            return REASON_PATTERN_BUDGET
+        return None
+
+    def allow(self, url: str) -> bool:
+        """True si `url` puede entrar en la frontera; si no, se anota bajo su patrón."""
+        pattern = url_pattern(url)
+        with self._lock:
+            reason = self._reason(url, pattern)
+            if reason is None:
+                self._accepted[pattern] += 1
+                return True
+            entry = self._suppressed.get((pattern, reason))
+            if entry is None:
+                entry = self._suppressed[(pattern, reason)] = SuppressedPattern(pattern, reason)
+            entry.count += 1
+            if len(entry.samples) < SAMPLES_PER_PATTERN:
+                entry.samples.append(url)
+            return False
+
+    @property
+    def suppressed_urls(self) -> int:
+        return sum(entry.count for entry in self._suppressed.values())
+
+    def suppressed(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Patrones suprimidos, de más a menos URLs descartadas."""
+        with self._lock:
+            entries = sorted(self._suppressed.values(), key=lambda e: (-e.count, e.pattern, e.reason))
+        return [asdict(entry) for entry in entries[:limit]]
+
+    # ---------------------------
+    # Checkpoints
+    # ---------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "accepted": dict(self._accepted),
+                "suppressed": [asdict(entry) for entry in self._suppressed.values()],
+            }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            self._accepted = Counter(state["accepted"])
+            self._suppressed = {
+                (entry["pattern"], entry["reason"]): SuppressedPattern(**entry) for entry in state["suppressed"]
+            }
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+HTML parser backends shared by the SEO tools.
+
+Every backend drives the same event interface (start/end/data/close, the lxml
+"target" protocol), so the extractors in audit.py do not care which parser
+produced the events. "auto" picks the fastest installed backend and falls back
+to the standard library's html.parser.
+
+Usage (micro-benchmark over real pages):
+    python html_backend.py https://pablocirre.es/ https://pablocirre.es/paginas/Projects/
+    python html_backend.py ../../Labs/Templates/*/index.html --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+AUTO = "auto"
+HTML_PARSER = "html.parser"
+LXML = "lxml"
+SELECTOLAX = "selectolax"
+
+# orden de preferencia para "auto" (del más rápido al más lento en nuestras páginas)
+PREFERENCE = (LXML, SELECTOLAX, HTML_PARSER)
+CHOICES = (AUTO,) + PREFERENCE
+
+
+def _has_lxml() -> bool:
+    try:
+        import lxml.etree  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _has_selectolax() -> bool:
+    try:
+        import selectolax  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def available_backends() -> List[str]:
+    """Backends instalados, en orden de preferencia."""
+    checks = {LXML: _has_lxml, SELECTOLAX: _has_selectolax, HTML_PARSER: lambda: True}
+    return [name for name in PREFERENCE if checks[name]()]
+
+
+def resolve_backend(name: Optional[str] = AUTO) -> str:
+    """Traduce "auto" (o None) al backend concreto; si el pedido no está instalado, usa html.parser."""
+    installed = available_backends()
+    if not name or name == AUTO:
+        return installed[0]
+    if name not in CHOICES:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+    if name not in installed:
+        print(f"[WARNING] HTML parser '{name}' is not installed; using {HTML_PARSER}", file=sys.stderr)
+        return HTML_PARSER
+    return name
+
+
+def bs4_features(name: Optional[str] = AUTO) -> str:
+    """Nombre de tree builder de BeautifulSoup para el backend (selectolax no tiene builder propio)."""
+    backend = resolve_backend(name)
+    if backend == SELECTOLAX:
+        return LXML if _has_lxml() else HTML_PARSER
+    return backend
+
+
+# ---------------------------
+# Emisores de eventos
+# ---------------------------
+class _StdlibEventParser(HTMLParser):
+    """Adaptador de html.parser a la interfaz start/end/data."""
+
+    def __init__(self, target: Any):
+        super().__init__(convert_charrefs=True)
+        self._target = target
+
+    def handle_starttag(self, tag, attrs):
+        # como BeautifulSoup: atributos sin valor -> "", el último duplicado gana
+        self._target.start(tag, {k: ("" if v is None else v) for k, v in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self._target.end(tag)
+
+    def handle_endtag(self, tag):
+        self._target.end(tag)
+
+    def handle_data(self, data):
+        self._target.data(data)
+
+
+def _feed_html_parser(html: str, target: Any) -> Any:
+    parser = _StdlibEventParser(target)
+    parser.feed(html)
+    parser.close()
+    return target.close()
+
+
+def _feed_lxml(html: str, target: Any) -> Any:
+    from lxml import etree
+
+    parser = etree.HTMLParser(target=target)
+    parser.feed(html)
+    # HTMLParser.close() devuelve lo que devuelva target.close()
+    return parser.close()
+
+
+def _selectolax_tree(html: str) -> Any:
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser as LexborHTMLParser
+    return LexborHTMLParser(html)
+
+
+def _feed_selectolax(html: str, target: Any) -> Any:
+    root = _selectolax_tree(html).root
+    if root is None:
+        return target.close()
+
+    def attrs(node: Any) -> Dict[str, str]:
+        return {k: ("" if v is None else v) for k, v in node.attributes.items()}
+
+    # recorrido iterativo: los documentos muy anidados no agotan la pila de Python
+    target.start(root.tag, attrs(root))
+    stack = [(root.tag, root.iter(include_text=True))]
+    while stack:
+        tag, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            target.end(tag)
+            continue
+        child_tag = child.tag
+        if child_tag == "-text":
+            target.data(child.text_content or "")
+        elif not child_tag.startswith(("-", "_", "!")):
+            target.start(child_tag, attrs(child))
+            stack.append((child_tag, child.iter(include_text=True)))
+    return target.close()
+
+
+_FEEDERS = {
+    HTML_PARSER: _feed_html_parser,
+    LXML: _feed_lxml,
+    SELECTOLAX: _feed_selectolax,
+}
+
+
+def feed_events(html: str, target: Any, backend: Optional[str] = AUTO) -> Any:
+    """
+    Recorre `html` con el backend indicado enviando los eventos a `target`; devuelve target.close().
+    Un nombre concreto (ya pasado por resolve_backend) se usa tal cual; "auto" se resuelve en cada llamada.
+    """
+    feeder = _FEEDERS.get(backend) or _FEEDERS[resolve_backend(backend)]
+    return feeder(html, target)
+
+
+# ---------------------------
+# Micro-benchmark
+# ---------------------------
+class _CountingTarget:
+    """Target mínimo: solo cuenta eventos, para medir el coste del parser en sí."""
+
+    def __init__(self) -> None:
+        self.events = 0
+
+    def start(self, tag, attrs):
+        self.events += 1
+
+    def end(self, tag):
+        self.events += 1
+
+    def data(self, text):
+        self.events += 1
+
+    def close(self):
+        return self.events
+
+
+def _load_documents(sources: List[str], timeout: int) -> List[str]:
+    docs: List[str] = []
+    for src in sources:
+        if src.startswith(("http://", "https://")):
+            import requests
+
+            resp = requests.get(src, timeout=timeout)
+            resp.raise_for_status()
+            docs.append(resp.text)
+        elif os.path.isfile(src):
+            with open(src, "r", encoding="utf-8", errors="replace") as f:
+                docs.append(f.read())
+        else:
+            print(f"[WARNING] Skipping {src}: not a URL or file", file=sys.stderr)
+    return docs
+
+
+def benchmark(docs: List[str], repeat: int = 10) -> List[Dict[str, Any]]:
+    """Mide cada backend instalado sobre `docs` (mejor de `repeat` pasadas)."""
+    total_bytes = sum(len(d) for d in docs)
+    rows: List[Dict[str, Any]] = []
+    for name in available_backends():
+        best = None
+        events = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            events = sum(feed_events(doc, _CountingTarget(), name) for doc in docs)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        rows.append({
+            "backend": name,
+            "seconds": best,
+            "ms_per_page": 1000 * best / max(1, len(docs)),
+            "mb_per_s": (total_bytes / 1e6) / best if best else None,
+            "events": events,
+        })
+    rows.sort(key=lambda r: r["seconds"])
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare installed HTML parser backends on real pages.")
+    parser.add_argument("sources", nargs="+", help="URLs or local HTML files")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes per backend (best one is kept)")
+    parser.add_argument("--timeout", type=int, default=10, help="HTTP timeout when sources are URLs")
+    args = parser.parse_args()
+
+    docs = _load_documents(args.sources, args.timeout)
+    if not docs:
+        print("[ERROR] No documents to benchmark")
+        sys.exit(1)
+
+    print(f"Pages: {len(docs)} | Size: {sum(len(d) for d in docs) / 1e6:.2f} MB | Repeat: {args.repeat}")
+    print(f"{'backend':<12} {'ms/page':>10} {'MB/s':>8} {'events':>10}")
+    for row in benchmark(docs, args.repeat):
+        print(f"{row['backend']:<12} {row['ms_per_page']:>10.2f} {row['mb_per_s']:>8.2f} {row['events']:>10}")
+    print(f"auto -> {resolve_backend(AUTO)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP cache with conditional revalidation for the SEO tools.
+
+Each cached response is stored as two files named after the SHA-1 of its URL:
+<key>.json (status, headers, ETag/Last-Modified) and <key>.body. Later runs send
+If-None-Match / If-Modified-Since and reuse the stored body on a 304. When the
+cache grows past its size limit, the least recently used entries are evicted.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class HTTPCache:
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes = sum(
+            entry.stat().st_size for entry in os.scandir(directory) if entry.is_file()
+        )
+
+    # ---------------------------
+    # Rutas
+    # ---------------------------
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    # ---------------------------
+    # Lectura
+    # ---------------------------
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CacheEntry(
+            url=url,
+            status=meta["status"],
+            headers=meta.get("headers") or {},
+            body=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Cabeceras de revalidación para una entrada cacheada."""
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    # ---------------------------
+    # Escritura
+    # ---------------------------
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> bool:
+        """Guarda la respuesta si trae validadores; devuelve True si quedó en caché."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if status != 200 or not (etag or last_modified):
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": dict(headers),
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+        }
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            previous = self._size(meta_path) + self._size(body_path)
+            self._atomic_write(body_path, body)
+            self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+            self._total_bytes += self._size(meta_path) + self._size(body_path) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return True
+
+    def refresh(self, entry: CacheEntry, headers: Dict[str, str]) -> CacheEntry:
+        """Tras un 304: mezcla las cabeceras nuevas y marca la entrada como usada recientemente."""
+        merged = dict(entry.headers)
+        for name in ("ETag", "Last-Modified", "Cache-Control", "Expires", "Date"):
+            if headers.get(name):
+                merged[name] = headers[name]
+        entry.headers = merged
+        entry.etag = merged.get("ETag", entry.etag)
+        entry.last_modified = merged.get("Last-Modified", entry.last_modified)
+        self.store(entry.url, entry.status, merged, entry.body)
+        return entry
+
+    # ---------------------------
+    # Internos
+    # ---------------------------
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self) -> None:
+        """LRU por mtime hasta bajar al 90% del límite (se llama con el lock tomado)."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".json"):
+                entries.append((entry.stat().st_mtime, entry.path))
+        entries.sort()
+
+        target = int(self.max_bytes * 0.9)
+        for _mtime, meta_path in entries:
+            if self._total_bytes <= target:
+                break
+            body_path = meta_path[: -len(".json")] + ".body"
+            for path in (meta_path, body_path):
+                size = self._size(path)
+                try:
+                    os.remove(path)
+                    self._total_bytes -= size
+                except OSError:
+                    pass
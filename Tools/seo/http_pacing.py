@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Per-host request pacing for the SEO crawlers.
+
+HostPacer gives each host a minimum interval between request starts (e.g. its
+robots.txt Crawl-delay). Workers call wait(url) before each request; the pacer
+hands out time slots per host, so concurrent workers hitting the same host queue
+up while requests to other hosts are not delayed.
+
+HostLimiter adds adaptive concurrency on top (AIMD, as in TCP congestion
+control): each host starts with a small number of simultaneous requests, which
+grows while responses are fast and healthy and is cut multiplicatively on 429,
+503, network errors or when recent latency climbs well above the host's usual
+latency (a short-term vs a long-term moving average). A Retry-After header
+pauses the whole host. request() retries throttled or failed responses with
+exponential backoff and full jitter; network errors are retried at most once
+and timeouts not at all.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+# respuestas que piden bajar el ritmo (y se reintentan)
+THROTTLE_STATUSES = frozenset({429, 503})
+# errores transitorios del origen: se reintentan, pero no frenan tanto
+RETRY_STATUSES = THROTTLE_STATUSES | {502, 504}
+
+DEFAULT_RETRIES = 3
+# errores de red (conexión rechazada, cortada...): un reintento como mucho; un timeout
+# no se reintenta (un enlace muerto costaría varias veces el timeout)
+NETWORK_RETRIES = 1
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+# un Retry-After absurdo (horas) no debe parar la auditoría entera
+RETRY_AFTER_MAX = 120.0
+
+INITIAL_CONCURRENCY = 2
+# recorte ante 429/503/errores y ante latencia alta
+DECREASE_ON_ERROR = 0.5
+DECREASE_ON_LATENCY = 0.75
+# latencia reciente por encima de este múltiplo de la habitual = origen saturado
+LATENCY_FACTOR = 2.0
+# medias móviles de latencia: reciente (rápida) y habitual (lenta)
+LATENCY_ALPHA = 0.3
+BASELINE_ALPHA = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Segundos de una cabecera Retry-After (número o fecha HTTP), o None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = when.timestamp() - time.time()
+    return min(max(0.0, seconds), RETRY_AFTER_MAX)
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX) -> float:
+    """Espera del reintento `attempt` (0, 1, 2...): backoff exponencial con jitter completo."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    """Timeout de socket/urllib (TimeoutError, también dentro de URLError) o de requests (*Timeout)."""
+    reason = getattr(exc, "reason", None)
+    return (
+        isinstance(exc, TimeoutError)
+        or isinstance(reason, TimeoutError)
+        or type(exc).__name__.endswith("Timeout")
+    )
+
+
+def _status(resp: Any) -> int:
+    """Estado HTTP de una respuesta de requests o de urllib (incluido HTTPError)."""
+    status = getattr(resp, "status_code", None)
+    return status if status is not None else resp.getcode()
+
+
+class HostPacer:
+    def __init__(self, default_interval: float = 0.0):
+        self.default_interval = max(0.0, default_interval)
+        self._intervals: Dict[str, float] = {}
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def set_interval(self, host: str, seconds: float) -> None:
+        with self._lock:
+            self._intervals[host.lower()] = max(0.0, seconds)
+
+    def interval(self, host: str) -> float:
+        return self._intervals.get(host.lower(), self.default_interval)
+
+    def wait(self, url: str) -> float:
+        """Bloquea hasta el turno de la petición en su host; devuelve los segundos esperados."""
+        host = self.host(url)
+        with self._lock:
+            interval = self._intervals.get(host, self.default_interval)
+            if interval <= 0:
+                return 0.0
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+@dataclass
+class _HostState:
+    limit: float
+    active: int = 0
+    # latencia reciente y habitual (medias móviles, segundos)
+    latency: Optional[float] = None
+    baseline: Optional[float] = None
+    # sin recortes todavía: crecimiento rápido (+1 por respuesta)
+    slow_start: bool = True
+    last_decrease: float = 0.0
+    paused_until: float = 0.0
+
+
+class HostLimiter(HostPacer):
+    """HostPacer con concurrencia adaptativa por host (AIMD), Retry-After y reintentos."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        initial_concurrency: int = INITIAL_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        default_interval: float = 0.0,
+    ):
+        super().__init__(default_interval)
+        self.max_concurrency = max(1, max_concurrency)
+        self.initial_concurrency = max(1, min(initial_concurrency, self.max_concurrency))
+        self.retries = max(0, retries)
+        self._hosts: Dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(limit=float(self.initial_concurrency))
+        return state
+
+    def concurrency(self, url: str) -> int:
+        """Peticiones simultáneas permitidas ahora mismo para el host de `url`."""
+        with self._cond:
+            return int(self._state(self.host(url)).limit)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Reserva un hueco de concurrencia en el host (y su turno de Crawl-delay)."""
+        host = self.host(url)
+        with self._cond:
+            state = self._state(host)
+            while True:
+                pause = state.paused_until - time.monotonic()
+                if pause <= 0 and state.active < int(state.limit):
+                    break
+                self._cond.wait(timeout=pause if pause > 0 else None)
+            state.active += 1
+        try:
+            self.wait(url)
+            yield
+        finally:
+            with self._cond:
+                state.active -= 1
+                self._cond.notify_all()
+
+    def record(self, url: str, status: Optional[int], latency: float, retry_after: Optional[float] = None) -> None:
+        """Ajusta la concurrencia del host con el resultado de una petición (status None = error de red)."""
+        host = self.host(url)
+        now = time.monotonic()
+        with self._cond:
+            state = self._state(host)
+            if retry_after:
+                state.paused_until = max(state.paused_until, now + retry_after)
+
+            if status is None or status in THROTTLE_STATUSES:
+                self._decrease(state, DECREASE_ON_ERROR, now)
+            elif status not in RETRY_STATUSES:
+                if state.latency is None:
+                    state.latency = state.baseline = latency
+                else:
+                    state.latency += LATENCY_ALPHA * (latency - state.latency)
+                    state.baseline += BASELINE_ALPHA * (latency - state.baseline)
+                if state.latency > LATENCY_FACTOR * state.baseline:
+                    self._decrease(state, DECREASE_ON_LATENCY, now)
+                elif state.slow_start:
+                    state.limit = min(self.max_concurrency, state.limit + 1)
+                else:
+                    state.limit = min(self.max_concurrency, state.limit + 1 / state.limit)
+            self._cond.notify_all()
+
+    @staticmethod
+    def _decrease(state: _HostState, factor: float, now: float) -> None:
+        # una sola bajada por "ida y vuelta": las peticiones ya en vuelo fallan todas a la vez
+        if now - state.last_decrease < (state.latency or 0.0):
+            return
+        state.limit = max(1.0, state.limit * factor)
+        state.slow_start = False
+        state.last_decrease = now
+
+    def request(self, send: Callable[[], Any], url: str) -> Any:
+        """
+        Ejecuta `send()` (una petición a `url`) dentro de un hueco del host, reintentando
+        429/502/503/504 con backoff exponencial y jitter (o lo que indique Retry-After).
+        Los errores de red se reintentan una vez como mucho y los timeouts, ninguna.
+        Devuelve la última respuesta o relanza el último error.
+        """
+        attempt = 0
+        while True:
+            with self.slot(url):
+                started = time.monotonic()
+                try:
+                    resp = send()
+                except OSError as e:
+                    # requests.RequestException y urllib.error.URLError son OSError
+                    self.record(url, None, time.monotonic() - started)
+                    if _is_timeout(e) or attempt >= min(self.retries, NETWORK_RETRIES):
+                        raise
+                    resp = None
+            if resp is not None:
+                status = _status(resp)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After")) if status in RETRY_STATUSES else None
+                self.record(url, status, time.monotonic() - started, retry_after)
+                if status not in RETRY_STATUSES or attempt >= self.retries:
+                    return resp
+                close = getattr(resp, "close", None)
+                if close:
+                    close()
+            else:
+                retry_after = None
+            time.sleep(max(backoff_delay(attempt), retry_after or 0.0))
+            attempt += 1
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Cross-run link status cache (SQLite) for the SEO tools.
+
+Each checked link is stored with its HTTP status, final URL after redirects and the
+time it was checked. Internal and external links have separate TTLs, so repeated
+audits skip links verified recently (external links rarely change, and re-checking
+them on every run is slow and gets us rate-limited). Connection errors, timeouts
+and throttled or failed-gateway responses (429/502/503/504, see http_pacing) are
+never stored: they are usually transient and must be retried.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from http_pacing import RETRY_STATUSES
+
+DEFAULT_INTERNAL_TTL = 24 * 3600        # 1 día
+DEFAULT_EXTERNAL_TTL = 7 * 24 * 3600    # 7 días
+# escrituras pendientes antes de hacer commit
+FLUSH_EVERY = 200
+
+
+@dataclass
+class LinkRecord:
+    url: str
+    status: int
+    final_url: Optional[str]
+    checked_at: float
+
+
+class LinkStatusStore:
+    def __init__(
+        self,
+        path: str,
+        internal_ttl: float = DEFAULT_INTERNAL_TTL,
+        external_ttl: float = DEFAULT_EXTERNAL_TTL,
+    ):
+        self.path = path
+        self.internal_ttl = internal_ttl
+        self.external_ttl = external_ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, int, Optional[str], float, int]] = []
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS link_status (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                final_url TEXT,
+                checked_at REAL NOT NULL,
+                external INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str, external: bool) -> Optional[LinkRecord]:
+        """Devuelve el resultado guardado si sigue dentro de su TTL."""
+        ttl = self.external_ttl if external else self.internal_ttl
+        if ttl <= 0:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, final_url, checked_at FROM link_status WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, final_url, checked_at = row
+        if time.time() - checked_at > ttl:
+            return None
+        return LinkRecord(url=url, status=status, final_url=final_url, checked_at=checked_at)
+
+    def put(self, url: str, status: Optional[int], final_url: Optional[str], external: bool) -> None:
+        """
+        Guarda un resultado HTTP definitivo. Los errores de conexión y los 429/502/503/504
+        que quedan tras agotar los reintentos no se guardan: son transitorios.
+        """
+        if not isinstance(status, int) or status <= 0 or status in RETRY_STATUSES:
+            return
+        with self._lock:
+            self._pending.append((url, status, final_url, time.time(), int(external)))
+            if len(self._pending) >= FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO link_status (url, status, final_url, checked_at, external) "
+            "VALUES (?, ?, ?, ?, ?)",
+            self._pending,
+        )
+        self._conn.commit()
+        self._pending = []
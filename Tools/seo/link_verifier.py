@@ -16,21 +16,38 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from collections import defaultdict
 import json
 import os
+import threading
 from datetime import datetime
 from bs4 import BeautifulSoup
 
+import html_backend
+from crawl_traps import TrapDetector, canonicalize_url, DEFAULT_MAX_URL_LENGTH, DEFAULT_PATTERN_BUDGET
+from http_pacing import HostLimiter
+from link_store import LinkStatusStore, DEFAULT_INTERNAL_TTL, DEFAULT_EXTERNAL_TTL
+
 # Configuration
 TIMEOUT = 10
 USER_AGENT = 'Mozilla/5.0 (LinkVerifier/1.0; +https://pablocirre.es)'
 HEADERS = {'User-Agent': USER_AGENT}
+LINK_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Reports', '.cache', 'link_status.sqlite')
 
 class LinkVerifier:
-    def __init__(self, base_url, check_external=False, max_workers=5):
+    def __init__(self, base_url, check_external=False, max_workers=5, parser=html_backend.AUTO,
+                 link_cache=LINK_CACHE, ttl_internal=DEFAULT_INTERNAL_TTL, ttl_external=DEFAULT_EXTERNAL_TTL,
+                 pattern_budget=DEFAULT_PATTERN_BUDGET, max_url_length=DEFAULT_MAX_URL_LENGTH):
         self.base_url = base_url.rstrip('/')
         self.domain = urlparse(base_url).netloc
         self.check_external = check_external
         self.max_workers = max_workers
+        self.bs4_features = html_backend.bs4_features(parser)
+        self.link_store = LinkStatusStore(link_cache, ttl_internal, ttl_external) if link_cache else None
+        # Adaptive per-host concurrency, Retry-After and retries with backoff
+        self.limiter = HostLimiter(max_concurrency=max_workers)
         self.visited_urls = set()
+        # Crawler trap heuristics, evaluated once per distinct (canonical) link
+        self.traps = TrapDetector(pattern_budget, max_url_length)
+        self.trap_verdicts = {}
+        self._traps_lock = threading.Lock()
         self.results = {
             'pages_checked': 0,
             'links_checked': 0,
@@ -57,7 +74,7 @@ class LinkVerifier:
             try:
                 url = self.base_url + loc
                 print(f"[INFO] Trying sitemap: {url}")
-                response = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+                response = self.limiter.request(lambda: requests.get(url, headers=HEADERS, timeout=TIMEOUT), url)
                 if response.status_code == 200 and 'xml' in response.headers.get('content-type', ''):
                     root = ET.fromstring(response.content)
                     ns = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
@@ -88,9 +105,24 @@ class LinkVerifier:
         return urls
 
     def check_url(self, url):
-        """Check if a URL is accessible."""
+        """Check if a URL is accessible (reusing recent results from the link cache)."""
+        external = urlparse(url).netloc != self.domain
+        if self.link_store:
+            record = self.link_store.get(url, external)
+            if record is not None:
+                return {
+                    'url': url,
+                    'status': record.status,
+                    'redirect': record.final_url if record.final_url and record.final_url != url else None,
+                    'ok': record.status < 400,
+                    'cached': True
+                }
         try:
-            response = requests.head(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+            response = self.limiter.request(
+                lambda: requests.head(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True), url
+            )
+            if self.link_store:
+                self.link_store.put(url, response.status_code, response.url, external)
             return {
                 'url': url,
                 'status': response.status_code,
@@ -107,11 +139,11 @@ class LinkVerifier:
     def extract_links(self, page_url):
         """Extract all links from a page."""
         try:
-            response = requests.get(page_url, headers=HEADERS, timeout=TIMEOUT)
+            response = self.limiter.request(lambda: requests.get(page_url, headers=HEADERS, timeout=TIMEOUT), page_url)
             if response.status_code != 200:
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, self.bs4_features)
             links = []
             
             for a in soup.find_all('a', href=True):
@@ -121,8 +153,8 @@ class LinkVerifier:
                 if href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
                     continue
                 
-                # Convert relative to absolute
-                full_url = urljoin(page_url, href)
+                # Convert relative to absolute; sorted params, no tracking/session params
+                full_url = canonicalize_url(urljoin(page_url, href))
                 
                 # Determine if internal or external
                 is_internal = urlparse(full_url).netloc == self.domain
@@ -138,6 +170,13 @@ class LinkVerifier:
             self.results['errors'].append({'page': page_url, 'error': str(e)})
             return []
 
+    def allowed_by_traps(self, url):
+        """False for links that look like a crawler trap (calendars, facets, path loops)."""
+        with self._traps_lock:
+            if url not in self.trap_verdicts:
+                self.trap_verdicts[url] = self.traps.allow(url)
+            return self.trap_verdicts[url]
+
     def verify_page(self, page_url):
         """Verify a single page and all its links."""
         if page_url in self.visited_urls:
@@ -169,6 +208,8 @@ class LinkVerifier:
             # Skip external if not checking them
             if not link['internal'] and not self.check_external:
                 continue
+            if not self.allowed_by_traps(link['url']):
+                continue
             
             self.results['links_checked'] += 1
             link_check = self.check_url(link['url'])
@@ -218,6 +259,8 @@ class LinkVerifier:
                     self.results['pages'].append(result)
                     self.results['pages_checked'] += 1
         
+        if self.link_store:
+            self.link_store.flush()
         return self.generate_report()
 
     def generate_report(self):
@@ -230,8 +273,10 @@ class LinkVerifier:
                 'total_links_checked': self.results['links_checked'],
                 'working_links': self.results['working_links'],
                 'broken_links': len(self.results['broken_links']),
-                'redirects': len(self.results['redirects'])
+                'redirects': len(self.results['redirects']),
+                'suppressed_links': self.traps.suppressed_urls
             },
+            'suppressed_patterns': self.traps.suppressed(20),
             'broken_links': self.results['broken_links'],
             'redirects': self.results['redirects'][:20],  # Limit redirects in report
             'errors': self.results['errors']
@@ -246,6 +291,7 @@ class LinkVerifier:
         print(f"Working links:     {report['summary']['working_links']}")
         print(f"Broken links:      {report['summary']['broken_links']}")
         print(f"Redirects found:   {report['summary']['redirects']}")
+        print(f"Trap links skipped: {report['summary']['suppressed_links']}")
         
         if report['broken_links']:
             print("\n[!] BROKEN LINKS FOUND:")
@@ -253,6 +299,11 @@ class LinkVerifier:
                 print(f"  - {bl['broken_url']}")
                 print(f"    Status: {bl['status']} | From: {bl['source_page']}")
         
+        if report['suppressed_patterns']:
+            print("\n[!] SUPPRESSED URL PATTERNS (possible crawler traps):")
+            for sp in report['suppressed_patterns'][:10]:
+                print(f"  - {sp['pattern']} ({sp['reason']}, {sp['count']} URLs)")
+        
         return report
 
 
@@ -263,13 +314,30 @@ def main():
     parser.add_argument('--check-external', action='store_true', help='Also check external links')
     parser.add_argument('--workers', type=int, default=3, help='Number of concurrent workers')
     parser.add_argument('--output', default=None, help='Output JSON file path')
+    parser.add_argument('--parser', choices=html_backend.CHOICES, default=html_backend.AUTO,
+                        help='HTML parser backend (default: fastest installed)')
+    parser.add_argument('--no-link-cache', action='store_true', help='Re-check every link, ignoring the cross-run cache')
+    parser.add_argument('--ttl-internal', type=float, default=DEFAULT_INTERNAL_TTL / 3600,
+                        help='Hours a cached internal link status stays valid (default 24)')
+    parser.add_argument('--ttl-external', type=float, default=DEFAULT_EXTERNAL_TTL / 3600,
+                        help='Hours a cached external link status stays valid (default 168)')
+    parser.add_argument('--pattern-budget', type=int, default=DEFAULT_PATTERN_BUDGET,
+                        help='Max distinct links checked per URL pattern, e.g. /events/{n}/{n} (default 0 = no limit; e.g. 100 for trap-prone sites)')
+    parser.add_argument('--max-url-length', type=int, default=DEFAULT_MAX_URL_LENGTH,
+                        help='Skip links longer than this (default 1024; 0 = no limit)')
     
     args = parser.parse_args()
     
     verifier = LinkVerifier(
         base_url=args.url,
         check_external=args.check_external,
-        max_workers=args.workers
+        max_workers=args.workers,
+        parser=args.parser,
+        link_cache=None if args.no_link_cache else LINK_CACHE,
+        ttl_internal=args.ttl_internal * 3600,
+        ttl_external=args.ttl_external * 3600,
+        pattern_budget=args.pattern_budget,
+        max_url_length=args.max_url_length
     )
     
     report = verifier.run(max_pages=args.max_pages)
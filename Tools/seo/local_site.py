@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Serve a folder of pre-rendered HTML files as if it were the site, without HTTP.
+
+LocalSite maps URLs under the audited base URL to files: "/" -> index.html,
+"/blog/" and "/blog" -> blog/index.html, "/about" -> about.html when there is no
+directory, and any other path to the file of the same name. LocalSiteAdapter is
+a requests transport adapter that answers from those files (404 when missing),
+so mounting it on the session runs the whole audit (robots.txt, sitemap, page
+checks, link checks) against the snapshot with no network access at all.
+"""
+
+import io
+import mimetypes
+import os
+from email.utils import formatdate
+from typing import List, Optional
+from urllib.parse import unquote, urlparse
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+HTML_EXTENSIONS = (".html", ".htm")
+
+
+class LocalSite:
+    def __init__(self, root: str, base_url: str):
+        self.root = os.path.realpath(root)
+        self.base_url = base_url.rstrip("/")
+
+    def file_for(self, url: str) -> Optional[str]:
+        """Fichero que corresponde a `url`, o None si no existe (o cae fuera de la carpeta)."""
+        path = unquote(urlparse(url).path).lstrip("/")
+        candidate = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([self.root, candidate]) != self.root:
+            return None
+        options = [candidate]
+        if os.path.isdir(candidate):
+            options = [os.path.join(candidate, "index.html"), os.path.join(candidate, "index.htm")]
+        elif not os.path.splitext(candidate)[1]:
+            options += [candidate + ext for ext in HTML_EXTENSIONS]
+        for option in options:
+            if os.path.isfile(option):
+                return option
+        return None
+
+    def url_for(self, file_path: str) -> str:
+        """URL de un fichero HTML de la carpeta: index.html se sirve como su directorio."""
+        rel = os.path.relpath(file_path, self.root).replace(os.sep, "/")
+        head, name = rel.rsplit("/", 1) if "/" in rel else ("", rel)
+        if name in ("index.html", "index.htm"):
+            return f"{self.base_url}/{head}/" if head else self.base_url
+        return f"{self.base_url}/{rel}"
+
+    def urls(self) -> List[str]:
+        """URLs de todos los HTML de la carpeta, en orden estable (por ruta)."""
+        files = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            # carpetas ocultas (.git, .cache...) no forman parte del sitio
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            files.extend(
+                os.path.join(dirpath, name) for name in filenames if name.lower().endswith(HTML_EXTENSIONS)
+            )
+        return [self.url_for(path) for path in sorted(files)]
+
+
+class LocalSiteAdapter(BaseAdapter):
+    """Adaptador de requests que responde desde LocalSite (GET y HEAD)."""
+
+    def __init__(self, site: LocalSite):
+        super().__init__()
+        self.site = site
+
+    def send(self, request: PreparedRequest, stream=False, timeout=None, verify=True, cert=None, proxies=None) -> Response:
+        path = self.site.file_for(request.url)
+        if path is None:
+            status, reason, body = 404, "Not Found", b""
+            headers = {"Content-Type": "text/html"}
+        else:
+            with open(path, "rb") as f:
+                body = f.read()
+            status, reason = 200, "OK"
+            headers = {
+                "Content-Type": mimetypes.guess_type(path)[0] or "application/octet-stream",
+                "Last-Modified": formatdate(os.path.getmtime(path), usegmt=True),
+            }
+        headers["Content-Length"] = str(len(body))
+
+        resp = Response()
+        resp.status_code = status
+        resp.reason = reason
+        resp.headers = CaseInsensitiveDict(headers)
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.raw = io.BytesIO(b"" if request.method == "HEAD" else body)
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        return resp
+
+    def close(self) -> None:
+        pass
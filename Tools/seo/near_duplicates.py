@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate content detection (SimHash + LSH) for the SEO tools.
+
+Each page's main text is reduced to a 64-bit SimHash over word shingles. Pages
+whose fingerprints differ in at most `max_distance` bits are near-duplicates.
+Instead of comparing every pair, fingerprints are split into max_distance + 1
+bands: two fingerprints within that distance must share at least one band
+exactly (pigeonhole), so only pages that land in the same band bucket are
+compared. The cost grows roughly linearly with the number of pages.
+"""
+
+import hashlib
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+FINGERPRINT_BITS = 64
+SHINGLE_WORDS = 3
+# por debajo de esto el SimHash es ruido (páginas casi vacías)
+MIN_SHINGLES = 8
+# ~95% de bits iguales: el umbral habitual para 64 bits
+DEFAULT_MAX_DISTANCE = 3
+
+# Recuento vertical de bits con enteros grandes: cada bit del hash ocupa un campo de
+# _FIELD_BITS bits, así que sumar los hashes "expandidos" cuenta los unos de cada
+# posición de una vez. _SPREAD[k][v] es el byte k del hash con valor v ya expandido.
+_FIELD_BITS = 24
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+_SPREAD = [
+    [sum(1 << ((8 * k + bit) * _FIELD_BITS) for bit in range(8) if value >> bit & 1) for value in range(256)]
+    for k in range(FINGERPRINT_BITS // 8)
+]
+
+
+class SimHasher:
+    """Acumula las palabras del texto principal y calcula su SimHash de 64 bits."""
+
+    def __init__(self, shingle_words: int = SHINGLE_WORDS):
+        self.shingle_words = shingle_words
+        self._words: List[str] = []
+
+    def add_words(self, words: Iterable[str]) -> None:
+        self._words.extend(word.lower() for word in words)
+
+    def digest(self) -> Optional[int]:
+        """SimHash del texto acumulado, o None si es demasiado corto para compararlo."""
+        words = self._words
+        shingles = Counter(
+            " ".join(gram) for gram in zip(*(words[i:] for i in range(self.shingle_words)))
+        )
+        if len(shingles) < MIN_SHINGLES:
+            return None
+        counts = 0
+        total = 0
+        for shingle, weight in shingles.items():
+            digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+            counts += sum(map(list.__getitem__, _SPREAD, digest)) * weight
+            total += weight
+
+        fingerprint = 0
+        for bit in range(FINGERPRINT_BITS):
+            ones = (counts >> (bit * _FIELD_BITS)) & _FIELD_MASK
+            if 2 * ones > total:
+                fingerprint |= 1 << bit
+        return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _bands(max_distance: int) -> List[Tuple[int, int]]:
+    """(desplazamiento, máscara) de cada banda: max_distance + 1 trozos del fingerprint."""
+    count = max(1, min(FINGERPRINT_BITS, max_distance + 1))
+    width, extra = divmod(FINGERPRINT_BITS, count)
+    bands = []
+    shift = 0
+    for idx in range(count):
+        bits = width + (1 if idx < extra else 0)
+        bands.append((shift, (1 << bits) - 1))
+        shift += bits
+    return bands
+
+
+def near_duplicate_clusters(
+    fingerprints: Mapping[str, int], max_distance: int = DEFAULT_MAX_DISTANCE
+) -> List[List[str]]:
+    """
+    Agrupa las URLs cuyo SimHash difiere en <= max_distance bits (de forma transitiva).
+
+    Devuelve solo grupos de 2 o más URLs, en el orden de `fingerprints`.
+    """
+    # fingerprints idénticos se comparan una sola vez
+    urls_by_fp: Dict[int, List[str]] = {}
+    for url, fp in fingerprints.items():
+        urls_by_fp.setdefault(fp, []).append(url)
+    unique = list(urls_by_fp)
+
+    parent = list(range(len(unique)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for shift, mask in _bands(max_distance):
+        buckets: Dict[int, List[int]] = {}
+        for idx, fp in enumerate(unique):
+            buckets.setdefault((fp >> shift) & mask, []).append(idx)
+        for members in buckets.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j and hamming_distance(unique[i], unique[j]) <= max_distance:
+                        parent[root_j] = root_i
+
+    groups: Dict[int, List[str]] = {}
+    for idx, fp in enumerate(unique):
+        groups.setdefault(find(idx), []).extend(urls_by_fp[fp])
+    order = {url: pos for pos, url in enumerate(fingerprints)}
+    clusters = [sorted(urls, key=order.__getitem__) for urls in groups.values() if len(urls) > 1]
+    clusters.sort(key=lambda urls: order[urls[0]])
+    return clusters
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Page template clustering for the SEO audit.
+
+Most pages of a site come from a handful of templates (one layout for every
+project, course or product). Pages are grouped by path depth and file
+extension plus a DOM skeleton hash (not by directory: /a/index.html and
+/b/index.html are often the same template), and template-level checks (html
+lang, doctype/viewport, Open Graph, hreflang, forms) only need to run on one
+representative page per group.
+
+The skeleton is collected during the same single pass that extracts the page
+facts: the <head> tags that templates emit (meta name/property, link rel,
+script type) and every element with a class or id. Digits are removed from
+classes and ids, and the tokens are deduplicated, so body classes like
+"postid-123" and the number of products in a listing do not split a template
+into several clusters.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+# URLs de ejemplo por plantilla en el informe
+SAMPLE_URLS = 5
+
+_DIGITS_RE = re.compile(r"\d+")
+# en estas etiquetas cuenta el atributo que las identifica, no su clase
+_HEAD_KEY_ATTRS = {"meta": ("name", "property"), "link": ("rel",), "script": ("type",)}
+
+
+class SkeletonHasher:
+    """Acumula las etiquetas de la página (en el mismo recorrido que PageFactsBuilder) y calcula el hash de su esqueleto."""
+
+    def __init__(self) -> None:
+        self._tokens: Set[str] = set()
+
+    def add_tag(self, tag: str, attrs: Mapping[str, str]) -> None:
+        key_attrs = _HEAD_KEY_ATTRS.get(tag)
+        if key_attrs:
+            key = next((attrs[a] for a in key_attrs if attrs.get(a)), "")
+            self._tokens.add(f"{tag}[{key.lower()}]")
+            return
+        classes = attrs.get("class")
+        element_id = attrs.get("id")
+        if classes or element_id:
+            classes = " ".join(sorted(set(_DIGITS_RE.sub("", classes or "").split())))
+            self._tokens.add(f"{tag}.{classes}#{_DIGITS_RE.sub('', element_id or '')}")
+
+    def digest(self) -> str:
+        data = "\n".join(sorted(self._tokens)).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def path_signature(url: str) -> Tuple[int, str, str]:
+    """(profundidad, primer segmento, extensión del último): lo que comparten las URLs de una plantilla."""
+    segments = [s for s in urlparse(url).path.split("/") if s]
+    if not segments:
+        return (0, "", "")
+    # en la raíz el único segmento es el propio fichero: /a.html y /b.html comparten firma
+    first = segments[0].lower() if len(segments) > 1 else ""
+    return (len(segments), first, os.path.splitext(segments[-1])[1].lower())
+
+
+@dataclass
+class TemplateCluster:
+    id: str
+    # ruta del representante con "*" en los segmentos que varían entre páginas
+    pattern: str
+    representative: str
+    pages: int = 0
+    # códigos de las incidencias de plantilla halladas en el representante
+    template_issues: List[str] = field(default_factory=list)
+    sample_urls: List[str] = field(default_factory=list)
+
+
+class TemplateClusters:
+    """
+    Plantillas del sitio. assign() se llama al auditar (en paralelo) y elige el
+    representante: la primera página de cada plantilla. add_page() se llama al
+    recoger los resultados, en orden, así que el recuento coincide con las
+    páginas del informe (también al reanudar un checkpoint).
+    """
+
+    def __init__(self) -> None:
+        self._clusters: Dict[str, TemplateCluster] = {}
+        self._lock = threading.Lock()
+
+    def assign(self, url: str, skeleton_hash: str) -> Tuple[str, str]:
+        """(id de la plantilla de la página, URL de su representante)."""
+        # sin el primer segmento: páginas hermanas (/a/index.html, /b/index.html) comparten plantilla
+        depth, _first, ext = path_signature(url)
+        key = f"{depth}|{ext}|{skeleton_hash}"
+        cluster_id = hashlib.blake2b(key.encode("utf-8"), digest_size=6).hexdigest()
+        with self._lock:
+            cluster = self._clusters.get(cluster_id)
+            if cluster is None:
+                cluster = self._clusters[cluster_id] = TemplateCluster(cluster_id, _path(url), url)
+            return cluster_id, cluster.representative
+
+    def record_issues(self, cluster_id: str, codes: List[str]) -> None:
+        """Incidencias de plantilla halladas en el representante."""
+        with self._lock:
+            self._clusters[cluster_id].template_issues = sorted(set(codes))
+
+    def add_page(self, cluster_id: str, url: str) -> None:
+        with self._lock:
+            cluster = self._clusters.get(cluster_id)
+            if cluster is None:
+                # página arrastrada de un informe anterior (modo incremental)
+                return
+            cluster.pattern = _merge_pattern(cluster.pattern, _path(url))
+            cluster.pages += 1
+            if len(cluster.sample_urls) < SAMPLE_URLS:
+                cluster.sample_urls.append(url)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Plantillas de más a menos páginas."""
+        with self._lock:
+            clusters = sorted((c for c in self._clusters.values() if c.pages), key=lambda c: (-c.pages, c.pattern))
+            return [asdict(c) for c in clusters]
+
+    # ---------------------------
+    # Checkpoints
+    # ---------------------------
+    def to_list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [asdict(c) for c in self._clusters.values()]
+
+    def restore(self, clusters: Optional[List[Dict[str, Any]]]) -> None:
+        with self._lock:
+            self._clusters = {c["id"]: TemplateCluster(**c) for c in clusters or []}
+
+
+def _path(url: str) -> str:
+    return urlparse(url).path.rstrip("/") or "/"
+
+
+def _merge_pattern(pattern: str, path: str) -> str:
+    """'/p/Projects/a/index.php' + '/p/Projects/b/index.php' -> '/p/Projects/*/index.php'."""
+    old = pattern.split("/")
+    new = path.split("/")
+    if len(old) != len(new):
+        return pattern
+    return "/".join(a if a == b else "*" for a, b in zip(old, new))
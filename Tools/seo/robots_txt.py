@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+robots.txt parser and compiled matcher for the SEO crawlers (RFC 9309 semantics).
+
+- Groups: consecutive User-agent lines share the rules that follow; groups for
+  the same agent are merged. A crawler uses the group whose agent is the longest
+  prefix of its product token, falling back to "*".
+- Rules: the longest matching Allow/Disallow pattern wins; on a tie Allow wins.
+  Patterns support "*" (any sequence) and a trailing "$" (end of URL). Plain
+  prefixes are matched with str.startswith; wildcard patterns compile to a regex.
+- Crawl-delay (seconds) and Sitemap lines are kept as well.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+ROBOTS_PATH = "/robots.txt"
+
+
+def product_token(user_agent: str) -> str:
+    """'Pablo-Cirre-SEO-Audit/1.0 (+https://...)' -> 'pablo-cirre-seo-audit'."""
+    token = user_agent.strip().split("/", 1)[0].split(" ", 1)[0]
+    return token.lower()
+
+
+def url_path(url: str) -> str:
+    """Ruta y query de una URL (o ruta ya relativa), que es lo que comparan las reglas."""
+    parsed = urlparse(url)
+    path = parsed.path or "/"
+    if parsed.query:
+        path += "?" + parsed.query
+    return path
+
+
+@dataclass
+class _Rule:
+    allow: bool
+    pattern: str
+    regex: Optional[Pattern] = None     # None: prefijo literal
+
+    def matches(self, path: str) -> bool:
+        if self.regex is None:
+            return path.startswith(self.pattern)
+        return self.regex.match(path) is not None
+
+
+def _compile_rule(allow: bool, pattern: str) -> _Rule:
+    if "*" not in pattern and not pattern.endswith("$"):
+        return _Rule(allow, pattern)
+    anchored = pattern.endswith("$")
+    body = pattern[:-1] if anchored else pattern
+    regex = ".*".join(re.escape(part) for part in body.split("*"))
+    return _Rule(allow, pattern, re.compile(regex + ("$" if anchored else ""), re.S))
+
+
+@dataclass
+class RobotsGroup:
+    rules: List[_Rule] = field(default_factory=list)
+    crawl_delay: Optional[float] = None
+
+    def finalize(self) -> None:
+        # más largo primero y, a igual longitud, Allow antes: la primera coincidencia decide
+        self.rules.sort(key=lambda rule: (-len(rule.pattern), not rule.allow))
+
+    def is_allowed(self, path: str) -> bool:
+        for rule in self.rules:
+            if rule.matches(path):
+                return rule.allow
+        return True
+
+
+class RobotsTxt:
+    def __init__(self, groups: Dict[str, RobotsGroup], sitemaps: List[str]):
+        self.groups = groups
+        self.sitemaps = sitemaps
+        self._group_cache: Dict[str, Optional[RobotsGroup]] = {}
+
+    @classmethod
+    def parse(cls, text: str) -> "RobotsTxt":
+        groups: Dict[str, RobotsGroup] = {}
+        sitemaps: List[str] = []
+        current: List[RobotsGroup] = []
+        in_rules = False
+
+        for raw_line in text.splitlines():
+            line = raw_line.split("#", 1)[0].strip()
+            if ":" not in line:
+                continue
+            key, value = line.split(":", 1)
+            key = key.strip().lower()
+            value = value.strip()
+
+            if key == "user-agent":
+                if in_rules:
+                    current = []
+                    in_rules = False
+                agent = value.lower()
+                current.append(groups.setdefault(agent, RobotsGroup()))
+            elif key in ("allow", "disallow"):
+                in_rules = True
+                # "Disallow:" vacío no restringe nada
+                if value:
+                    for group in current:
+                        group.rules.append(_compile_rule(key == "allow", value))
+            elif key == "crawl-delay":
+                in_rules = True
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for group in current:
+                    group.crawl_delay = delay
+            elif key == "sitemap" and value:
+                sitemaps.append(value)
+
+        for group in groups.values():
+            group.finalize()
+        return cls(groups, sitemaps)
+
+    @classmethod
+    def allow_all(cls) -> "RobotsTxt":
+        return cls({}, [])
+
+    def group_for(self, user_agent: str) -> Optional[RobotsGroup]:
+        """Grupo aplicable: el agente más largo que sea prefijo del product token; si no, '*'."""
+        token = product_token(user_agent) if user_agent != "*" else "*"
+        if token in self._group_cache:
+            return self._group_cache[token]
+        best: Optional[Tuple[int, RobotsGroup]] = None
+        for agent, group in self.groups.items():
+            if agent != "*" and token.startswith(agent) and (best is None or len(agent) > best[0]):
+                best = (len(agent), group)
+        group = best[1] if best else self.groups.get("*")
+        self._group_cache[token] = group
+        return group
+
+    def is_allowed(self, url: str, user_agent: str = "*") -> bool:
+        path = url_path(url)
+        if path == ROBOTS_PATH:
+            return True
+        group = self.group_for(user_agent)
+        return group is None or group.is_allowed(path)
+
+    def crawl_delay(self, user_agent: str = "*") -> Optional[float]:
+        group = self.group_for(user_agent)
+        return group.crawl_delay if group else None
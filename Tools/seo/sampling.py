@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Stratified random sampling of a site's URLs and issue-prevalence estimates.
+
+The population (every sitemap URL, or the crawl frontier) is streamed once.
+URLs are split into strata by path signature: directory and the kind of URL
+(depth and file extension), which is what distinguishes the templates of a site
+before any page is downloaded. Each stratum keeps a bounded random reservoir
+(the URLs with the smallest random keys), so memory depends on the sample
+size, not on the site. The sample is allocated proportionally to stratum sizes
+(largest remainder, at least one URL per stratum when it fits).
+
+Prevalence of each issue is estimated with the stratified estimator (stratum
+proportions weighted by stratum size, with finite-population correction). The
+confidence interval is a Wilson interval on the effective sample size, which
+stays sensible for issues seen in none or all of the sampled pages.
+"""
+
+import heapq
+import math
+import random
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from page_templates import path_signature
+
+DEFAULT_CONFIDENCE = 0.95
+# valor z de cada nivel de confianza admitido
+Z_SCORES = {0.90: 1.6449, 0.95: 1.9600, 0.99: 2.5758}
+
+
+def stratum_of(url: str) -> str:
+    """'/blog/2024/post.html' -> '/blog/*/*.html' (directorio, profundidad y extensión); '/about' -> '/*'."""
+    depth, first, ext = path_signature(url)
+    if depth == 0:
+        return "/"
+    if depth == 1:
+        # páginas sueltas en la raíz: un único estrato
+        return "/*" + ext
+    return "/" + "/".join([first] + ["*"] * (depth - 1)) + ext
+
+
+def allocate(populations: Dict[str, int], size: int) -> Dict[str, int]:
+    """Reparto proporcional de `size` URLs entre estratos (restos mayores, mínimo 1 si cabe)."""
+    if size >= sum(populations.values()):
+        return dict(populations)
+    alloc = {s: 0 for s in populations}
+    if size >= len(populations):
+        alloc = {s: 1 for s in populations}
+    remaining = size - sum(alloc.values())
+    while remaining > 0:
+        room = [s for s in populations if populations[s] > alloc[s]]
+        total = sum(populations[s] for s in room)
+        shares = {s: remaining * populations[s] / total for s in room}
+        given = 0
+        for s in room:
+            add = min(int(shares[s]), populations[s] - alloc[s])
+            alloc[s] += add
+            given += add
+        if given == 0:
+            # menos URLs que estratos con hueco: para los de mayor resto
+            for s in sorted(room, key=lambda s: (-(shares[s] % 1), s))[:remaining]:
+                alloc[s] += 1
+                given += 1
+        remaining -= given
+    return alloc
+
+
+class StratifiedSampler:
+    """Muestra aleatoria estratificada de un flujo de URLs, en una sola pasada."""
+
+    def __init__(self, size: int, seed: Optional[int] = None):
+        self.size = max(1, size)
+        self._rng = random.Random(seed)
+        self.populations: Dict[str, int] = {}
+        # por estrato, montículo de (-clave, orden, url, payload) con las `size` claves menores
+        self._reservoirs: Dict[str, List[Tuple[float, int, str, Any]]] = {}
+        self._added = 0
+
+    def add(self, url: str, payload: Any = None) -> None:
+        stratum = stratum_of(url)
+        self.populations[stratum] = self.populations.get(stratum, 0) + 1
+        reservoir = self._reservoirs.setdefault(stratum, [])
+        key = self._rng.random()
+        self._added += 1
+        item = (-key, self._added, url, payload)
+        if len(reservoir) < self.size:
+            heapq.heappush(reservoir, item)
+        elif key < -reservoir[0][0]:
+            heapq.heapreplace(reservoir, item)
+
+    def sample(self) -> List[Tuple[str, Any]]:
+        """(url, payload) de la muestra, estrato a estrato (de mayor a menor) en orden aleatorio."""
+        chosen: List[Tuple[str, Any]] = []
+        alloc = allocate(self.populations, self.size)
+        for stratum in sorted(self.populations, key=lambda s: (-self.populations[s], s)):
+            items = sorted(self._reservoirs[stratum], reverse=True)[: alloc[stratum]]
+            chosen.extend((url, payload) for _key, _order, url, payload in items)
+        return chosen
+
+
+def _wilson(p: float, n: float, z: float) -> Tuple[float, float]:
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def estimate_prevalence(
+    pages: Iterable[Tuple[str, Set[str]]],
+    populations: Dict[str, int],
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Dict[str, Any]:
+    """
+    Estimación de la proporción de páginas del sitio con cada incidencia.
+
+    `pages` son (url, códigos de incidencia) de las páginas de la muestra y
+    `populations` el tamaño de cada estrato. Los estratos sin páginas auditadas no
+    entran en la estimación (se indica la población cubierta).
+    """
+    sampled: Dict[str, int] = {}
+    hits: Dict[str, Dict[str, int]] = {}
+    for url, codes in pages:
+        stratum = stratum_of(url)
+        sampled[stratum] = sampled.get(stratum, 0) + 1
+        for code in codes:
+            per_stratum = hits.setdefault(code, {})
+            per_stratum[stratum] = per_stratum.get(stratum, 0) + 1
+
+    covered = sum(populations.get(s, n) for s, n in sampled.items())
+    sample_size = sum(sampled.values())
+    census = all(n >= populations.get(s, n) for s, n in sampled.items())
+    z = Z_SCORES[confidence]
+
+    estimates: Dict[str, Dict[str, Any]] = {}
+    for code, per_stratum in hits.items():
+        estimate = variance = 0.0
+        for stratum, n in sampled.items():
+            size = populations.get(stratum, n)
+            weight = size / covered
+            p = per_stratum.get(stratum, 0) / n
+            estimate += weight * p
+            fpc = 1 - n / size
+            variance += weight * weight * fpc * p * (1 - p) / max(n - 1, 1)
+        if census:
+            low = high = estimate
+        else:
+            # tamaño de muestra efectivo del diseño estratificado
+            effective = estimate * (1 - estimate) / variance if variance > 0 else sample_size
+            low, high = _wilson(estimate, max(effective, 1.0), z)
+            low, high = min(low, estimate), max(high, estimate)
+        estimates[code] = {
+            "sampled_pages": sum(per_stratum.values()),
+            "prevalence": round(estimate, 4),
+            "ci_low": round(low, 4),
+            "ci_high": round(high, 4),
+            "estimated_pages": round(estimate * covered),
+            "estimated_pages_low": round(low * covered),
+            "estimated_pages_high": round(high * covered),
+        }
+    return {
+        "confidence": confidence,
+        "population_covered": covered,
+        "sample_size": sample_size,
+        "issues": estimates,
+    }
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Streaming sitemap reader for the SEO and PageSpeed tools.
+
+Sitemaps are parsed with ElementTree.iterparse straight from the HTTP response,
+so a 50k-URL sitemap is read in constant memory: each <url> is yielded as a
+SitemapEntry (loc, lastmod, priority) and then discarded. Gzip is decompressed
+on the fly, both for Content-Encoding: gzip and for .xml.gz files (detected by
+their magic bytes, not only by the extension). Child sitemaps of an index are
+fetched by a thread pool and their entries are handed over through a bounded
+queue, so dozens of children load in parallel without buffering them whole.
+With a HostLimiter every fetch goes through its per-host concurrency, backoff
+and Retry-After handling, like the crawler's page requests.
+"""
+
+import gzip
+import io
+import queue
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+import requests
+
+from http_pacing import HostLimiter
+
+DEFAULT_WORKERS = 8
+# las entradas viajan de los hilos de descarga al consumidor en lotes (menos contención)
+BATCH_SIZE = 500
+# lotes en tránsito como máximo: la memoria no depende del tamaño de los sitemaps
+QUEUE_BATCHES = 8
+GZIP_MAGIC = b"\x1f\x8b"
+
+_DONE = object()
+
+
+@dataclass
+class SitemapEntry:
+    loc: str
+    lastmod: Optional[str] = None
+    priority: Optional[float] = None
+
+
+def _local_name(tag: str) -> str:
+    """'{http://www.sitemaps.org/schemas/sitemap/0.9}url' -> 'url' (con o sin namespace)."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_texts(elem: ET.Element) -> dict:
+    return {_local_name(child.tag): (child.text or "").strip() for child in elem}
+
+
+def _parse_priority(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def iter_sitemap_xml(stream) -> Iterator[Tuple[str, SitemapEntry]]:
+    """
+    Recorre un sitemap (urlset o sitemapindex) desde un fichero binario.
+
+    Produce ("url", entry) o ("sitemap", entry) según el tipo de documento; cada
+    elemento se libera tras procesarlo. Lanza ET.ParseError si el XML es inválido.
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+        name = _local_name(elem.tag)
+        if name not in ("url", "sitemap"):
+            continue
+        fields = _child_texts(elem)
+        loc = fields.get("loc")
+        if loc:
+            yield name, SitemapEntry(loc, fields.get("lastmod") or None, _parse_priority(fields.get("priority")))
+        # libera lo ya procesado: la memoria no crece con el tamaño del sitemap
+        root.clear()
+
+
+class SitemapReader:
+    """Lee sitemaps e índices por HTTP en streaming, con los hijos de un índice en paralelo."""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        timeout: float,
+        workers: int = DEFAULT_WORKERS,
+        limiter: Optional[HostLimiter] = None,
+    ):
+        self.session = session
+        self.timeout = timeout
+        self.workers = max(1, workers)
+        self.limiter = limiter
+
+    def _open(self, url: str):
+        """Respuesta en streaming como fichero binario ya descomprimido, o None si no es 200."""
+        def send() -> requests.Response:
+            return self.session.get(url, timeout=self.timeout, stream=True)
+
+        resp = self.limiter.request(send, url) if self.limiter else send()
+        if resp.status_code != 200:
+            resp.close()
+            return None
+        # Content-Encoding: gzip lo deshace urllib3; un .xml.gz servido tal cual, gzip
+        resp.raw.decode_content = True
+        # urllib3 se da por cerrado al agotar el cuerpo y BufferedReader fallaría en la última lectura
+        resp.raw.auto_close = False
+        stream = io.BufferedReader(resp.raw)
+        if stream.peek(2)[:2] == GZIP_MAGIC:
+            return gzip.GzipFile(fileobj=stream)
+        return stream
+
+    def iter_entries(self, candidates: Iterable[str]) -> Iterator[SitemapEntry]:
+        """
+        URLs del primer candidato que sea un sitemap válido, a medida que se leen.
+
+        Si es un índice, sus sitemaps hijos se descargan en paralelo y sus URLs se
+        entregan en el orden en que llegan. Un hijo caído o mal formado se omite.
+        """
+        for url in candidates:
+            try:
+                stream = self._open(url)
+            except requests.RequestException:
+                continue
+            if stream is None:
+                continue
+            children = []
+            found = False
+            try:
+                with closing(stream):
+                    for kind, entry in iter_sitemap_xml(stream):
+                        found = True
+                        if kind == "url":
+                            yield entry
+                        else:
+                            children.append(entry.loc)
+            except (ET.ParseError, OSError, requests.RequestException):
+                if not found:
+                    # no era un sitemap: probar el siguiente candidato
+                    continue
+            if children:
+                yield from self._iter_children(children, seen={url})
+            return
+
+    def _iter_children(self, children: Iterable[str], seen: Set[str]) -> Iterator[SitemapEntry]:
+        batches: "queue.Queue" = queue.Queue(maxsize=QUEUE_BATCHES)
+        stop = threading.Event()
+        lock = threading.Lock()
+        pending = [0]
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+
+        def put(item) -> bool:
+            # espera a que el consumidor avance, salvo que haya abandonado
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def submit(url: str) -> None:
+            with lock:
+                if url in seen:
+                    return
+                seen.add(url)
+                pending[0] += 1
+            pool.submit(read_child, url)
+
+        def read_child(url: str) -> None:
+            batch: List[SitemapEntry] = []
+            try:
+                stream = self._open(url)
+                if stream is not None:
+                    with closing(stream):
+                        for kind, entry in iter_sitemap_xml(stream):
+                            if kind == "sitemap":
+                                # índice anidado: sus hijos se leen igual
+                                submit(entry.loc)
+                                continue
+                            batch.append(entry)
+                            if len(batch) >= BATCH_SIZE:
+                                if not put(batch):
+                                    return
+                                batch = []
+            except (ET.ParseError, OSError, requests.RequestException):
+                pass
+            finally:
+                # lo leído hasta un error también vale
+                if batch:
+                    put(batch)
+                put(_DONE)
+
+        try:
+            for child in children:
+                submit(child)
+            while True:
+                with lock:
+                    if pending[0] == 0:
+                        break
+                item = batches.get()
+                if item is _DONE:
+                    with lock:
+                        pending[0] -= 1
+                    continue
+                yield from item
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,6 @@
+"""Shared pytest setup: the SEO tools import their sibling modules directly."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
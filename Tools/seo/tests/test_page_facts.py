@@ -0,0 +1,51 @@
+"""
+Equivalence tests for the single-pass extractor (PageFactsBuilder + html_backend).
+
+fixtures/extractor_bs4_expected.json holds the page metrics that the previous
+implementation (BeautifulSoup walks over html.parser, before the single-pass
+extractor) produced for each page in fixtures/extractor/. With the html.parser
+backend the new extractor must give the same metrics on that malformed HTML.
+"""
+
+import json
+import os
+
+import pytest
+
+import audit
+import html_backend
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = os.path.join(FIXTURES, "extractor")
+BASE_URL = "https://example.test"
+
+with open(os.path.join(FIXTURES, "extractor_bs4_expected.json"), encoding="utf-8") as f:
+    EXPECTED = json.load(f)
+
+# diferencias intencionadas con BeautifulSoup (ver PageFactsBuilder): el texto de las
+# secciones CDATA ya no cuenta
+KNOWN_DIFFERENCES = {
+    ("cdata.html", "word_count"): 17,
+}
+
+
+def _audit(page: str, parser: str = html_backend.HTML_PARSER) -> dict:
+    auditor = audit.SEOAuditor(BASE_URL, local_root=PAGES, parser=parser, cache_dir=None, link_cache_path=None)
+    return auditor.audit_url(f"{BASE_URL}/{page}").metrics
+
+
+@pytest.mark.parametrize("page", sorted(EXPECTED))
+def test_metrics_match_beautifulsoup(page):
+    metrics = _audit(page)
+    for key, expected in EXPECTED[page].items():
+        expected = KNOWN_DIFFERENCES.get((page, key), expected)
+        assert metrics.get(key) == expected, key
+
+
+@pytest.mark.parametrize("parser", html_backend.available_backends())
+@pytest.mark.parametrize("page", ["comments.html", "script_heading.html"])
+def test_backends_agree_on_comments_and_scripts(page, parser):
+    """Comentarios y <script>/<style> dentro de encabezados no dependen del backend."""
+    metrics = _audit(page, parser)
+    for key, expected in EXPECTED[page].items():
+        assert metrics.get(key) == expected, key
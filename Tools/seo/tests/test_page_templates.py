@@ -0,0 +1,93 @@
+"""Tests for page_templates: skeleton hashing and template clustering."""
+
+import audit
+from page_templates import SkeletonHasher, TemplateClusters
+
+LAYOUT = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="/style.css">
+</head>
+<body class="page postid-{n}">
+<header class="site-header"><nav id="menu"><a href="/">Inicio</a></nav></header>
+<main class="project">
+<h1 class="project-title">{title}</h1>
+<p class="intro">Proyecto número {n} con su propio texto.</p>
+<ul class="gallery">{items}</ul>
+</main>
+</body>
+</html>
+"""
+
+
+def _page(title: str, n: int) -> str:
+    items = "".join(f'<li class="item item-{i}"><img src="/{i}.png" alt="foto {i}"></li>' for i in range(n))
+    return LAYOUT.format(title=title, n=n, items=items)
+
+
+def _skeleton(html: str) -> str:
+    return audit.extract_page_facts(html, groups=(audit.FACTS_SKELETON,)).skeleton_hash
+
+
+def test_skeleton_ignores_text_digits_and_repetition():
+    assert _skeleton(_page("Alpha", 2)) == _skeleton(_page("Beta", 7))
+    other = _page("Alpha", 2).replace('class="gallery"', 'class="carousel"')
+    assert _skeleton(other) != _skeleton(_page("Alpha", 2))
+
+
+def test_skeleton_hasher_head_tags_by_key_attribute():
+    a, b = SkeletonHasher(), SkeletonHasher()
+    a.add_tag("meta", {"name": "Description", "content": "uno"})
+    b.add_tag("meta", {"name": "description", "content": "dos", "class": "x"})
+    assert a.digest() == b.digest()
+
+
+def test_sibling_pages_share_template():
+    clusters = TemplateClusters()
+    skeleton = _skeleton(_page("Alpha", 2))
+    urls = [
+        "https://example.com/p/alpha/index.html",
+        "https://example.com/p/beta/index.html",
+        "https://example.com/q/gamma/index.html",
+    ]
+    assigned = [clusters.assign(url, skeleton) for url in urls]
+    assert len({cluster_id for cluster_id, _ in assigned}) == 1
+    # el representante es la primera página
+    assert all(representative == urls[0] for _, representative in assigned)
+
+    for (cluster_id, _), url in zip(assigned, urls):
+        clusters.add_page(cluster_id, url)
+    [summary] = clusters.summary()
+    assert summary["pages"] == 3
+    assert summary["pattern"] == "/*/*/index.html"
+
+
+def test_depth_extension_and_skeleton_split_templates():
+    clusters = TemplateClusters()
+    skeleton = _skeleton(_page("Alpha", 2))
+    other_skeleton = _skeleton(_page("Alpha", 2).replace('class="project"', 'class="listing"'))
+    base, _ = clusters.assign("https://example.com/p/a/index.html", skeleton)
+    assert clusters.assign("https://example.com/p/index.html", skeleton)[0] != base
+    assert clusters.assign("https://example.com/p/b/index.php", skeleton)[0] != base
+    assert clusters.assign("https://example.com/p/c/index.html", other_skeleton)[0] != base
+
+
+def test_offline_audit_clusters_sibling_directories(tmp_path):
+    for n, name in enumerate(["alpha", "beta", "gamma", "delta"], start=1):
+        folder = tmp_path / "proyectos" / name
+        folder.mkdir(parents=True)
+        (folder / "index.html").write_text(_page(name.title(), n), encoding="utf-8")
+    index = "".join(f'<a href="/proyectos/{name}/index.html">{name}</a>' for name in ["alpha", "beta", "gamma", "delta"])
+    (tmp_path / "index.html").write_text(f"<html><body>{index}</body></html>", encoding="utf-8")
+
+    auditor = audit.SEOAuditor(
+        "https://example.com", local_root=str(tmp_path), templates=True, cache_dir=None, link_cache_path=None
+    )
+    report = auditor.run()
+    projects = [t for t in report["templates"] if t["pattern"].startswith("/proyectos/")]
+    assert len(projects) == 1
+    assert projects[0]["pages"] == 4
+    assert projects[0]["pattern"] == "/proyectos/*"
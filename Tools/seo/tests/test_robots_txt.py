@@ -0,0 +1,188 @@
+"""Tests for robots_txt.RobotsTxt (RFC 9309 matching)."""
+
+import pytest
+
+from robots_txt import RobotsTxt, product_token, url_path
+
+UA = "Pablo-Cirre-SEO-Audit/1.0 (+https://pablocirre.es)"
+
+
+def _robots(text: str) -> RobotsTxt:
+    return RobotsTxt.parse(text)
+
+
+def test_product_token_and_url_path():
+    assert product_token(UA) == "pablo-cirre-seo-audit"
+    assert product_token("Googlebot") == "googlebot"
+    assert url_path("https://example.com") == "/"
+    assert url_path("https://example.com/a/b?x=1&y=2#frag") == "/a/b?x=1&y=2"
+
+
+@pytest.mark.parametrize(
+    "path, allowed",
+    [
+        ("/private", False),
+        ("/private/page.html", False),
+        ("/privateer", False),
+        ("/public/private", True),
+        ("/", True),
+    ],
+)
+def test_plain_prefix(path, allowed):
+    robots = _robots("User-agent: *\nDisallow: /private\n")
+    assert robots.is_allowed(f"https://example.com{path}") is allowed
+
+
+@pytest.mark.parametrize(
+    "path, allowed",
+    [
+        ("/search?q=seo", False),
+        ("/es/search/results", False),
+        ("/research", True),
+        ("/file.php", False),
+        ("/dir/file.php", False),
+        ("/file.php?x=1", True),
+        ("/file.php5", True),
+        ("/a.pdf", False),
+        ("/a.pdf.html", True),
+        # "*" también casa con la secuencia vacía
+        ("/tmp", False),
+    ],
+)
+def test_wildcards_and_end_anchor(path, allowed):
+    robots = _robots(
+        "User-agent: *\n"
+        "Disallow: /*search\n"
+        "Allow: /research\n"
+        "Disallow: /*.php$\n"
+        "Disallow: /*.pdf$\n"
+        "Disallow: /tmp*\n"
+    )
+    assert robots.is_allowed(f"https://example.com{path}") is allowed
+
+
+def test_regex_metacharacters_are_literal():
+    robots = _robots("User-agent: *\nDisallow: /a.b?c=(1)*\n")
+    assert not robots.is_allowed("https://example.com/a.b?c=(1)&d=2")
+    assert robots.is_allowed("https://example.com/aXb?c=(1)")
+
+
+@pytest.mark.parametrize(
+    "path, allowed",
+    [
+        ("/shop/", False),
+        ("/shop/products/", True),
+        ("/shop/products/cart", False),
+        ("/shop/products/cart-help", True),
+    ],
+)
+def test_longest_match_wins(path, allowed):
+    robots = _robots(
+        "User-agent: *\n"
+        "Disallow: /shop/\n"
+        "Allow: /shop/products/\n"
+        "Disallow: /shop/products/cart\n"
+        "Allow: /shop/products/cart-help\n"
+    )
+    assert robots.is_allowed(f"https://example.com{path}") is allowed
+
+
+def test_allow_wins_on_equal_length():
+    robots = _robots("User-agent: *\nDisallow: /page\nAllow: /page\n")
+    assert robots.is_allowed("https://example.com/page")
+    # igual longitud con comodín: también gana Allow
+    robots = _robots("User-agent: *\nAllow: /*.html\nDisallow: /a/b.c.\n")
+    assert robots.is_allowed("https://example.com/a/b.c.html")
+
+
+def test_empty_disallow_and_robots_txt_always_allowed():
+    robots = _robots("User-agent: *\nDisallow:\n")
+    assert robots.is_allowed("https://example.com/anything")
+    robots = _robots("User-agent: *\nDisallow: /\n")
+    assert not robots.is_allowed("https://example.com/")
+    assert robots.is_allowed("https://example.com/robots.txt")
+
+
+def test_user_agent_group_selection():
+    robots = _robots(
+        "User-agent: *\n"
+        "Disallow: /\n"
+        "\n"
+        "User-agent: pablo-cirre\n"
+        "Disallow: /short\n"
+        "\n"
+        "User-agent: Pablo-Cirre-SEO\n"
+        "Disallow: /long\n"
+        "\n"
+        "User-agent: Googlebot\n"
+        "Allow: /\n"
+    )
+    # el agente más largo que es prefijo del product token
+    assert robots.is_allowed("https://example.com/short", UA)
+    assert not robots.is_allowed("https://example.com/long", UA)
+    # sin grupo propio: el de "*"
+    assert not robots.is_allowed("https://example.com/page", "OtherBot/2.0")
+    assert robots.is_allowed("https://example.com/page", "googlebot/2.1")
+    assert not robots.is_allowed("https://example.com/page")
+
+
+def test_consecutive_agents_share_rules_and_groups_merge():
+    robots = _robots(
+        "User-agent: a-bot\n"
+        "User-agent: b-bot\n"
+        "Disallow: /shared\n"
+        "\n"
+        "User-agent: c-bot\n"
+        "Disallow: /c\n"
+        "\n"
+        "User-agent: a-bot\n"
+        "Disallow: /more\n"
+    )
+    for agent in ("a-bot", "b-bot"):
+        assert not robots.is_allowed("https://example.com/shared", agent)
+        assert robots.is_allowed("https://example.com/c", agent)
+    assert not robots.is_allowed("https://example.com/more", "a-bot")
+    assert robots.is_allowed("https://example.com/more", "b-bot")
+    assert robots.is_allowed("https://example.com/shared", "c-bot")
+
+
+def test_no_matching_group_allows_everything():
+    robots = _robots("User-agent: googlebot\nDisallow: /\n")
+    assert robots.is_allowed("https://example.com/page", UA)
+    assert robots.crawl_delay(UA) is None
+    assert RobotsTxt.allow_all().is_allowed("https://example.com/x", UA)
+
+
+def test_crawl_delay():
+    robots = _robots(
+        "# comentario\n"
+        "Crawl-delay: 99\n"
+        "User-agent: *\n"
+        "Crawl-delay: 2.5  # segundos\n"
+        "Disallow: /private\n"
+        "\n"
+        "User-agent: pablo-cirre-seo-audit\n"
+        "Crawl-delay: 10\n"
+        "\n"
+        "User-agent: slow-bot\n"
+        "Crawl-delay: soon\n"
+    )
+    assert robots.crawl_delay() == 2.5
+    assert robots.crawl_delay(UA) == 10.0
+    # valor no numérico: se ignora
+    assert robots.crawl_delay("slow-bot") is None
+    # un grupo con solo Crawl-delay no prohíbe nada
+    assert robots.is_allowed("https://example.com/private", UA)
+
+
+def test_comments_case_and_sitemaps():
+    robots = _robots(
+        "USER-AGENT: *   # todos\n"
+        "DISALLOW: /Admin  # mayúsculas en la ruta importan\n"
+        "Sitemap: https://example.com/sitemap.xml\n"
+        "sitemap: https://example.com/news.xml\n"
+        "no es una directiva\n"
+    )
+    assert not robots.is_allowed("https://example.com/Admin/")
+    assert robots.is_allowed("https://example.com/admin/")
+    assert robots.sitemaps == ["https://example.com/sitemap.xml", "https://example.com/news.xml"]
@@ -0,0 +1,102 @@
+"""Tests for url_seen.URLSeenSet."""
+
+import url_seen
+from url_seen import ENQUEUED, SKIPPED, VISITED, URLSeenSet
+
+
+def _urls(n):
+    return [f"https://example.com/page/{i}" for i in range(n)]
+
+
+def test_enqueue_visit_skip_transitions():
+    seen = URLSeenSet()
+    url = "https://example.com/a"
+    assert seen.state(url) == 0
+    assert url not in seen
+
+    assert seen.enqueue(url)
+    assert seen.state(url) == ENQUEUED
+    # una URL se encola una sola vez
+    assert not seen.enqueue(url)
+
+    assert seen.visit(url)
+    assert seen.state(url) == VISITED
+    assert not seen.visit(url)
+    # ni visitada se vuelve a encolar
+    assert not seen.enqueue(url)
+    assert len(seen) == 1
+
+
+def test_visit_without_enqueue_counts_once():
+    seen = URLSeenSet()
+    assert seen.visit("https://example.com/direct")
+    assert seen.state("https://example.com/direct") == VISITED
+    assert len(seen) == 1
+
+
+def test_skip_only_marks_new_urls():
+    seen = URLSeenSet()
+    assert seen.skip("https://example.com/trap?page=99")
+    assert seen.state("https://example.com/trap?page=99") == SKIPPED
+    assert not seen.enqueue("https://example.com/trap?page=99")
+    assert not seen.skip("https://example.com/trap?page=99")
+
+    seen.enqueue("https://example.com/b")
+    assert not seen.skip("https://example.com/b")
+    assert seen.state("https://example.com/b") == ENQUEUED
+    assert len(seen) == 2
+
+
+def test_growth_keeps_every_key_and_state():
+    seen = URLSeenSet()
+    initial_slots = len(seen.to_bytes()) // 8
+    urls = _urls(int(initial_slots * url_seen._MAX_LOAD) * 3)
+    for i, url in enumerate(urls):
+        assert seen.enqueue(url)
+        if i % 3 == 0:
+            seen.visit(url)
+
+    assert len(seen.to_bytes()) // 8 > initial_slots
+    assert len(seen) == len(urls)
+    for i, url in enumerate(urls):
+        assert seen.state(url) == (VISITED if i % 3 == 0 else ENQUEUED)
+    assert "https://example.com/missing" not in seen
+
+
+def test_bytes_round_trip():
+    seen = URLSeenSet()
+    urls = _urls(2000)
+    for url in urls[:1000]:
+        seen.enqueue(url)
+    for url in urls[1000:1500]:
+        seen.visit(url)
+    for url in urls[1500:]:
+        seen.skip(url)
+
+    restored = URLSeenSet.from_bytes(seen.to_bytes())
+    assert len(restored) == len(seen)
+    assert restored.to_bytes() == seen.to_bytes()
+    for url in urls:
+        assert restored.state(url) == seen.state(url)
+    # el restaurado sigue creciendo y aceptando URLs nuevas
+    more = [f"https://example.com/more/{i}" for i in range(3000)]
+    for url in more:
+        assert restored.enqueue(url)
+    assert all(restored.state(url) == ENQUEUED for url in more)
+    assert all(restored.state(url) == seen.state(url) for url in urls)
+
+
+def test_requeue_in_flight_urls():
+    seen = URLSeenSet()
+    done, in_flight = "https://example.com/done", ["https://example.com/x", "https://example.com/y"]
+    for url in [done] + in_flight:
+        seen.enqueue(url)
+        seen.visit(url)
+
+    seen.requeue(in_flight)
+    assert seen.state(done) == VISITED
+    assert all(seen.state(url) == ENQUEUED for url in in_flight)
+    assert len(seen) == 3
+    # vuelven a poder visitarse, una vez
+    assert all(seen.visit(url) for url in in_flight)
+    assert not any(seen.visit(url) for url in in_flight)
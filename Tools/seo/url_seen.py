@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compact "seen URL" set for the crawler frontier.
+
+Each URL is reduced to a stable 64-bit hash (BLAKE2b, so it survives a resume in
+another process) and stored in an open-addressing table backed by array("Q"):
+8 bytes per slot instead of a full str object per URL in a set(). The two low
+bits of every slot hold the URL state, ENQUEUED, VISITED or SKIPPED (rejected
+by the trap detector), so a URL is queued at most once and visited at most
+once. The remaining 62 bits identify the URL; for a million URLs the chance of
+any collision is around 1e-7.
+"""
+
+import hashlib
+from array import array
+from typing import Iterable
+
+ENQUEUED = 1
+VISITED = 2
+# descartada por el detector de trampas: no se vuelve a evaluar
+SKIPPED = 3
+
+_STATE_MASK = 3
+_KEY_MASK = ~_STATE_MASK & 0xFFFFFFFFFFFFFFFF
+# tabla como mucho a medio llenar: las sondas lineales siguen siendo cortas
+_MAX_LOAD = 0.5
+_MIN_SLOTS = 1024
+
+
+def url_key(url: str) -> int:
+    """Hash estable de 64 bits de la URL sin los bits de estado."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") & _KEY_MASK
+
+
+class URLSeenSet:
+    """URLs ya encoladas o visitadas, como hashes de 64 bits en un array."""
+
+    def __init__(self, slots: int = _MIN_SLOTS):
+        size = _MIN_SLOTS
+        while size < slots:
+            size <<= 1
+        self._slots = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, url: str) -> bool:
+        return self.state(url) != 0
+
+    def _index(self, key: int) -> int:
+        """Posición de `key` en la tabla, o del hueco libre donde iría."""
+        slots = self._slots
+        mask = self._mask
+        index = (key >> 2) & mask
+        while True:
+            slot = slots[index]
+            if slot == 0 or slot & _KEY_MASK == key:
+                return index
+            index = (index + 1) & mask
+
+    def _set(self, url: str, state: int, only_if_new: bool) -> bool:
+        key = url_key(url)
+        index = self._index(key)
+        current = self._slots[index]
+        if current:
+            if only_if_new or current & _STATE_MASK == state:
+                return False
+        else:
+            self._count += 1
+        self._slots[index] = key | state
+        if self._count > len(self._slots) * _MAX_LOAD:
+            self._grow()
+        return True
+
+    def state(self, url: str) -> int:
+        """ENQUEUED, VISITED, SKIPPED o 0 si la URL no se ha visto."""
+        return self._slots[self._index(url_key(url))] & _STATE_MASK
+
+    def enqueue(self, url: str) -> bool:
+        """Marca la URL como encolada; False si ya estaba encolada o visitada."""
+        return self._set(url, ENQUEUED, only_if_new=True)
+
+    def visit(self, url: str) -> bool:
+        """Marca la URL como visitada; False si ya lo estaba."""
+        return self._set(url, VISITED, only_if_new=False)
+
+    def skip(self, url: str) -> bool:
+        """Marca como descartada una URL nueva; False si ya se había visto."""
+        return self._set(url, SKIPPED, only_if_new=True)
+
+    def requeue(self, urls: Iterable[str]) -> None:
+        """Devuelve URLs visitadas al estado encolado (p. ej. las que estaban en vuelo)."""
+        for url in urls:
+            self._set(url, ENQUEUED, only_if_new=False)
+
+    def to_bytes(self) -> bytes:
+        return self._slots.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "URLSeenSet":
+        seen = cls.__new__(cls)
+        seen._slots = array("Q")
+        seen._slots.frombytes(data)
+        seen._mask = len(seen._slots) - 1
+        seen._count = sum(1 for slot in seen._slots if slot)
+        return seen
+
+    def _grow(self) -> None:
+        old = self._slots
+        self._slots = array("Q", bytes(16 * len(old)))
+        self._mask = len(self._slots) - 1
+        for slot in old:
+            if slot:
+                self._slots[self._index(slot & _KEY_MASK)] = slot